@@ -2,20 +2,41 @@ import customtkinter as ctk
 from tkinter import filedialog, messagebox
 import json
 from tkinterdnd2 import TkinterDnD
-try:
-    import pystray
-except Exception:
-    pystray = None
-from PIL import Image, ImageDraw
 import threading
 import sys
 
 
-from config import load_config, save_config, setup_theme, ICONS_DIR
+from config import load_config, setup_theme
 from ui.tab import CategoryTab
-from ui.dialogs import AddDialog, AddCategoryDialog, SettingsDialog
+from ui.dialogs import AddDialog, AddCategoryDialog, SettingsDialog, FolderImportDialog
+from ui.search_view import SearchResultsView
 from utils.theme_manager import ThemeManager
-from utils.icon_utils import get_file_icon_path
+from utils.image_cache import image_cache
+from utils.dispatch import dispatcher
+from utils.icon_worker import icon_resolver
+from utils.search_index import search_index
+from utils.config_writer import config_writer
+from utils.startup_trace import startup_trace
+from utils.system_utils import stats_sampler
+from utils.launcher import launcher
+from utils.frecency import frecency
+from utils.health import health_scanner
+from utils.icon_cache import icon_cache
+from utils.icon_atlas import icon_atlas
+
+SEARCH_DEBOUNCE_MS = 150
+SEARCH_LIMIT = 200
+STATUS_MESSAGE_MS = 6000
+# Health-Scan kurz nach dem Start, danach regelmäßig (inkrementell)
+HEALTH_SCAN_DELAY_MS = 3000
+HEALTH_SCAN_INTERVAL_MS = 5 * 60 * 1000
+# Spätestens dann nachladen, auch wenn kein Fenster abgebildet wurde
+FIRST_PAINT_TIMEOUT_MS = 3000
+ICON_GC_DELAY_MS = 60 * 1000
+ICON_ATLAS_SYNC_DELAY_MS = 10 * 1000
+STATUS_HINT = "📂 Dateien Button zum Hinzufügen | Rechtsklick für Optionen"
+# Nachbar-Tabs werden erst gebaut, wenn die App so lange nichts zu tun hatte
+TAB_PREFETCH_DELAY_MS = 1500
 
 class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
     """Hauptanwendung"""
@@ -23,6 +44,146 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
     def __init__(self):
         super().__init__()
         
+        # Ergebnisse aus Hintergrund-Threads landen über den Dispatcher im Mainloop
+        dispatcher.attach(self)
+        
+        # Starts laufen im Hintergrund, Fehler erscheinen in der Statusleiste
+        launcher.attach(self)
+        launcher.on_error = self.show_status
+        self._status_message_job = None
+        
+        # tkdnd, Tray und DnD-Registrierung erst nach dem ersten Zeichnen
+        self.dnd_enabled = False
+        
+        setup_theme()
+        
+        # Daten laden
+        with startup_trace.phase("config"):
+            self.config_data = load_config()
+        
+        # Theme initialisieren
+        current_theme = self.config_data.get("settings", {}).get("accent_color", "Blue")
+        ThemeManager.set_theme(current_theme)
+        self._apply_icon_cache_budget()
+        if self.config_data["settings"].get("icon_atlas", False):
+            # Vordekodierte Icons aus einer Datei statt einzelner PNGs
+            with startup_trace.phase("icon atlas"):
+                icon_atlas.open()
+            image_cache.atlas = icon_atlas
+
+        self.title("QuickLaunch - Schnellstart")
+        self.geometry("700x500")
+        self.minsize(600, 400)
+        self.configure(fg_color="#1a1a1a")
+        
+        # Tabs werden erst beim ersten Anzeigen gebaut
+        self.category_tabs = {}    # Name -> CategoryTab (nur gebaute)
+        self._tab_categories = {}  # Name -> Kategorie-Daten (alle Tabs)
+        self._prefetch_job = None
+        self._search_job = None
+        self._most_used_active = False
+        
+        # Suchindex im Leerlauf aufbauen, bis dahin wird linear gesucht
+        search_index.start_build(self.config_data["categories"])
+        self.after(500, self._build_search_index)
+        
+        # Always on Top für Hauptfenster
+        self.attributes("-topmost", self.config_data["settings"].get("quicklaunch_always_on_top", False))
+        
+        # Protokoll für Schließen-Button ändern
+        self.protocol("WM_DELETE_WINDOW", self._on_close_window)
+        
+        self.tray_icon = None
+        
+        with startup_trace.phase("tabs"):
+            self._create_ui()
+        
+        # Topbar initialisieren
+        with startup_trace.phase("topbar"):
+            from ui.topbar import Topbar
+            self.topbar = Topbar(self)
+        
+        # Startzeiten und Timer-Zähler auf Abruf ausgeben
+        self.bind("<Control-Shift-T>", lambda e: self._dump_diagnostics())
+        
+        # Erster Paint = erstes Fenster abgebildet und gezeichnet. after_idle
+        # liefe schon vor dem Abbilden, daher auf <Map> warten
+        self._first_paint_done = False
+        for window in (self, self.topbar):
+            window.bind("<Map>", self._on_map, add="+")
+        # Wird kein Fenster sichtbar (z.B. Start im Tray), trotzdem nachladen
+        self.after(FIRST_PAINT_TIMEOUT_MS, self._on_first_paint)
+    
+    def _on_map(self, event):
+        # <Map> der Kind-Widgets kommt über das Toplevel-Bindtag ebenfalls hier an
+        if self._first_paint_done or event.widget not in (self, self.topbar):
+            return
+        # Ausstehende Zeichenaufträge abarbeiten, erst dann ist etwas zu sehen
+        self.update_idletasks()
+        self._on_first_paint()
+    
+    def _on_first_paint(self):
+        if self._first_paint_done:
+            return
+        self._first_paint_done = True
+        startup_trace.mark("first paint")
+        # Kurz warten, damit das Fenster wirklich sichtbar ist, bevor nachgeladen wird
+        self.after(50, self._init_deferred)
+    
+    def _init_deferred(self):
+        """Nicht kritische Subsysteme: tkdnd, Drag & Drop, Tray, Systemwerte"""
+        with startup_trace.phase("tkdnd"):
+            self._load_tkdnd()
+            if self.dnd_enabled:
+                for category_tab in self.category_tabs.values():
+                    category_tab.register_dnd()
+        
+        with startup_trace.phase("tray"):
+            self._setup_tray_icon()
+        
+        with startup_trace.phase("system stats"):
+            stats_sampler.start()
+            self.topbar._update_status()
+        
+        self.after(HEALTH_SCAN_DELAY_MS, self._scan_health)
+        # Ungenutzte Icons einmal pro Sitzung aufräumen, wenn alles geladen ist
+        self.after(ICON_GC_DELAY_MS, lambda: icon_cache.collect_async(self.config_data["categories"]))
+        if image_cache.atlas is not None:
+            self.after(ICON_ATLAS_SYNC_DELAY_MS, lambda: icon_atlas.sync_async(self.config_data["categories"]))
+        
+        if startup_trace.enabled:
+            startup_trace.dump()
+    
+    def _scan_health(self):
+        """Prüft im Hintergrund, ob Ziele und Icons noch existieren"""
+        health_scanner.scan(
+            self.config_data["categories"],
+            on_changed=self._on_health_changed,
+            on_complete=lambda: self.after(HEALTH_SCAN_INTERVAL_MS, self._scan_health)
+        )
+
+    def _on_health_changed(self, paths):
+        # Abgleich baut nur Kacheln neu, deren Status sich geändert hat
+        for category_tab in self.category_tabs.values():
+            category_tab._render_tiles()
+        if self.search_view.winfo_manager():
+            self._on_search()
+
+    def _dump_diagnostics(self):
+        startup_trace.dump()
+        print(
+            f"Topbar: {self.topbar.wakeups_per_minute()} Ticks/min "
+            f"(Intervall {self.topbar._status_interval} s, gesamt {self.topbar.wakeup_count}), "
+            f"Sampler: {stats_sampler.samples} Messungen, Akku: {stats_sampler.on_battery}",
+            file=sys.stderr
+        )
+        for path, stats in launcher.stats.items():
+            print(f"Start {path}: {stats.count}x, zuletzt {stats.last_ms:.1f} ms, Ø {stats.avg_ms:.1f} ms", file=sys.stderr)
+        print(f"Überwachte Prozesse: {sorted(launcher.children)}", file=sys.stderr)
+        print(f"Health-Scans: {health_scanner.scans}, stat-Aufrufe gesamt: {health_scanner.stat_calls}", file=sys.stderr)
+    
+    def _load_tkdnd(self):
+        """Lädt die tkdnd-Erweiterung (Drag & Drop von Dateien)"""
         # Support for FreeBSD/Linux Manual TkDND Path
         import os
         tkdnd_path = os.environ.get('TKDND_LIBRARY')
@@ -54,10 +215,10 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
                             tkroot.tk.call('lappend', 'auto_path', path)
                             found = True
                             break
-                    
+                
                     if not found:
                         print("Warning: Could not find tkdnd library path. Set TKDND_LIBRARY env var.")
-                        
+                    
                     return tkroot.tk.call('package', 'require', 'tkdnd')
 
                 # Critical: We must patch the _require function on the class/module
@@ -71,42 +232,13 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
         except (RuntimeError, ImportError, Exception) as e:
             print(f"Drag & Drop not supported: {e}")
             self.dnd_enabled = False
-        
-        setup_theme()
-        
-        # Daten laden
-        self.config_data = load_config()
-        
-        # Theme initialisieren
-        current_theme = self.config_data.get("settings", {}).get("accent_color", "Blue")
-        ThemeManager.set_theme(current_theme)
-
-        self.title("QuickLaunch - Schnellstart")
-        self.geometry("700x500")
-        self.minsize(600, 400)
-        self.configure(fg_color="#1a1a1a")
-        
-        self.category_tabs = {}
-        
-        # Always on Top für Hauptfenster
-        self.attributes("-topmost", self.config_data["settings"].get("quicklaunch_always_on_top", False))
-        
-        # Protokoll für Schließen-Button ändern
-        self.protocol("WM_DELETE_WINDOW", self._on_close_window)
-        
-        self.tray_icon = None
-        self._setup_tray_icon()
-        
-        self._create_ui()
-        
-        # Topbar initialisieren
-        from ui.topbar import Topbar
-        self.topbar = Topbar(self)
     
     # ... (Create UI method unchanged) ...
 
     # --- System Tray Logic ---
     def _create_tray_image(self):
+        from PIL import Image, ImageDraw
+        
         # Create a simple icon if none exists
         image = Image.new('RGB', (64, 64), color = (0, 0, 0))
         d = ImageDraw.Draw(image)
@@ -122,7 +254,9 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
         return image
 
     def _setup_tray_icon(self):
-        if pystray is None:
+        try:
+            import pystray
+        except Exception:
             return
 
         def _run_tray():
@@ -143,37 +277,38 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.tray_thread.start()
 
     def _restore_from_tray(self, icon=None, item=None):
-        """Restores the Topbar and potentially the main window"""
+        """Restores the Topbar; called from the tray thread"""
+        # Main window stays hidden unless explicitly toggled
         self.after(0, self.topbar.deiconify)
-        # Main window stays hidden unless explicitly toggled, or we can show it too
-        # self.after(0, self.deiconify) 
 
+    def minimize_to_tray(self):
+        """Versteckt Hauptfenster und Topbar; zurück geht es über das Tray-Icon"""
         self.withdraw()
+        self.topbar.arrow_btn.configure(text="▼")
+        # Ohne Tray-Icon gäbe es keinen Weg zurück -> Topbar dann sichtbar lassen
         if self.tray_icon:
             self.topbar.withdraw()
-            # If no tray icon, we should probably not hide the topbar completely or provide a way back, 
-            # but for minimize logic, hiding window is standard. 
-            # If no tray, maybe we just minimize to taskbar? 
-            # But topbar is overrideredirect, so it doesn't have taskbar entry usually.
-        else:
-            # removing from screen without tray to bring it back is dangerous.
-            # treating minimize as just hiding main window but keeping topbar if no tray?
-            self.topbar.withdraw()
-            # If we don't have tray, we rely on topbar being visible? 
-            # Wait, if topbar is hidden, how do we get it back?
-            # On Windows, we re-show from tray.
-            # On Linux without tray, we might be stuck.
-            # Let's just withdraw for now, user can kill app if stuck. 
-            # Better: if no tray, maybe don't allow full minimize or just iconify?
-            pass
         
     def quit_app(self, icon=None, item=None):
         """Beendet die gesamte Anwendung inkl. Tray"""
+        if threading.current_thread() is not threading.main_thread():
+            # Aufruf aus dem Tray-Thread -> im Mainloop beenden
+            self.after(0, self.quit_app)
+            return
         if self.tray_icon:
             try:
                 self.tray_icon.stop()
             except Exception:
                 pass
+        icon_resolver.shutdown()
+        launcher.shutdown()
+        health_scanner.shutdown()
+        icon_cache.shutdown()
+        icon_atlas.shutdown()
+        stats_sampler.stop()
+        config_writer.flush()
+        frecency.flush()
+        icon_cache.flush()
         self.destroy()
         sys.exit(0)
 
@@ -237,6 +372,18 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
         )
         self.add_files_btn.pack(side="left", padx=5)
         
+        self.add_folder_btn = ctk.CTkButton(
+            btn_frame,
+            text="🗂️ Ordner",
+            width=90,
+            height=32,
+            font=("Segoe UI", 12),
+            fg_color=theme_primary,
+            hover_color=theme_hover,
+            command=self._show_folder_import_dialog
+        )
+        self.add_folder_btn.pack(side="left", padx=5)
+        
         self.settings_btn = ctk.CTkButton(
             btn_frame,
             text="⚙️",
@@ -273,6 +420,18 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
         )
         self.add_cat_btn.pack(side="left", padx=5)
         
+        self.most_used_btn = ctk.CTkButton(
+            btn_frame,
+            text="⭐ Meistgenutzt",
+            width=110,
+            height=32,
+            font=("Segoe UI", 12),
+            fg_color="#3d3d3d",
+            hover_color="#4d4d4d",
+            command=self._toggle_most_used
+        )
+        self.most_used_btn.pack(side="left", padx=5)
+        
         # Tabview für Kategorien
         self.tabview = ctk.CTkTabview(
             self,
@@ -281,11 +440,20 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
             segmented_button_selected_color="#0078d4",
             segmented_button_selected_hover_color="#1084d8",
             segmented_button_unselected_color="#2b2b2b",
-            segmented_button_unselected_hover_color="#3d3d3d"
+            segmented_button_unselected_hover_color="#3d3d3d",
+            command=self._on_tab_changed
         )
         self.tabview.pack(fill="both", expand=True, padx=15, pady=(10, 15))
         
         self._create_tabs()
+        self._on_tab_changed()
+        
+        # Globale Suchergebnisse (ersetzt die Tabs solange gesucht wird)
+        self.search_view = SearchResultsView(
+            self,
+            on_delete=self._delete_search_result,
+            on_edit=self._edit_search_result
+        )
         
         # Status Bar
         status_bar = ctk.CTkFrame(self, fg_color="#0f0f0f", height=30)
@@ -294,15 +462,29 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
         
         self.status_label = ctk.CTkLabel(
             status_bar,
-            text="📂 Dateien Button zum Hinzufügen | Rechtsklick für Optionen",
+            text=STATUS_HINT,
             font=("Segoe UI", 10),
             text_color="#666666"
         )
         self.status_label.pack(side="left", padx=15, pady=5)
     
+    def show_status(self, message, error=True):
+        """Zeigt eine Meldung in der Statusleiste; nach ein paar Sekunden kommt der Hinweis zurück"""
+        self.status_label.configure(text=message, text_color="#ff5555" if error else "#cccccc")
+        if self._status_message_job is not None:
+            self.after_cancel(self._status_message_job)
+        self._status_message_job = self.after(STATUS_MESSAGE_MS, self._reset_status)
+    
+    def _reset_status(self):
+        self._status_message_job = None
+        self.status_label.configure(text=STATUS_HINT, text_color="#666666")
+    
     def _save_config(self):
-        """Wrapper um config.save_config"""
-        save_config(self.config_data)
+        """Plant das Speichern; geschrieben wird gebündelt im Hintergrund"""
+        config_writer.request(self.config_data)
+        # Daten haben sich geändert -> offene Suche aktualisieren
+        if self.search_var.get().strip() or self._most_used_active:
+            self._on_search()
     
     def _add_files(self):
         """Öffnet Datei-Dialog zum Hinzufügen mehrerer Dateien"""
@@ -316,40 +498,48 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
             ]
         )
         
-        current_tab = self.tabview.get()
-        if files and current_tab in self.category_tabs:
-            for file_path in files:
-                self.category_tabs[current_tab].add_shortcut_from_path(file_path)
+        current_tab = self._ensure_tab(self.tabview.get())
+        if files and current_tab is not None:
+            current_tab.import_paths(files)
     
+    def _show_folder_import_dialog(self):
+        FolderImportDialog(self, self._import_folder)
+
+    def _import_folder(self, folder, include, exclude, max_depth):
+        current_tab = self._ensure_tab(self.tabview.get())
+        if current_tab is not None and not current_tab.import_folder(folder, include, exclude, max_depth):
+            self.show_status("Es läuft bereits ein Import in dieser Kategorie")
+
     def _show_add_dialog(self):
         AddDialog(self, self._add_shortcut)
     
     def _show_settings_dialog(self):
         if "settings" not in self.config_data:
              self.config_data["settings"] = {"columns": 5, "free_placement": False}
-        SettingsDialog(self, self.config_data["settings"], self._on_settings_saved)
+        SettingsDialog(self, self.config_data["settings"], self._on_settings_saved, self.config_data["categories"])
 
     def _on_settings_saved(self):
         self._save_config()
         # Settings anwenden
         self.attributes("-topmost", self.config_data["settings"].get("quicklaunch_always_on_top", False))
         
+        self._apply_icon_cache_budget()
+        
         # Refresh all tabs to apply new grid/placement settings
         for tab_name, tab in self.category_tabs.items():
             tab.update_settings(self.config_data["settings"])
 
+    def _apply_icon_cache_budget(self):
+        budget_mb = self.config_data["settings"].get("icon_cache_mb", 32)
+        image_cache.set_budget(int(budget_mb * 1024 * 1024))
+
     def _show_add_category_dialog(self):
         AddCategoryDialog(self, self._add_category)
     
     def _add_shortcut(self, name, path, shortcut_type, icon, image_path=None):
         current_tab = self.tabview.get()
         
-        if not image_path and shortcut_type == "file":
-            try:
-                image_path = get_file_icon_path(path, str(ICONS_DIR))
-            except Exception:
-                pass
-
+        # Fehlendes Bild-Icon wird beim Rendern im Hintergrund ermittelt
         shortcut = {
             "name": name,
             "path": path,
@@ -362,10 +552,11 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
         for cat in self.config_data["categories"]:
             if cat["name"] == current_tab:
                 cat["shortcuts"].append(shortcut)
+                search_index.add(shortcut, cat)
                 break
         
         self._save_config()
-        self.category_tabs[current_tab]._render_tiles()
+        self._ensure_tab(current_tab)._render_tiles()
     
     def _add_category(self, name):
         # Prüfen ob Kategorie existiert
@@ -379,13 +570,11 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self._save_config()
         
         # Tab hinzufügen
-        tab = self.tabview.add(name)
-        category_tab = CategoryTab(tab, new_cat, self.config_data.get("settings", {}), self._save_config)
-        category_tab.pack(fill="both", expand=True)
-        self.category_tabs[name] = category_tab
+        self._create_single_tab(new_cat)
         
         # Zum neuen Tab wechseln
         self.tabview.set(name)
+        self._on_tab_changed()
 
     # --- Neue Methoden für Topbar & Window Management ---
     
@@ -409,10 +598,6 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.config_data["settings"][key] = value
         self._save_config()
         
-    def quit_app(self):
-        """Beendet die gesamte Anwendung."""
-        self.destroy()
-
     def _bind_tab_context_menu(self, tab_name):
         try:
             # Access the internal button for the tab
@@ -433,7 +618,7 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
         menu.add_command(label="✏️ Umbenennen", command=lambda: self._rename_category(tab_name))
         
         # Löschen (nur wenn mehr als 1 Tab)
-        if len(self.category_tabs) > 1:
+        if len(self._tab_categories) > 1:
              menu.add_command(label="🗑️ Löschen", command=lambda: self._delete_category(tab_name))
              
         menu.tk_popup(event.x_root, event.y_root)
@@ -494,10 +679,11 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
         
         # Delete all tabs from UI
         # Removing from keys() while iterating is unsafe, make list
-        for name in list(self.category_tabs.keys()):
+        for name in list(self._tab_categories.keys()):
             self.tabview.delete(name)
             
         self.category_tabs.clear()
+        self._tab_categories.clear()
         
         # Re-create all
         for cat in self.config_data["categories"]:
@@ -508,18 +694,23 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
                 self.tabview.set(current_selection)
             except:
                 pass
+        self._on_tab_changed()
                 
         self._save_config()
 
     def _delete_category(self, tab_name):
         if messagebox.askyesno("Löschen", f"Kategorie '{tab_name}' und alle Verknüpfungen darin wirklich löschen?"):
-             # Update Data
-            self.config_data["categories"] = [c for c in self.config_data["categories"] if c["name"] != tab_name]
+             # Update Data (in place, der Suchindex hält eine Referenz auf die Liste)
+            categories = self.config_data["categories"]
+            for cat in [c for c in categories if c["name"] == tab_name]:
+                search_index.remove_category(cat)
+                categories.remove(cat)
             
             # Update UI
             self.tabview.delete(tab_name)
-            if tab_name in self.category_tabs:
-                del self.category_tabs[tab_name]
+            self.category_tabs.pop(tab_name, None)
+            self._tab_categories.pop(tab_name, None)
+            self._on_tab_changed()
                 
             self._save_config()
 
@@ -528,22 +719,119 @@ class QuickLaunchApp(ctk.CTk, TkinterDnD.DnDWrapper):
             self._create_single_tab(cat)
 
     def _create_single_tab(self, cat):
+        """Legt nur den Reiter an; der Inhalt entsteht in _ensure_tab"""
         name = cat["name"]
-        tab = self.tabview.add(name)
-        category_tab = CategoryTab(tab, cat, self.config_data.get("settings", {}), self._save_config)
-        category_tab.pack(fill="both", expand=True)
-        self.category_tabs[name] = category_tab
+        self.tabview.add(name)
+        self._tab_categories[name] = cat
         
         # Bind Context Menu
         self._bind_tab_context_menu(name)
 
+    def _ensure_tab(self, name):
+        """Gibt den CategoryTab zurück und baut ihn beim ersten Zugriff"""
+        category_tab = self.category_tabs.get(name)
+        if category_tab is None and name in self._tab_categories:
+            category_tab = CategoryTab(
+                self.tabview.tab(name),
+                self._tab_categories[name],
+                self.config_data.get("settings", {}),
+                self._save_config
+            )
+            category_tab.pack(fill="both", expand=True)
+            if self.dnd_enabled:
+                category_tab.register_dnd()
+            self.category_tabs[name] = category_tab
+        return category_tab
+
+    def _on_tab_changed(self):
+        self._ensure_tab(self.tabview.get())
+        
+        if self._prefetch_job is not None:
+            self.after_cancel(self._prefetch_job)
+            self._prefetch_job = None
+        if self.config_data["settings"].get("prefetch_tabs", True):
+            self._prefetch_job = self.after(TAB_PREFETCH_DELAY_MS, self._prefetch_neighbour_tab)
+
+    def _prefetch_neighbour_tab(self):
+        """Baut im Leerlauf einen Nachbar-Tab des aktuellen Tabs vor (einen pro Aufruf)"""
+        self._prefetch_job = None
+        names = list(self._tab_categories)
+        current = self.tabview.get()
+        if current not in names:
+            return
+        
+        index = names.index(current)
+        for neighbour in (index + 1, index - 1):
+            if 0 <= neighbour < len(names) and names[neighbour] not in self.category_tabs:
+                self._ensure_tab(names[neighbour])
+                self._prefetch_job = self.after(TAB_PREFETCH_DELAY_MS, self._prefetch_neighbour_tab)
+                return
+
     def _on_search(self, *args):
-        query = self.search_var.get().lower()
+        # Debounce: erst suchen, wenn die Eingabe kurz ruht
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        self._search_job = None
+        query = self.search_var.get().strip()
+        
+        columns = self.config_data["settings"].get("columns", 4)
+        
+        if query:
+            self._set_most_used(False)
+            results = search_index.search(query, limit=SEARCH_LIMIT)
+            self.search_view.show_results(query, results, columns, limit=SEARCH_LIMIT)
+        elif self._most_used_active:
+            results = frecency.most_used(self.config_data["categories"], limit=self.search_view.MAX_TILES)
+            header = "Meistgenutzt" if results else "Noch nichts gestartet – häufig genutzte Verknüpfungen erscheinen hier"
+            self.search_view.show_items(header, results, columns)
+        else:
+            if self.search_view.winfo_manager():
+                self.search_view.pack_forget()
+                self.tabview.pack(fill="both", expand=True, padx=15, pady=(10, 15))
+            return
         
-        # Determine the currently active tab
-        current_tab_name = self.tabview.get()
-        if current_tab_name in self.category_tabs:
-            self.category_tabs[current_tab_name].set_filter(query)
+        if not self.search_view.winfo_manager():
+            self.tabview.pack_forget()
+            self.search_view.pack(fill="both", expand=True, padx=15, pady=(10, 15))
+
+    def _toggle_most_used(self):
+        self._set_most_used(not self._most_used_active)
+        if self.search_var.get():
+            # Leeren löst _on_search aus, das zeigt dann die Ansicht
+            self.search_var.set("")
+        else:
+            self._run_search()
+
+    def _set_most_used(self, active):
+        if active == self._most_used_active:
+            return
+        self._most_used_active = active
+        self.most_used_btn.configure(
+            fg_color=ThemeManager.get_color("primary") if active else "#3d3d3d"
+        )
+
+    def _build_search_index(self):
+        if not search_index.build_step():
+            self.after(1, self._build_search_index)
+
+    def _tab_for_shortcut(self, shortcut):
+        category = search_index.category_of(shortcut)
+        if category is not None:
+            return self._ensure_tab(category["name"])
+        return None
+
+    def _delete_search_result(self, shortcut):
+        tab = self._tab_for_shortcut(shortcut)
+        if tab is not None:
+            tab._delete_shortcut(shortcut)
+
+    def _edit_search_result(self, shortcut):
+        tab = self._tab_for_shortcut(shortcut)
+        if tab is not None:
+            tab._edit_shortcut(shortcut)
 
 def main():
     app = QuickLaunchApp()
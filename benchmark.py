@@ -0,0 +1,596 @@
+#!/usr/bin/env python3
+"""
+QuickLaunch Benchmarks
+
+Aufruf: python benchmark.py <name> [<name> ...]
+Ohne Argumente werden alle Benchmarks ausgeführt.
+"""
+
+import sys
+import time
+
+
+def _make_shortcuts(count, prefix="Programm"):
+    return [
+        {
+            "name": f"{prefix} {i}",
+            "path": f"/opt/tools/{prefix.lower()}_{i}/bin/run_{i}",
+            "type": "file",
+            "icon": "⚙️",
+            "image_path": None,
+        }
+        for i in range(count)
+    ]
+
+
+def _make_tab(root, shortcuts, settings=None):
+    """Baut einen CategoryTab im (versteckten) Root-Fenster"""
+    from ui.tab import CategoryTab
+    from utils.dispatch import dispatcher
+
+    dispatcher.attach(root)
+    category = {"name": "Benchmark", "shortcuts": shortcuts}
+    tab = CategoryTab(root, category, settings or {"columns": 5}, lambda: None)
+    tab.pack(fill="both", expand=True)
+    root.update_idletasks()
+    return tab
+
+
+def bench_tile_edit(sizes=(50, 200, 800)):
+    """Kosten einer einzelnen Bearbeitung vs. vollständigem Neuaufbau"""
+    import customtkinter as ctk
+
+    root = ctk.CTk()
+    root.withdraw()
+    print(f"{'Shortcuts':>10} {'Edit (ms)':>12} {'Rebuild (ms)':>14}")
+    for size in sizes:
+        shortcuts = _make_shortcuts(size)
+        # Immer der Abgleich im normalen Raster, auch oberhalb der Schwelle fürs virtuelle Raster
+        tab = _make_tab(root, shortcuts, {"columns": 5, "virtual_grid_threshold": 10 ** 9})
+
+        target = shortcuts[size // 2]
+        start = time.perf_counter()
+        for n in range(10):
+            target["name"] = f"Bearbeitet {n}"
+            tab._render_tiles()
+            root.update_idletasks()
+        edit_ms = (time.perf_counter() - start) * 100
+
+        start = time.perf_counter()
+        tab._clear_tiles()
+        tab._render_tiles()
+        root.update_idletasks()
+        rebuild_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{size:>10} {edit_ms:>12.2f} {rebuild_ms:>14.2f}")
+        tab.destroy()
+    root.destroy()
+
+
+def bench_virtual_scroll(sizes=(1000, 10000, 20000)):
+    """Aufbau und Scrollen im virtuellen Raster"""
+    import customtkinter as ctk
+
+    root = ctk.CTk()
+    root.geometry("700x500")
+    print(f"{'Shortcuts':>10} {'Aufbau (ms)':>12} {'Frame (ms)':>11} {'Kacheln':>8}")
+    for size in sizes:
+        start = time.perf_counter()
+        tab = _make_tab(root, _make_shortcuts(size), {"columns": 5, "virtual_grid_threshold": 300})
+        root.update()
+        build_ms = (time.perf_counter() - start) * 1000
+
+        grid = tab.virtual_grid
+        frames = 200
+        start = time.perf_counter()
+        for _ in range(frames):
+            grid._offset += grid.SCROLL_STEP
+            grid._update_window()
+            root.update_idletasks()
+        frame_ms = (time.perf_counter() - start) * 1000 / frames
+
+        tiles = len(grid._visible) + len(grid._pool)
+        print(f"{size:>10} {build_ms:>12.2f} {frame_ms:>11.2f} {tiles:>8}")
+        tab.destroy()
+    root.destroy()
+
+
+def bench_bulk_import(sizes=(50, 200, 500)):
+    """Drop vieler Dateien: einzeln hinzufügen vs. Bulk-Import"""
+    import customtkinter as ctk
+
+    root = ctk.CTk()
+    root.withdraw()
+    print(f"{'Dateien':>8} {'Einzeln (ms)':>13} {'Bulk (ms)':>10}")
+    for size in sizes:
+        paths = [f"/opt/tools/tool_{i}/run_{i}.exe" for i in range(size)]
+
+        tab = _make_tab(root, [], {"columns": 5, "virtual_grid_threshold": 10 ** 9})
+        start = time.perf_counter()
+        for path in paths:
+            tab.add_shortcut_from_path(path)
+        root.update_idletasks()
+        single_ms = (time.perf_counter() - start) * 1000
+        tab.destroy()
+
+        tab = _make_tab(root, [], {"columns": 5, "virtual_grid_threshold": 10 ** 9})
+        start = time.perf_counter()
+        tab.import_paths(paths)
+        while tab._import is not None:
+            root.update()
+        root.update_idletasks()
+        bulk_ms = (time.perf_counter() - start) * 1000
+        tab.destroy()
+
+        print(f"{size:>8} {single_ms:>13.1f} {bulk_ms:>10.1f}")
+    root.destroy()
+
+
+def bench_folder_scan(files=100000):
+    """Ordner-Import: Durchlauf eines Baums mit 100k Dateien"""
+    import os
+    import shutil
+    import tempfile
+    from ui.tab import _shortcut_from_path
+    from utils.folder_scan import scan_folder, next_chunk
+
+    root = tempfile.mkdtemp(prefix="ql_bench_")
+    try:
+        per_dir = 100
+        for d in range(files // per_dir):
+            directory = os.path.join(root, f"gruppe_{d // 10}", f"tools_{d}")
+            os.makedirs(directory, exist_ok=True)
+            for f in range(per_dir):
+                ext = ".exe" if f % 4 == 0 else ".txt"
+                open(os.path.join(directory, f"datei_{f}{ext}"), "w").close()
+
+        print(f"{'Variante':<28} {'Treffer':>8} {'1. Chunk (ms)':>14} {'Gesamt (ms)':>12}")
+        for label, kwargs in (
+            ("alles", {}),
+            ("*.exe", {"include": ["*.exe"]}),
+            ("ohne gruppe_1*", {"exclude": ["gruppe_1*"]}),
+        ):
+            start = time.perf_counter()
+            paths = scan_folder(root, **kwargs)
+            chunk, exhausted = next_chunk(paths)
+            first_ms = (time.perf_counter() - start) * 1000
+            count = len(chunk)
+            shortcuts = [_shortcut_from_path(p, is_dir=False) for p in chunk]
+            while not exhausted:
+                chunk, exhausted = next_chunk(paths)
+                count += len(chunk)
+                shortcuts.extend(_shortcut_from_path(p, is_dir=False) for p in chunk)
+            total_ms = (time.perf_counter() - start) * 1000
+            print(f"{label:<28} {count:>8} {first_ms:>14.2f} {total_ms:>12.0f}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def bench_xdg_icons(icons=5000):
+    """Linux-Icons: Index über ein Test-Icon-Theme aufbauen, aus dem Cache laden, nachschlagen"""
+    import os
+    import shutil
+    import tempfile
+    from utils.xdg_icons import IconThemeIndex, icon_for_file
+
+    root = tempfile.mkdtemp(prefix="ql_bench_")
+    try:
+        # Theme "Test" erbt von hicolor; jedes Icon in mehreren Größen
+        data_dir = os.path.join(root, "share")
+        theme_dir = os.path.join(data_dir, "icons", "Test")
+        os.makedirs(theme_dir)
+        with open(os.path.join(theme_dir, "index.theme"), "w") as f:
+            f.write("[Icon Theme]\nName=Test\nInherits=hicolor\n")
+        for theme, sizes in (("Test", (16, 32, 48, 64)), ("hicolor", (48, 128, 256))):
+            for size in sizes:
+                directory = os.path.join(data_dir, "icons", theme, f"{size}x{size}", "apps")
+                os.makedirs(directory, exist_ok=True)
+                for i in range(icons):
+                    open(os.path.join(directory, f"app-{i}.png"), "w").close()
+        names = [f"app-{i}" for i in range(0, icons, 7)]
+
+        cache_file = os.path.join(root, "index.json")
+        print(f"{'Variante':<28} {'Zeit (ms)':>10}")
+        for label in ("Index aufbauen", "Index aus Cache laden"):
+            index = IconThemeIndex(cache_file, data_dirs=[data_dir], theme="Test")
+            start = time.perf_counter()
+            len(index)
+            print(f"{label:<28} {(time.perf_counter() - start) * 1000:>10.1f}")
+
+        start = time.perf_counter()
+        for name in names:
+            assert "64x64" in index.lookup(name)
+        per_lookup_us = (time.perf_counter() - start) / len(names) * 1e6
+        print(f"{'Nachschlagen (µs)':<28} {per_lookup_us:>10.2f}")
+
+        # Desktop-Datei: Name/Icon lesen und über den Index auflösen
+        desktop = os.path.join(root, "app.desktop")
+        with open(desktop, "w") as f:
+            f.write("[Desktop Entry]\nName=App\nExec=app %U\nIcon=app-1\n")
+        import utils.xdg_icons as xdg
+        default_index, xdg.icon_index = xdg.icon_index, index
+        try:
+            start = time.perf_counter()
+            assert icon_for_file(desktop).endswith("app-1.png")
+            print(f"{'.desktop auflösen (µs)':<28} {(time.perf_counter() - start) * 1e6:>10.1f}")
+        finally:
+            xdg.icon_index = default_index
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def bench_icon_atlas(count=500):
+    """Start: Icons einzeln als PNG dekodieren vs. aus dem gemappten Icon-Atlas lesen"""
+    import os
+    import shutil
+    import tempfile
+    from PIL import Image
+    from utils.icon_atlas import IconAtlas, build_atlas
+    from utils.icon_variants import ICON_SIZE
+    from utils.image_cache import DECODE_SIZE
+
+    root = tempfile.mkdtemp(prefix="ql_bench_")
+    try:
+        # Icons wie aus der Extraktion: 32x32 RGBA, alle verschieden
+        paths = []
+        for i in range(count):
+            path = os.path.join(root, f"icon_{i}.png")
+            Image.frombytes("RGBA", (32, 32), os.urandom(32 * 32 * 4)).save(path)
+            paths.append(path)
+        atlas_path = os.path.join(root, "atlas.bin")
+
+        start = time.perf_counter()
+        build_atlas(atlas_path, [(p, os.stat(p).st_mtime_ns) for p in paths])
+        build_ms = (time.perf_counter() - start) * 1000
+
+        # Wie ImageCache._load ohne Atlas: stat, öffnen, dekodieren, skalieren
+        start = time.perf_counter()
+        for path in paths:
+            os.stat(path)
+            with Image.open(path) as src:
+                src.load()
+                src.resize(DECODE_SIZE, Image.Resampling.LANCZOS)
+        png_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        atlas = IconAtlas(atlas_path)
+        atlas.open()
+        for path in paths:
+            atlas.image(path, atlas.mtime_of(path), ICON_SIZE[0])
+        atlas_ms = (time.perf_counter() - start) * 1000
+        atlas.close()
+
+        size_kb = os.path.getsize(atlas_path) / 1024
+        print(f"{'Variante':<28} {'Zeit (ms)':>10}")
+        print(f"{f'{count} PNGs einzeln':<28} {png_ms:>10.1f}")
+        print(f"{'Atlas (mmap) inkl. Öffnen':<28} {atlas_ms:>10.1f}")
+        print(f"{f'Atlas bauen ({size_kb:.0f} KB)':<28} {build_ms:>10.1f}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def _lnk_id_item(kind, payload):
+    """Ein Eintrag einer LinkTargetIDList: Größe, Typ-Byte, Nutzdaten"""
+    import struct
+    return struct.pack("<H", len(payload) + 3) + bytes([kind]) + payload
+
+
+def _make_lnk(target="", arguments="", icon_location="", share="", id_list=b"", env_target=""):
+    """
+    Minimale .lnk-Datei (MS-SHLLINK): Header, optional IDList (id_list: Einträge),
+    LinkInfo mit lokalem Pfad oder UNC-Freigabe (share, target ist dann der
+    Suffix), Unicode-Strings, optional Umgebungsvariablen-Block
+    """
+    import struct
+    flags = 0x80  # IsUnicode
+    body = b""
+    if id_list:
+        flags |= 0x01  # HasLinkTargetIDList
+        body += struct.pack("<H", len(id_list) + 2) + id_list + b"\0\0"
+    if target:
+        flags |= 0x02  # HasLinkInfo
+        header_size = 0x1C
+        if share:
+            network = struct.pack("<5I", 0x14 + len(share) + 1, 0x2, 0x14, 0, 0x20000) + share.encode("cp1252") + b"\0"
+            info = network + target.encode("cp1252") + b"\0"
+            fields = (0x2, 0, 0, header_size, header_size + len(network))
+        else:
+            volume_id = struct.pack("<IIII", 0x11, 3, 0x12345678, 0x10) + b"\0"
+            base_path = target.encode("cp1252") + b"\0"
+            info = volume_id + base_path + b"\0"
+            fields = (0x1, header_size, header_size + len(volume_id), 0, header_size + len(volume_id) + len(base_path))
+        body += struct.pack("<7I", header_size + len(info), header_size, *fields) + info
+    for flag, value in ((0x20, arguments), (0x40, icon_location)):
+        if value:
+            flags |= flag
+            body += struct.pack("<H", len(value)) + value.encode("utf-16-le")
+    if env_target:
+        body += (struct.pack("<II", 0x314, 0xA0000001) + env_target.encode("cp1252").ljust(260, b"\0")
+                 + env_target.encode("utf-16-le").ljust(520, b"\0"))
+    header = struct.pack(
+        "<I16sIIQQQIiIHH8s", 0x4C, bytes.fromhex("0114020000000000c000000000000046"),
+        flags, 0x20, 0, 0, 0, 0, 0, 1, 0, 0, b"\0" * 8
+    )
+    return header + body + struct.pack("<I", 0)
+
+
+def _check_lnk_parser(root):
+    """
+    Prüft den .lnk-Parser an den Fixtures: LinkInfo lokal und als UNC-Pfad,
+    IDList als Rückfall, Umgebungsvariablen-Block, kaputte Eingaben, mtime-Cache.
+    Gibt die Zahl der Prüfungen zurück.
+    """
+    import os
+    import struct
+    from utils import lnk_parser
+    from utils.lnk_parser import LnkError, parse_lnk
+
+    checks = 0
+    local = _make_lnk(r"C:\Tools\app.exe", arguments="--profil 1", icon_location=r"C:\Icons\app.ico")
+    link = parse_lnk(local)
+    assert (link.target, link.arguments, link.icon_location) == (
+        r"C:\Tools\app.exe", "--profil 1", r"C:\Icons\app.ico"), link
+    checks += 1
+
+    link = parse_lnk(_make_lnk(r"Tools\app.exe", share=r"\\server\share"))
+    assert link.target == r"\\server\share\Tools\app.exe", link
+    checks += 1
+
+    # Arbeitsplatz, Laufwerk, Ordner mit langem Namen im 0xBEEF0004-Block, Datei
+    long_name = "Program Files".encode("utf-16-le") + b"\0\0"
+    ext = b"\x04\x00\xef\xbe" + b"\0" * (0x2E - 8) + long_name + b"\0\0"
+    ext = struct.pack("<HH", len(ext) + 4, 9) + ext
+    id_list = (
+        _lnk_id_item(0x1F, b"\x50" + bytes(16))
+        + _lnk_id_item(0x2F, b"C:\\\0".ljust(22, b"\0"))
+        + _lnk_id_item(0x31, bytes(11) + b"PROGRA~1\0" + ext)
+        + _lnk_id_item(0x32, bytes(11) + b"app.exe\0")
+    )
+    link = parse_lnk(_make_lnk(id_list=id_list))
+    assert link.target == r"C:\Program Files\app.exe", link
+    checks += 1
+
+    # Umgebungsvariablen-Block hat Vorrang vor der IDList
+    env_target = r"%ProgramFiles%\App\app.exe"
+    link = parse_lnk(_make_lnk(id_list=id_list, env_target=env_target))
+    assert link.target == (os.path.expandvars(env_target) if os.name == "nt" else env_target), link
+    checks += 1
+
+    # Abgeschnitten oder kein Shell Link: immer LnkError, nie struct.error o.ä.
+    # (die letzten 4 Bytes sind der optionale Endblock)
+    truncated = [
+        data[:n]
+        for data in (local, _make_lnk(r"C:\Tools\app.exe"), _make_lnk(id_list=id_list))
+        for n in range(len(data) - 4)
+    ]
+    for data in truncated + [b"\0" * 0x4C, b"MZ" + local[2:]]:
+        try:
+            parse_lnk(data)
+        except LnkError:
+            checks += 1
+        else:
+            raise AssertionError(f"kaputte Eingabe ({len(data)} Bytes) ohne LnkError gelesen")
+
+    # read_lnk: Ergebnis bleibt, bis sich mtime oder Größe ändern
+    path = os.path.join(root, "cache.lnk")
+    with open(path, "wb") as f:
+        f.write(_make_lnk(r"C:\Tools\one.exe"))
+    mtime = os.stat(path).st_mtime_ns
+    assert lnk_parser.read_lnk(path).target == r"C:\Tools\one.exe"
+    with open(path, "wb") as f:
+        f.write(_make_lnk(r"C:\Tools\two.exe"))
+    os.utime(path, ns=(mtime, mtime))
+    assert lnk_parser.read_lnk(path).target == r"C:\Tools\one.exe", "mtime-Cache nicht benutzt"
+    os.utime(path, ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+    assert lnk_parser.read_lnk(path).target == r"C:\Tools\two.exe", "geänderte Datei nicht neu gelesen"
+    with open(path, "wb") as f:
+        f.write(b"kein Link")
+    assert lnk_parser.read_lnk(path) is None
+    checks += 4
+    return checks
+
+
+def bench_lnk(count=5000):
+    """Auflösen von .lnk-Dateien wie beim Import eines Startmenü-Ordners"""
+    import os
+    import shutil
+    import tempfile
+    from utils import lnk_parser
+    from utils.system_utils import resolve_lnk_path
+
+    root = tempfile.mkdtemp(prefix="ql_bench_")
+    try:
+        target = os.path.join(root, "programm.exe")
+        open(target, "w").close()
+        paths = []
+        for i in range(count):
+            path = os.path.join(root, f"Programm {i}.lnk")
+            with open(path, "wb") as f:
+                f.write(_make_lnk(target, arguments=f"--profil {i}", icon_location=r"C:\Icons\app.ico"))
+            paths.append(path)
+
+        link = lnk_parser.read_lnk(paths[0])
+        assert link.target == target and link.arguments == "--profil 0", link
+        print(f"Parser-Prüfungen: {_check_lnk_parser(root)} bestanden")
+
+        print(f"{'Variante':<28} {'Zeit (ms)':>10} {'Links/s':>10}")
+        lnk_parser._cache.clear()
+        for label in ("erstes Auflösen", "erneut (mtime-Cache)"):
+            start = time.perf_counter()
+            for path in paths:
+                assert resolve_lnk_path(path) == target
+            elapsed = time.perf_counter() - start
+            print(f"{label:<28} {elapsed * 1000:>10.1f} {count / elapsed:>10.0f}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def bench_free_drag(sizes=(100, 300)):
+    """Freier Modus: Aufbau des Canvas, Ziehen (Motion-Events vs. ausgeführte Platzierungen), Ablegen"""
+    import types
+    import customtkinter as ctk
+    from ui.drag_engine import FRAME_MS
+
+    root = ctk.CTk()
+    root.withdraw()
+    print(f"{'Kacheln':>8} {'Aufbau (ms)':>12} {'Widgets':>8} {'Items':>6} {'Events':>7} {'Moves':>6} {'Drop (ms)':>10}")
+    for size in sizes:
+        start = time.perf_counter()
+        tab = _make_tab(root, _make_shortcuts(size), {"columns": 5, "free_placement": True})
+        build_ms = (time.perf_counter() - start) * 1000
+        # Kacheln liegen als Items auf dem Canvas, nicht als eigene Widgets
+        widgets = len(tab.board.winfo_children())
+        items = len(tab.board.find_all())
+
+        shortcut = tab.category_data["shortcuts"][0]
+        engine = tab.drag_engine
+        engine.events = engine.moves = 0
+        tab._start_drag(types.SimpleNamespace(x_root=0, y_root=0), shortcut)
+        # 1 s Ziehen mit 1000 Hz Maus: Events kommen schneller als Frames
+        deadline = time.perf_counter() + 1.0
+        step = 0
+        while time.perf_counter() < deadline:
+            step += 1
+            tab._drag(types.SimpleNamespace(x_root=step % 400, y_root=step % 300))
+            root.update()
+            time.sleep(0.001)
+        # Auf eine belegte Kachel fallen lassen -> nächster freier Platz
+        target = tab.category_data["shortcuts"][1]
+        start = time.perf_counter()
+        tab._drag(types.SimpleNamespace(x_root=target["x"] - shortcut["x"], y_root=target["y"] - shortcut["y"]))
+        tab._end_drag(None)
+        drop_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{size:>8} {build_ms:>12.1f} {widgets:>8} {items:>6} {engine.events:>7} {engine.moves:>6} {drop_ms:>10.3f}")
+        tab.destroy()
+    print(f"(höchstens eine Platzierung pro {FRAME_MS} ms)")
+    root.destroy()
+
+
+def _count_widgets(widget):
+    return 1 + sum(_count_widgets(child) for child in widget.winfo_children())
+
+
+def bench_tile_style(count=500):
+    """Kachel-Aufbau: ShortcutTile (CTk) vs. LightTile (reines Tk), Zeit und Speicher pro Kachel"""
+    import tracemalloc
+    import customtkinter as ctk
+
+    root = ctk.CTk()
+    root.withdraw()
+    print(f"{'Stil':>6} {'Aufbau (ms)':>12} {'ms/Kachel':>10} {'KiB/Kachel':>11} {'Widgets/Kachel':>15}")
+    for style in ("ctk", "light"):
+        settings = {"columns": 5, "virtual_grid_threshold": 10 ** 9, "tile_style": style}
+        tab = _make_tab(root, [], settings)
+        tab.category_data["shortcuts"] = _make_shortcuts(count)
+
+        # Nur Python-seitiger Speicher; was Tk selbst pro Widget belegt, zählt tracemalloc nicht
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        tab._render_tiles()
+        root.update_idletasks()
+        build_ms = (time.perf_counter() - start) * 1000
+        allocated = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+        widgets = sum(_count_widgets(tile) for tile in tab.tiles) / max(1, len(tab.tiles))
+        print(f"{style:>6} {build_ms:>12.1f} {build_ms / count:>10.3f} {allocated / count / 1024:>11.1f} {widgets:>15.1f}")
+        tab.destroy()
+    root.destroy()
+
+
+def _make_catalog(count, categories=10):
+    import random
+
+    words = ["Visual", "Studio", "Code", "Chrome", "Firefox", "Terminal", "Editor", "Photo",
+             "Game", "Steam", "Office", "Word", "Excel", "Python", "Tool", "Manager",
+             "Player", "Music", "Video", "Backup"]
+    rng = random.Random(1)
+    catalog = [{"name": f"Kategorie {c}", "shortcuts": []} for c in range(categories)]
+    for i in range(count):
+        name = " ".join(rng.sample(words, 3)) + f" {i}"
+        catalog[i % categories]["shortcuts"].append({
+            "name": name,
+            "path": f"C:\\Program Files\\{name.replace(' ', '')}\\app{i}.exe",
+            "type": "file",
+            "icon": "⚙️",
+        })
+    return catalog
+
+
+def bench_search(count=50000):
+    """Globale Suche: Indexaufbau und Zeit pro Tastendruck"""
+    from utils.search_index import SearchIndex
+
+    catalog = _make_catalog(count)
+    index = SearchIndex()
+    start = time.perf_counter()
+    index.rebuild(catalog)
+    print(f"Index für {count} Verknüpfungen: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    typed = "visual studio code"
+    print(f"{'Eingabe':<20} {'Treffer':>8} {'ms':>8}")
+    for n in range(1, len(typed) + 1):
+        query = typed[:n]
+        start = time.perf_counter()
+        results = index.search(query)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{query!r:<20} {len(results):>8} {elapsed:>8.3f}")
+
+    # Regression: Wortanfänge dürfen nicht hinter vielen Treffern mitten im Wort verloren gehen
+    shortcuts = _make_shortcuts(count, prefix="xapp") + _make_shortcuts(20, prefix="app")
+    index.rebuild([{"name": "Präfix", "shortcuts": shortcuts}])
+    start = time.perf_counter()
+    results = index.search("app")
+    elapsed = (time.perf_counter() - start) * 1000
+    found = sum(1 for shortcut, _ in results[:20] if shortcut["name"].startswith("app "))
+    print(f"'app' bei {count} x 'xapp…': {found}/20 Wortanfänge vorn ({elapsed:.1f} ms)")
+    assert found == 20, "Wortanfang-Treffer fehlen in den Suchergebnissen"
+
+
+def bench_fuzzy(count=50000):
+    """Unscharfe Suche: Abkürzungen und Tippfehler, Zeichen für Zeichen getippt"""
+    from utils.search_index import SearchIndex
+
+    index = SearchIndex()
+    index.rebuild(_make_catalog(count))
+
+    print(f"{'Eingabe':<14} {'max ms':>8} {'Treffer':>8}  Bester Treffer")
+    for typed in ("vsc", "vscode", "chrm", "fierfox", "visaul stu"):
+        worst = 0.0
+        for n in range(1, len(typed) + 1):
+            start = time.perf_counter()
+            results = index.search(typed[:n])
+            worst = max(worst, (time.perf_counter() - start) * 1000)
+        best = results[0][0]["name"] if results else "-"
+        print(f"{typed!r:<14} {worst:>8.3f} {len(results):>8}  {best}")
+
+
+BENCHMARKS = {
+    "tile-edit": bench_tile_edit,
+    "tile-style": bench_tile_style,
+    "virtual-scroll": bench_virtual_scroll,
+    "search": bench_search,
+    "fuzzy": bench_fuzzy,
+    "bulk-import": bench_bulk_import,
+    "folder-scan": bench_folder_scan,
+    "xdg-icons": bench_xdg_icons,
+    "icon-atlas": bench_icon_atlas,
+    "lnk": bench_lnk,
+    "free-drag": bench_free_drag,
+}
+
+
+def main(names):
+    for name in names or BENCHMARKS:
+        if name not in BENCHMARKS:
+            print(f"Unbekannter Benchmark: {name} (verfügbar: {', '.join(BENCHMARKS)})")
+            return 1
+        print(f"\n=== {name} ===")
+        BENCHMARKS[name]()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
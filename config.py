@@ -1,43 +1,108 @@
 import customtkinter as ctk
-import json
+import os
 from pathlib import Path
 
+from utils.config_store import JsonStore, SqliteStore
+
 # Pfad zur Konfigurationsdatei
 CONFIG_FILE = Path(__file__).parent / "config.json"
+# Optionales SQLite-Backend (settings.storage_backend = "sqlite")
+DB_FILE = Path(__file__).parent / "config.db"
+MIGRATED_FILE = Path(__file__).parent / "config.json.migrated"
+DB_MIGRATED_FILE = Path(__file__).parent / "config.db.migrated"
 ICONS_DIR = Path(__file__).parent / "icons"
 
+_store = None
+
 def setup_theme():
     """Initialisiert das Theme"""
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
 
+def _open_store():
+    """
+    Store, aus dem geladen wird: die Datenbank, falls sie existiert (sie ist
+    dann die aktuelle Kopie), sonst config.json. Welches Backend danach gilt,
+    entscheidet settings.storage_backend; load_config migriert bei Bedarf.
+    """
+    if DB_FILE.exists():
+        return SqliteStore(DB_FILE)
+    return JsonStore(CONFIG_FILE)
+
+def _get_store():
+    global _store
+    if _store is None:
+        _store = _open_store()
+    return _store
+
+def _migrate_to_sqlite(data: dict):
+    """Einmalige Übernahme von config.json in die SQLite-Datenbank"""
+    global _store
+    store = SqliteStore(DB_FILE)
+    try:
+        store.import_data(data)
+    except Exception as e:
+        print(f"Migration to SQLite failed: {e}")
+        store.close()
+        DB_FILE.unlink(missing_ok=True)
+        return
+    os.replace(CONFIG_FILE, MIGRATED_FILE)
+    _store = store
+
+def _migrate_to_json(data: dict):
+    """Rückweg: Datenbank nach config.json schreiben, config.db in config.db.migrated umbenennen"""
+    global _store
+    store = JsonStore(CONFIG_FILE)
+    try:
+        store.save(data)
+    except Exception as e:
+        print(f"Migration to JSON failed, staying on SQLite: {e}")
+        return
+    _store.close()
+    os.replace(DB_FILE, DB_MIGRATED_FILE)
+    _store = store
+
 def load_config() -> dict:
     """Lädt die Konfiguration oder gibt Standardwerte zurück"""
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                # Ensure all settings keys exist
-                if "settings" not in data:
-                    data["settings"] = {}
-                
-                defaults = {
-                    "theme": "dark",
-                    "columns": 5,
-                    "tile_size": 100,
-                    "free_placement": False,
-                    "topbar_always_on_top": True,
-                    "quicklaunch_always_on_top": False,
-                    "accent_color": "Blue"
-                }
+    try:
+        data = _get_store().load()
+    except Exception as e:
+        print(f"Loading config failed: {e}")
+        data = None
+
+    if data is not None:
+        # Ensure all settings keys exist
+        if "settings" not in data:
+            data["settings"] = {}
+        
+        defaults = {
+            "theme": "dark",
+            "columns": 5,
+            "tile_size": 100,
+            "free_placement": False,
+            "topbar_always_on_top": True,
+            "quicklaunch_always_on_top": False,
+            "accent_color": "Blue",
+            "virtual_grid_threshold": 300,
+            "icon_cache_mb": 32,
+            "storage_backend": "json",
+            "prefetch_tabs": True,
+            "icon_atlas": False,
+            "snap_to_grid": False,
+            "tile_style": "ctk"
+        }
+        
+        for key, val in defaults.items():
+            if key not in data["settings"]:
+                data["settings"][key] = val
+
+        backend = data["settings"]["storage_backend"]
+        if backend == "sqlite" and isinstance(_store, JsonStore):
+            _migrate_to_sqlite(data)
+        elif backend != "sqlite" and isinstance(_store, SqliteStore):
+            _migrate_to_json(data)
                 
-                for key, val in defaults.items():
-                    if key not in data["settings"]:
-                        data["settings"][key] = val
-                        
-                return data
-        except Exception:
-            pass
+        return data
             
     return {
         "categories": [{"name": "Allgemein", "shortcuts": []}],
@@ -47,11 +112,17 @@ def load_config() -> dict:
             "tile_size": 100,
             "free_placement": False,
             "topbar_always_on_top": True,
-            "quicklaunch_always_on_top": False
+            "quicklaunch_always_on_top": False,
+            "virtual_grid_threshold": 300,
+            "icon_cache_mb": 32,
+            "storage_backend": "json",
+            "prefetch_tabs": True,
+            "icon_atlas": False,
+            "snap_to_grid": False,
+            "tile_style": "ctk"
         }
     }
 
 def save_config(data: dict):
-    """Speichert die Konfiguration"""
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    """Speichert die Konfiguration (nur Änderungen, je nach Backend)"""
+    _get_store().save(data)
@@ -6,7 +6,11 @@ Eine moderne Desktop-App zum Verwalten von Verknüpfungen
 
 import sys
 
-from app import main
+# Zuerst importieren, damit die Zeitmessung beim Prozessstart beginnt
+from utils.startup_trace import startup_trace
+
+with startup_trace.phase("imports"):
+    from app import main
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,210 @@
+import tkinter as tk
+
+import customtkinter as ctk
+
+from ui.drag_engine import FREE_AREA, FREE_TILE_SIZE
+from ui.tile import (
+    ICON_CENTER_Y, NAME_CENTER_Y, TYPE_CENTER,
+    display_name, name_color, show_context_menu, tile_image, tile_signature, type_icon
+)
+from utils.health import health_scanner
+from utils.launcher import launcher
+from utils.theme_manager import ThemeManager
+
+_RADIUS = 4
+
+
+def _round_rect(x0, y0, x1, y1, r):
+    """Eckpunkte eines Rechtecks mit abgerundeten Ecken für create_polygon(smooth=True)"""
+    return (
+        x0 + r, y0, x1 - r, y0, x1, y0, x1, y0 + r,
+        x1, y1 - r, x1, y1, x1 - r, y1, x0 + r, y1,
+        x0, y1, x0, y1 - r, x0, y0 + r, x0, y0,
+    )
+
+
+class CanvasBoard(tk.Canvas):
+    """
+    Freie Fläche als ein einziges Canvas: jede Kachel besteht nur aus
+    Canvas-Items (Rahmen, Icon, Name, Typ) mit dem gemeinsamen Tag "tile" und
+    einem eigenen Tag pro Shortcut. Es gibt einen Satz Bindings für die ganze
+    Fläche, die Kachel unter der Maus wird über die Tags bestimmt. Verschieben
+    ist ein einzelnes move() auf den Tag der Kachel.
+    """
+
+    def __init__(self, master, on_delete, on_edit, on_drag_start, on_drag, on_drag_end, scale=1.0, **kwargs):
+        super().__init__(master, highlightthickness=0, borderwidth=0, **kwargs)
+        self.on_delete = on_delete
+        self.on_edit = on_edit
+        self.on_drag_start = on_drag_start
+        self.on_drag = on_drag
+        self.on_drag_end = on_drag_end
+        self.scale = scale
+        # Tag -> [shortcut, signature, position, border item, PhotoImage]
+        self._tiles = {}
+        self._hover = None
+        self._resize()
+
+        self.bind("<Motion>", self._on_motion)
+        self.bind("<Leave>", lambda e: self._set_hover(None))
+        self.bind("<Button-1>", self._on_press)
+        self.bind("<B1-Motion>", self.on_drag)
+        self.bind("<ButtonRelease-1>", self.on_drag_end)
+        self.bind("<Double-Button-1>", self._on_double_click)
+        self.bind("<Button-3>", self._on_context_menu)
+
+    def __len__(self):
+        return len(self._tiles)
+
+    def _resize(self):
+        size = round(FREE_AREA * self.scale)
+        self.configure(width=size, height=size)
+
+    def set_scale(self, scale):
+        """Neue Widget-Skalierung: Fläche und alle Kacheln neu aufbauen"""
+        if scale == self.scale:
+            return
+        self.scale = scale
+        self._resize()
+        shortcuts = [entry[0] for entry in self._tiles.values()]
+        self.clear()
+        self.set_items(shortcuts)
+
+    # --- Kacheln ---
+
+    def set_items(self, shortcuts):
+        """
+        Gleicht die Kacheln mit shortcuts ab (jeder braucht "x" und "y"):
+        geänderte Kacheln werden neu gezeichnet, verschobene nur bewegt.
+        """
+        stale = dict(self._tiles)
+        for shortcut in shortcuts:
+            tag = self._tag(shortcut)
+            entry = stale.pop(tag, None)
+            position = (shortcut["x"], shortcut["y"])
+            if entry is not None and entry[1] == tile_signature(shortcut):
+                if entry[2] != position:
+                    self.move_tile(shortcut, *position)
+                continue
+            if entry is not None:
+                self.delete(tag)
+            self._draw(shortcut)
+        for tag in stale:
+            self._remove(tag)
+
+    def refresh(self, shortcut):
+        """Zeichnet die Kachel eines Shortcuts neu (z.B. nachgeladenes Icon)"""
+        tag = self._tag(shortcut)
+        if tag in self._tiles:
+            self.delete(tag)
+            self._draw(shortcut)
+
+    def move_tile(self, shortcut, x, y):
+        tag = self._tag(shortcut)
+        entry = self._tiles.get(tag)
+        if entry is None:
+            return
+        old_x, old_y = entry[2]
+        if (x, y) != (old_x, old_y):
+            self.move(tag, (x - old_x) * self.scale, (y - old_y) * self.scale)
+            entry[2] = (x, y)
+
+    def lift_tile(self, shortcut):
+        self.tag_raise(self._tag(shortcut))
+
+    def clear(self):
+        self.delete("tile")
+        self._tiles.clear()
+        self._hover = None
+
+    @staticmethod
+    def _tag(shortcut):
+        return f"s{id(shortcut)}"
+
+    def _remove(self, tag):
+        self.delete(tag)
+        del self._tiles[tag]
+        if self._hover == tag:
+            self._hover = None
+
+    def _font(self, family, size):
+        # Wie customtkinter: negative Größe = Pixel, mit der Widget-Skalierung
+        return (family, -round(size * self.scale))
+
+    def _draw(self, shortcut):
+        tag = self._tag(shortcut)
+        tags = ("tile", tag)
+        s = self.scale
+        x, y = shortcut["x"] * s, shortcut["y"] * s
+        size = FREE_TILE_SIZE * s
+        status = health_scanner.status(shortcut)
+
+        border = self.create_polygon(
+            _round_rect(x, y, x + size, y + size, _RADIUS * s),
+            smooth=True, fill="#2b2b2b", outline="#3d3d3d", width=1, tags=tags
+        )
+
+        photo = None
+        ctk_img = tile_image(shortcut, scale=s)
+        if ctk_img is not None:
+            photo = ctk_img.create_scaled_photo_image(s, ctk.get_appearance_mode().lower())
+            self.create_image(x + size / 2, y + ICON_CENTER_Y * s, image=photo, tags=tags)
+        else:
+            self.create_text(
+                x + size / 2, y + ICON_CENTER_Y * s, text=shortcut.get("icon", "📁"),
+                font=self._font("Segoe UI Emoji", 32), fill="#ffffff", tags=tags
+            )
+
+        self.create_text(
+            x + size / 2, y + NAME_CENTER_Y * s, text=display_name(shortcut),
+            font=self._font("Segoe UI", 11), fill=name_color(status), tags=tags
+        )
+        self.create_text(
+            x + TYPE_CENTER[0] * s, y + TYPE_CENTER[1] * s, text=type_icon(shortcut, status),
+            font=self._font("Segoe UI Emoji", 10), fill="#666666", tags=tags
+        )
+        # PhotoImage festhalten, sonst verschwindet das Icon
+        self._tiles[tag] = [shortcut, tile_signature(shortcut), (shortcut["x"], shortcut["y"]), border, photo]
+        if self._hover == tag:
+            self._hover = None
+            self._set_hover(tag)
+
+    # --- Ereignisse ---
+
+    def _tag_at(self):
+        """Tag der Kachel unter der Maus ("current"), oder None"""
+        for tag in self.gettags("current"):
+            if tag in self._tiles:
+                return tag
+        return None
+
+    def shortcut_at(self):
+        tag = self._tag_at()
+        return self._tiles[tag][0] if tag is not None else None
+
+    def _set_hover(self, tag):
+        if tag == self._hover:
+            return
+        if self._hover in self._tiles:
+            self.itemconfigure(self._tiles[self._hover][3], fill="#2b2b2b", outline="#3d3d3d")
+        self._hover = tag
+        if tag is not None:
+            self.itemconfigure(self._tiles[tag][3], fill="#3d3d3d", outline=ThemeManager.get_color("border"))
+
+    def _on_motion(self, event):
+        self._set_hover(self._tag_at())
+
+    def _on_press(self, event):
+        shortcut = self.shortcut_at()
+        if shortcut is not None:
+            self.on_drag_start(event, shortcut)
+
+    def _on_double_click(self, event):
+        shortcut = self.shortcut_at()
+        if shortcut is not None:
+            launcher.launch(shortcut)
+
+    def _on_context_menu(self, event):
+        shortcut = self.shortcut_at()
+        if shortcut is not None:
+            show_context_menu(self, shortcut, event, self.on_edit, self.on_delete)
@@ -3,6 +3,8 @@ from tkinter import filedialog, messagebox
 from pathlib import Path
 from utils.system_utils import check_autostart, set_autostart
 from utils.theme_manager import ThemeManager
+from utils.folder_scan import DEFAULT_EXCLUDE
+from utils.icon_cache import icon_cache
 
 class EditDialog(ctk.CTkToplevel):
     """Dialog zum Bearbeiten einer Verknüpfung"""
@@ -328,16 +330,102 @@ class AddCategoryDialog(ctk.CTkToplevel):
         self.destroy()
 
 
+class FolderImportDialog(ctk.CTkToplevel):
+    """Dialog zum Importieren eines ganzen Ordners (rekursiv)"""
+    
+    def __init__(self, master, import_callback):
+        super().__init__(master)
+        self.import_callback = import_callback
+        
+        self.title("Ordner importieren")
+        self.geometry("420x340")
+        self.configure(fg_color="#1a1a1a")
+        self.resizable(False, False)
+        
+        self.transient(master)
+        self.wait_visibility()
+        self.grab_set()
+        
+        # Ordner
+        ctk.CTkLabel(self, text="Ordner:", font=("Segoe UI", 12)).pack(pady=(20, 5), padx=20, anchor="w")
+        folder_frame = ctk.CTkFrame(self, fg_color="transparent")
+        folder_frame.pack(fill="x", padx=20)
+        self.folder_entry = ctk.CTkEntry(folder_frame, height=35, placeholder_text="z.B. ~/.local/share/applications")
+        self.folder_entry.pack(side="left", fill="x", expand=True)
+        ctk.CTkButton(
+            folder_frame, text="📂", width=40, height=35,
+            fg_color="#3d3d3d", hover_color="#4d4d4d",
+            command=self._browse
+        ).pack(side="right", padx=(5, 0))
+        
+        # Filter
+        ctk.CTkLabel(self, text="Einschließen (Muster, mit ; getrennt):", font=("Segoe UI", 12)).pack(pady=(10, 5), padx=20, anchor="w")
+        self.include_entry = ctk.CTkEntry(self, width=380, height=35)
+        self.include_entry.insert(0, "*")
+        self.include_entry.pack(padx=20)
+        
+        ctk.CTkLabel(self, text="Ausschließen:", font=("Segoe UI", 12)).pack(pady=(10, 5), padx=20, anchor="w")
+        self.exclude_entry = ctk.CTkEntry(self, width=380, height=35)
+        self.exclude_entry.insert(0, ";".join(DEFAULT_EXCLUDE))
+        self.exclude_entry.pack(padx=20)
+        
+        depth_frame = ctk.CTkFrame(self, fg_color="transparent")
+        depth_frame.pack(fill="x", padx=20, pady=(10, 0))
+        ctk.CTkLabel(depth_frame, text="Maximale Tiefe (leer = unbegrenzt):", font=("Segoe UI", 12)).pack(side="left")
+        self.depth_entry = ctk.CTkEntry(depth_frame, width=60, height=30)
+        self.depth_entry.insert(0, "5")
+        self.depth_entry.pack(side="right")
+        
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.pack(side="bottom", pady=20, fill="x", padx=20)
+        
+        ctk.CTkButton(
+            btn_frame, text="Abbrechen", width=140,
+            fg_color="#3d3d3d", hover_color="#4d4d4d",
+            command=self.destroy
+        ).pack(side="right", padx=5)
+        
+        ctk.CTkButton(
+            btn_frame, text="Importieren", width=140,
+            fg_color="#0078d4", hover_color="#1084d8",
+            command=self._import
+        ).pack(side="right", padx=5)
+    
+    def _browse(self):
+        folder = filedialog.askdirectory(title="Ordner auswählen", parent=self)
+        if folder:
+            self.folder_entry.delete(0, "end")
+            self.folder_entry.insert(0, folder)
+    
+    def _import(self):
+        import os
+        folder = os.path.expanduser(self.folder_entry.get().strip())
+        if not folder or not os.path.isdir(folder):
+            messagebox.showwarning("Fehler", "Bitte einen vorhandenen Ordner angeben!")
+            return
+        
+        depth_text = self.depth_entry.get().strip()
+        if depth_text and not depth_text.isdigit():
+            messagebox.showwarning("Fehler", "Die Tiefe muss eine Zahl sein!")
+            return
+        
+        include = self.include_entry.get().split(";")
+        exclude = self.exclude_entry.get().split(";")
+        self.import_callback(folder, include, exclude, int(depth_text) if depth_text else None)
+        self.destroy()
+
+
 class SettingsDialog(ctk.CTkToplevel):
     """Dialog für Einstellungen"""
     
-    def __init__(self, master, current_settings, save_callback):
+    def __init__(self, master, current_settings, save_callback, categories=None):
         super().__init__(master)
         self.settings = current_settings
         self.save_callback = save_callback
+        self.categories = categories
         
         self.title("Einstellungen")
-        self.geometry("400x580") # Increased height
+        self.geometry("400x800") # Increased height
         self.configure(fg_color="#1a1a1a")
         self.resizable(False, False)
         
@@ -387,6 +475,16 @@ class SettingsDialog(ctk.CTkToplevel):
             font=("Segoe UI", 10),
             text_color="gray"
         ).pack(padx=45, pady=0, anchor="w")
+        
+        self.snap_var = ctk.BooleanVar(value=self.settings.get("snap_to_grid", False))
+        
+        self.snap_switch = ctk.CTkSwitch(
+            self,
+            text="Am Raster einrasten",
+            variable=self.snap_var,
+            font=("Segoe UI", 12)
+        )
+        self.snap_switch.pack(padx=20, pady=5, anchor="w")
 
         # Themes (Akzentfarbe)
         ctk.CTkLabel(self, text="Design", font=("Segoe UI", 14, "bold")).pack(pady=(15, 10), padx=20, anchor="w")
@@ -408,6 +506,16 @@ class SettingsDialog(ctk.CTkToplevel):
             font=("Segoe UI", 10),
             text_color="gray"
         ).pack(padx=20, pady=0, anchor="w")
+        
+        self.light_tiles_var = ctk.BooleanVar(value=self.settings.get("tile_style", "ctk") == "light")
+        
+        self.light_switch = ctk.CTkSwitch(
+            self,
+            text="Leichte Kacheln (schneller bei vielen Verknüpfungen)",
+            variable=self.light_tiles_var,
+            font=("Segoe UI", 12)
+        )
+        self.light_switch.pack(padx=20, pady=(10, 5), anchor="w")
 
         # Always On Top für QuickLaunch
         ctk.CTkLabel(self, text="Fenster Verhalten", font=("Segoe UI", 14, "bold")).pack(pady=(15, 10), padx=20, anchor="w")
@@ -433,6 +541,44 @@ class SettingsDialog(ctk.CTkToplevel):
         )
         self.as_switch.pack(padx=20, pady=10, anchor="w")
         
+        # Speicher-Backend, wirksam ab dem nächsten Start (dann wird migriert)
+        self.sqlite_var = ctk.BooleanVar(value=self.settings.get("storage_backend", "json") == "sqlite")
+        
+        self.sqlite_switch = ctk.CTkSwitch(
+            self,
+            text="Konfiguration in SQLite (ab nächstem Start)",
+            variable=self.sqlite_var,
+            font=("Segoe UI", 12)
+        )
+        self.sqlite_switch.pack(padx=20, pady=5, anchor="w")
+        
+        # Icon-Cache: Größe und Aufräumen
+        ctk.CTkLabel(self, text="Icon-Cache", font=("Segoe UI", 14, "bold")).pack(pady=(15, 10), padx=20, anchor="w")
+        
+        cache_frame = ctk.CTkFrame(self, fg_color="transparent")
+        cache_frame.pack(fill="x", padx=20, pady=5)
+        
+        self.cache_label = ctk.CTkLabel(
+            cache_frame,
+            text=icon_cache.summary(),
+            font=("Segoe UI", 11),
+            text_color="gray",
+            justify="left"
+        )
+        self.cache_label.pack(side="left")
+        
+        self.cache_btn = ctk.CTkButton(
+            cache_frame, text="Aufräumen", width=90,
+            fg_color="#3d3d3d", hover_color="#4d4d4d",
+            command=self._collect_icons,
+            state="normal" if categories is not None else "disabled"
+        )
+        self.cache_btn.pack(side="right")
+        
+        # Noch keine Zahlen -> einmal im Hintergrund ermitteln
+        if icon_cache.stats.collected_at is None and categories is not None:
+            self._collect_icons()
+        
         # Buttons
         btn_frame = ctk.CTkFrame(self, fg_color="transparent")
         btn_frame.pack(side="bottom", pady=20, fill="x", padx=20)
@@ -453,11 +599,22 @@ class SettingsDialog(ctk.CTkToplevel):
     def _update_col_label(self, value):
         self.col_label.configure(text=str(int(value)))
         
+    def _collect_icons(self):
+        self.cache_label.configure(text="Wird geprüft...")
+        icon_cache.collect_async(self.categories, on_done=self._on_icons_collected)
+        
+    def _on_icons_collected(self, stats):
+        if self.winfo_exists():
+            self.cache_label.configure(text=icon_cache.summary())
+        
     def _save(self):
         self.settings["columns"] = int(self.columns_var.get())
         self.settings["free_placement"] = self.free_placement_var.get()
+        self.settings["snap_to_grid"] = self.snap_var.get()
         self.settings["quicklaunch_always_on_top"] = self.always_on_top_var.get()
         self.settings["accent_color"] = self.accent_var.get()
+        self.settings["tile_style"] = "light" if self.light_tiles_var.get() else "ctk"
+        self.settings["storage_backend"] = "sqlite" if self.sqlite_var.get() else "json"
         
         # Apply Autostart immediately
         set_autostart(self.autostart_var.get())
@@ -0,0 +1,147 @@
+from utils.spatial_hash import SpatialHash
+
+# Eine Platzierung pro Frame (~60 fps), egal wie viele Motion-Events kommen
+FRAME_MS = 16
+DRAG_THRESHOLD = 3
+
+# Kachelmaße im freien Modus
+FREE_TILE_SIZE = 100
+FREE_SLOT = 116     # Kachel + Abstand, Rasterweite beim Einrasten
+FREE_ORIGIN = 10
+FREE_AREA = 2000    # Größe der freien Fläche
+# Feinsuche nach einem freien Platz ohne Einrasten: Schritt und Reichweite
+FREE_NUDGE = 10
+NUDGE_RINGS = 3 * FREE_SLOT // FREE_NUDGE
+
+
+class DragEngine:
+    """
+    Verschieben von Kacheln im freien Modus, unabhängig vom Renderer.
+    Motion-Events werden gesammelt und höchstens einmal pro Frame als
+    on_move(item, x, y) ausgegeben. Beim Loslassen wird optional am Raster
+    eingerastet und bei Überlappung der nächste freie Platz gesucht
+    (SpatialHash), dann folgt on_drop(item, x, y).
+    """
+
+    def __init__(self, widget, on_move, on_drop, snap=False):
+        self.widget = widget
+        self.on_move = on_move
+        self.on_drop = on_drop
+        self.snap = snap
+        self.scale = 1.0  # Widget-Skalierung: Bildschirmpixel je Einheit
+        self.index = SpatialHash(cell_size=FREE_SLOT)
+        self.moves = 0   # ausgeführte Platzierungen
+        self.events = 0  # empfangene Motion-Events
+        self._item = None
+        self._key = None
+        self._start = (0, 0)
+        self._origin = (0, 0)
+        self._pointer = None
+        self._moved = False
+        self._job = None
+
+    @property
+    def active(self):
+        return self._item is not None
+
+    # --- Belegung ---
+
+    def place(self, key, x, y):
+        self.index.insert(key, x, y, FREE_TILE_SIZE, FREE_TILE_SIZE)
+
+    def forget(self, key):
+        self.index.remove(key)
+
+    def free_slot(self, x, y, key=None, fine=False):
+        """
+        Nächster freie Platz für eine Kachel in der Nähe von (x, y). fine sucht
+        ohne Einrasten erst pixelgenau im Umkreis, sonst auf den Rasterplätzen.
+        """
+        if fine and not self.snap:
+            spot = self.index.nearest_free(
+                x, y, FREE_TILE_SIZE, FREE_TILE_SIZE, FREE_NUDGE,
+                bounds=(FREE_AREA, FREE_AREA), exclude=key, max_rings=NUDGE_RINGS
+            )
+            if spot is not None:
+                return spot
+        spot = self.index.nearest_free(
+            x, y, FREE_TILE_SIZE, FREE_TILE_SIZE, FREE_SLOT,
+            bounds=(FREE_AREA, FREE_AREA), origin=(FREE_ORIGIN, FREE_ORIGIN),
+            exclude=key, max_rings=FREE_AREA // FREE_SLOT
+        )
+        # Fläche voll -> an der gewünschten Stelle überlappen lassen
+        return spot if spot is not None else (x, y)
+
+    def snap_position(self, x, y):
+        if not self.snap:
+            return x, y
+        col = max(0, round((x - FREE_ORIGIN) / FREE_SLOT))
+        row = max(0, round((y - FREE_ORIGIN) / FREE_SLOT))
+        return FREE_ORIGIN + col * FREE_SLOT, FREE_ORIGIN + row * FREE_SLOT
+
+    # --- Ziehen ---
+
+    def start(self, item, key, event, origin):
+        """Beginnt das Ziehen von item (Position origin) an der Mausposition von event"""
+        self.cancel()
+        self._item = item
+        self._key = key
+        self._start = (event.x_root, event.y_root)
+        self._origin = origin
+        self._pointer = None
+        self._moved = False
+
+    def motion(self, event):
+        if self._item is None:
+            return
+        self.events += 1
+        dx = event.x_root - self._start[0]
+        dy = event.y_root - self._start[1]
+        if not self._moved:
+            # Klick vs. Ziehen
+            if abs(dx) <= DRAG_THRESHOLD and abs(dy) <= DRAG_THRESHOLD:
+                return
+            self._moved = True
+        self._pointer = (dx, dy)
+        if self._job is None:
+            self._job = self.widget.after(FRAME_MS, self._flush)
+
+    def _position(self):
+        dx, dy = self._pointer
+        dx, dy = dx / self.scale, dy / self.scale
+        limit = FREE_AREA - FREE_TILE_SIZE
+        x = min(limit, max(0, round(self._origin[0] + dx)))
+        y = min(limit, max(0, round(self._origin[1] + dy)))
+        return x, y
+
+    def _flush(self):
+        self._job = None
+        if self._item is None or self._pointer is None:
+            return
+        self.moves += 1
+        self.on_move(self._item, *self._position())
+
+    def end(self, event=None):
+        """Beendet das Ziehen. Gibt True zurück, wenn die Kachel bewegt wurde."""
+        item, key, moved = self._item, self._key, self._moved
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        if item is not None and moved and self._pointer is not None:
+            x, y = self.snap_position(*self._position())
+            if self.index.collides(x, y, FREE_TILE_SIZE, FREE_TILE_SIZE, exclude=key):
+                x, y = self.free_slot(x, y, key=key, fine=True)
+            self.place(key, x, y)
+            self.on_drop(item, x, y)
+        self._item = None
+        self._key = None
+        self._pointer = None
+        return moved
+
+    def cancel(self):
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        self._item = None
+        self._key = None
+        self._pointer = None
@@ -0,0 +1,38 @@
+import customtkinter as ctk
+
+from utils.theme_manager import ThemeManager
+
+
+class ImportProgress(ctk.CTkFrame):
+    """Fortschrittsanzeige mit Abbrechen-Button für längere Importe"""
+
+    def __init__(self, master, on_cancel, **kwargs):
+        super().__init__(master, **kwargs)
+        self.configure(fg_color="#2b2b2b", corner_radius=8, border_width=1, border_color="#3d3d3d")
+
+        self.label = ctk.CTkLabel(self, text="Importiere…", font=("Segoe UI", 11), text_color="#cccccc")
+        self.label.pack(side="left", padx=(12, 8), pady=8)
+
+        self.bar = ctk.CTkProgressBar(self, width=180, progress_color=ThemeManager.get_color("primary"))
+        self.bar.set(0)
+        self.bar.pack(side="left", padx=8, pady=8)
+
+        self.cancel_btn = ctk.CTkButton(
+            self,
+            text="Abbrechen",
+            width=90,
+            height=26,
+            font=("Segoe UI", 11),
+            fg_color="#3d3d3d",
+            hover_color="#4d4d4d",
+            command=on_cancel
+        )
+        self.cancel_btn.pack(side="left", padx=(8, 12), pady=8)
+
+    def update_progress(self, done, total, text=None):
+        """total=None zeigt eine unbestimmte Anzeige (Gesamtzahl noch unbekannt)"""
+        if total:
+            self.bar.set(done / total)
+            self.label.configure(text=text or f"Importiere {done} von {total}…")
+        else:
+            self.label.configure(text=text or f"Importiere… {done}")
@@ -0,0 +1,136 @@
+import tkinter as tk
+import tkinter.font as tkfont
+
+import customtkinter as ctk
+
+from ui.tile import (
+    ICON_CENTER_Y, NAME_CENTER_Y, TILE_SIZE, TYPE_CENTER,
+    display_name, name_color, show_context_menu, tile_image, type_icon
+)
+from utils.health import health_scanner
+from utils.launcher import launcher
+from utils.theme_manager import ThemeManager
+
+# Bindtag aller Teile einer LightTile; die Handler hängen einmal an der Klasse
+_BINDTAG = "QuickLaunchTile"
+# (Interpreter, Familie, Größe, Skalierung) -> tkfont.Font, von allen Kacheln geteilt
+_FONTS = {}
+
+
+def _font(widget, family, size, scale):
+    key = (widget.tk, family, size, scale)
+    font = _FONTS.get(key)
+    if font is None:
+        # Wie customtkinter: negative Größe = Pixel, mit der Widget-Skalierung
+        font = _FONTS[key] = tkfont.Font(root=widget, family=family, size=-round(size * scale))
+    return font
+
+
+def _tile_of(widget):
+    while widget is not None and not isinstance(widget, LightTile):
+        widget = getattr(widget, "master", None)
+    return widget
+
+
+class LightTile(tk.Frame):
+    """
+    Kachel wie ShortcutTile, aber aus reinen Tk-Widgets (ein Frame, drei
+    Labels statt CTk-Widgets mit je eigenem Canvas). Schriften und Bilder
+    werden geteilt, die Ereignisse hängen per bind_class an einem
+    gemeinsamen Bindtag statt an jeder Kachel.
+    """
+
+    def __init__(self, master, shortcut_data, on_delete, on_edit, scale=1.0, **kwargs):
+        self.scale = scale
+        size = round(TILE_SIZE * scale)
+        super().__init__(
+            master, width=size, height=size, bg="#2b2b2b",
+            highlightthickness=1, highlightbackground="#3d3d3d", highlightcolor="#3d3d3d",
+            **kwargs
+        )
+        self.shortcut_data = shortcut_data
+        self.on_delete = on_delete
+        self.on_edit = on_edit
+        self._photo = None
+        self._bind_class()
+
+        self.icon_label = tk.Label(self, bg="#2b2b2b", fg="#ffffff", bd=0)
+        self.name_label = tk.Label(self, bg="#2b2b2b", bd=0, font=_font(self, "Segoe UI", 11, scale))
+        self.type_label = tk.Label(self, bg="#2b2b2b", fg="#666666", bd=0, font=_font(self, "Segoe UI Emoji", 10, scale))
+        self.icon_label.place(relx=0.5, y=round(ICON_CENTER_Y * scale), anchor="center")
+        self.name_label.place(relx=0.5, y=round(NAME_CENTER_Y * scale), anchor="center")
+        self.type_label.place(x=round(TYPE_CENTER[0] * scale), y=round(TYPE_CENTER[1] * scale), anchor="center")
+        for widget in (self, self.icon_label, self.name_label, self.type_label):
+            widget.bindtags((_BINDTAG,) + widget.bindtags())
+        self.set_shortcut(shortcut_data)
+
+    def _bind_class(self):
+        if self.bind_class(_BINDTAG):
+            return
+        self.bind_class(_BINDTAG, "<Enter>", LightTile._on_enter)
+        self.bind_class(_BINDTAG, "<Leave>", LightTile._on_leave)
+        self.bind_class(_BINDTAG, "<Double-Button-1>", lambda e: _tile_of(e.widget).launch())
+        self.bind_class(_BINDTAG, "<Button-3>", lambda e: _tile_of(e.widget)._show_context_menu(e))
+
+    # Positionen wie bei CTk-Widgets in unskalierten Einheiten angeben
+
+    def place(self, **kwargs):
+        for key in ("x", "y"):
+            if key in kwargs:
+                kwargs[key] = round(kwargs[key] * self.scale)
+        super().place(**kwargs)
+
+    def grid(self, **kwargs):
+        for key in ("padx", "pady"):
+            if key in kwargs:
+                kwargs[key] = round(kwargs[key] * self.scale)
+        super().grid(**kwargs)
+
+    def set_shortcut(self, shortcut_data):
+        """Zeigt einen anderen Shortcut an (Wiederverwendung aus einem Tile-Pool)"""
+        self.shortcut_data = shortcut_data
+        status = health_scanner.status(shortcut_data)
+
+        ctk_img = tile_image(shortcut_data, scale=self.scale)
+        if ctk_img is not None:
+            # Die PhotoImage gehört dem gecachten CTkImage und wird geteilt
+            self._photo = ctk_img.create_scaled_photo_image(self.scale, ctk.get_appearance_mode().lower())
+            self.icon_label.configure(image=self._photo, text="")
+        else:
+            self._photo = None
+            self.icon_label.configure(
+                image="", text=shortcut_data.get("icon", "📁"),
+                font=_font(self, "Segoe UI Emoji", 32, self.scale)
+            )
+        self.name_label.configure(text=display_name(shortcut_data), fg=name_color(status))
+        self.type_label.configure(text=type_icon(shortcut_data, status))
+
+    def _set_colors(self, bg, border):
+        self.configure(bg=bg, highlightbackground=border, highlightcolor=border)
+        for label in (self.icon_label, self.name_label, self.type_label):
+            label.configure(bg=bg)
+
+    @staticmethod
+    def _on_enter(event):
+        tile = _tile_of(event.widget)
+        tile._set_colors("#3d3d3d", ThemeManager.get_color("border"))
+
+    @staticmethod
+    def _on_leave(event):
+        tile = _tile_of(event.widget)
+        # Wechsel zwischen Frame und eigenen Labels ist kein Verlassen der Kachel
+        try:
+            inside = tile.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            # Widget außerhalb von tkinter (z.B. Menü)
+            inside = None
+        if _tile_of(inside) is tile:
+            return
+        tile._set_colors("#2b2b2b", "#3d3d3d")
+
+    def launch(self, event=None):
+        """Startet die Verknüpfung (im Hintergrund, Fehler landen in der Statusleiste)"""
+        launcher.launch(self.shortcut_data)
+
+    def _show_context_menu(self, event):
+        show_context_menu(self, self.shortcut_data, event, self.on_edit, self.on_delete)
@@ -0,0 +1,90 @@
+import customtkinter as ctk
+
+from ui.tile import ShortcutTile, tile_signature
+
+
+class SearchResultsView(ctk.CTkFrame):
+    """Globale Suchergebnisse über alle Kategorien in einer Ansicht"""
+
+    MAX_TILES = 60
+
+    def __init__(self, master, on_delete, on_edit, **kwargs):
+        super().__init__(master, **kwargs)
+        self.on_delete = on_delete
+        self.on_edit = on_edit
+        # id(shortcut) -> (tile, signature, position), wie im CategoryTab
+        self._tile_state = {}
+
+        self.configure(fg_color="transparent")
+
+        self.header_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=("Segoe UI", 12),
+            text_color="#999999",
+            anchor="w"
+        )
+        self.header_label.pack(fill="x", padx=15, pady=(5, 0))
+
+        self.scroll_frame = ctk.CTkScrollableFrame(
+            self,
+            fg_color="transparent",
+            scrollbar_button_color="#3d3d3d",
+            scrollbar_button_hover_color="#4d4d4d"
+        )
+        self.scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self.grid_frame = ctk.CTkFrame(self.scroll_frame, fg_color="transparent")
+        self.grid_frame.pack(fill="both", expand=True)
+
+    def show_results(self, query, results, columns, limit=None):
+        """
+        results: Liste von (shortcut, category) in Anzeigereihenfolge.
+        limit: Obergrenze, mit der gesucht wurde; ist sie erreicht, kann es
+        mehr Treffer geben als results enthält.
+        """
+        shown = results[:self.MAX_TILES]
+
+        if not results:
+            header = f"Keine Treffer für „{query}“"
+        elif limit is not None and len(results) >= limit:
+            header = f"Zeige {len(shown)} von mindestens {len(results)} Treffern für „{query}“"
+        elif len(results) > len(shown):
+            header = f"Zeige {len(shown)} von {len(results)} Treffern für „{query}“"
+        else:
+            categories = {category["name"] for _, category in results}
+            header = f"{len(results)} Treffer für „{query}“ in {len(categories)} Kategorie(n)"
+        self.show_items(header, results, columns)
+
+    def show_items(self, header, results, columns):
+        """Zeigt beliebige (shortcut, category)-Paare mit eigener Überschrift an"""
+        shown = results[:self.MAX_TILES]
+        self.header_label.configure(text=header)
+
+        new_state = {}
+        for i, (shortcut, _) in enumerate(shown):
+            key = id(shortcut)
+            signature = tile_signature(shortcut)
+            tile, old_signature, position = self._tile_state.pop(key, (None, None, None))
+
+            if tile is not None and old_signature != signature:
+                tile.set_shortcut(shortcut)
+            if tile is None:
+                tile = ShortcutTile(
+                    self.grid_frame,
+                    shortcut,
+                    on_delete=self.on_delete,
+                    on_edit=self.on_edit,
+                    width=100,
+                    height=100
+                )
+                position = None
+
+            new_position = (i // columns, i % columns)
+            if position != new_position:
+                tile.grid(row=new_position[0], column=new_position[1], padx=8, pady=8, sticky="nsew")
+            new_state[key] = (tile, signature, new_position)
+
+        for tile, _, _ in self._tile_state.values():
+            tile.destroy()
+        self._tile_state = new_state
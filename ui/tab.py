@@ -1,13 +1,105 @@
 import customtkinter as ctk
+import tkinter as tk
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from pathlib import Path
 from tkinterdnd2 import DND_FILES
 
-from ui.tile import ShortcutTile
+from ui.tile import ShortcutTile, tile_signature
+from ui.light_tile import LightTile
+from ui.virtual_grid import VirtualTileGrid
+from ui.canvas_board import CanvasBoard
+from ui.drag_engine import DragEngine, FREE_ORIGIN, FREE_SLOT
 from ui.dialogs import EditDialog
-from utils.icon_utils import get_file_icon_path
+from ui.import_progress import ImportProgress
+from utils.dispatch import dispatcher
+from utils.folder_scan import scan_folder, next_chunk
+from utils.health import health_scanner, is_extracted, STALE
+from utils.icon_worker import icon_resolver
+from utils.search_index import search_index
+from utils.xdg_icons import parse_desktop_file
 from config import ICONS_DIR
 
+# Zeitbudget pro Import-Schritt, danach kommt die Ereignisschleife wieder dran
+IMPORT_STEP_BUDGET = 0.015
+# Ordner-Import: neu gefundene Einträge höchstens so oft anzeigen
+FOLDER_RENDER_INTERVAL = 0.25
+
+_SUFFIX_ICONS = {}
+for _suffixes, _icon in (
+    (['.exe', '.msi'], "⚙️"),
+    (['.lnk'], "🔗"),
+    (['.desktop'], "🚀"),
+    (['.txt', '.doc', '.docx', '.pdf'], "📄"),
+    (['.jpg', '.png', '.gif', '.bmp', '.jpeg'], "🖼️"),
+    (['.mp3', '.wav', '.flac', '.ogg'], "🎵"),
+    (['.mp4', '.avi', '.mkv', '.mov'], "🎬"),
+    (['.zip', '.rar', '.7z'], "📦"),
+    (['.py', '.js', '.html', '.css', '.json', '.xml', '.yaml', '.yml'], "💻"),
+):
+    for _suffix in _suffixes:
+        _SUFFIX_ICONS[_suffix] = _icon
+
+def _shortcut_from_path(file_path, is_dir=None):
+    """Baut den Shortcut für einen Dateipfad; is_dir spart den stat, wenn bekannt"""
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+    if is_dir is None:
+        is_dir = suffix not in _SUFFIX_ICONS and path.is_dir()
+    name = path.name if is_dir else path.stem
+    if suffix == ".desktop" and not is_dir:
+        # Anzeigename aus der Desktop-Datei statt "org.gnome.Foo"
+        entry = parse_desktop_file(str(path))
+        if entry and entry["name"]:
+            name = entry["name"]
+    
+    # Icon basierend auf Dateityp
+    if suffix in _SUFFIX_ICONS and not is_dir:
+        icon = _SUFFIX_ICONS[suffix]
+    elif is_dir:
+        icon = "📁"
+    else:
+        icon = "📄"
+    
+    # Das Bild-Icon wird beim Rendern im Hintergrund ermittelt
+    return {
+        "name": name,
+        "path": str(path),
+        "type": "file",
+        "icon": icon,
+        "image_path": None
+    }
+
+# Bereits neu angeforderte veraltete Icons, nicht bei jedem Rendern erneut
+_refreshed_icons = set()
+
+class _ImportBatch:
+    __slots__ = ("paths", "pos", "added", "cancelled")
+    
+    def __init__(self, paths):
+        self.paths = paths
+        self.pos = 0
+        self.added = 0
+        self.cancelled = False
+    
+    def close(self):
+        pass
+
+class _FolderImport:
+    """Ordner-Import: der Verzeichnis-Generator läuft in einem eigenen Worker-Thread"""
+    __slots__ = ("paths", "executor", "added", "cancelled", "rendered_at")
+    
+    def __init__(self, paths):
+        self.paths = paths
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="folder-scan")
+        self.added = 0
+        self.cancelled = False
+        self.rendered_at = time.perf_counter()
+    
+    def close(self):
+        self.executor.shutdown(wait=False)
+
 class CategoryTab(ctk.CTkFrame):
     """Tab-Inhalt für eine Kategorie"""
     
@@ -17,14 +109,27 @@ class CategoryTab(ctk.CTkFrame):
         self.settings = settings
         self.save_callback = save_callback
         self.tiles = []
-        self.drag_data = {"item": None, "x": 0, "y": 0}
+        # id(shortcut) -> (tile, signature, position) für inkrementelles Rendern
+        self._tile_state = {}
+        self._empty_label = None
+        self._mode = None # "grid", "free" oder "virtual"
+        self.virtual_grid = None
+        self.board = None # Canvas der freien Platzierung
+        self._tile_style = settings.get("tile_style")
+        # Ziehen im freien Modus: ein place() pro Frame, Kollisionen über SpatialHash
+        self.drag_engine = DragEngine(
+            self, on_move=self._on_drag_move, on_drop=self._on_drag_drop,
+            snap=settings.get("snap_to_grid", False)
+        )
+        self._import = None
+        self._import_progress = None
         
         self.configure(fg_color="transparent")
         
-        # Drag & Drop - verzögert registrieren
-        self.after(200, self._setup_dnd)
+        self._build_ui()
         
-    def _setup_dnd(self):
+    def register_dnd(self):
+        """Registriert den Tab als Drop-Ziel; die App ruft das auf, sobald tkdnd geladen ist"""
         try:
             # winfo_toplevel() returns the main window (QuickLaunchApp)
             if getattr(self.winfo_toplevel(), "dnd_enabled", False):
@@ -35,6 +140,7 @@ class CategoryTab(ctk.CTkFrame):
         except Exception as e:
             print(f"DnD setup failed in CategoryTab: {e}")
         
+    def _build_ui(self):
         # Scrollbarer Bereich
         self.scroll_frame = ctk.CTkScrollableFrame(
             self,
@@ -48,212 +154,405 @@ class CategoryTab(ctk.CTkFrame):
         self.grid_frame = ctk.CTkFrame(self.scroll_frame, fg_color="transparent")
         self.grid_frame.pack(fill="both", expand=True)
         
-        self.current_filter = ""
-        self._render_tiles()
-    
-    def set_filter(self, query):
-        self.current_filter = query.lower()
         self._render_tiles()
         
     def update_settings(self, new_settings):
+        if new_settings.get("tile_style") != self._tile_style:
+            # Andere Kachel-Klasse -> alle Kacheln (auch den Pool) neu bauen
+            self._clear_tiles()
+            if self.virtual_grid is not None:
+                self.virtual_grid.clear()
+            self._mode = None
+            self._tile_style = new_settings.get("tile_style")
         self.settings = new_settings
+        self.drag_engine.snap = new_settings.get("snap_to_grid", False)
         self._render_tiles()
 
     def _render_tiles(self):
-        # Alte Tiles entfernen
-        for tile in self.tiles:
-            tile.destroy()
-        self.tiles.clear()
-        
-        # Alle Widgets im Grid entfernen
-        for widget in self.grid_frame.winfo_children():
-            widget.destroy()
-        
-        all_shortcuts = self.category_data.get("shortcuts", [])
-        
-        # Filter Logic
-        if self.current_filter:
-            shortcuts = [s for s in all_shortcuts if self.current_filter in s.get("name", "").lower()]
-        else:
-            shortcuts = all_shortcuts
-            
+        """Gleicht die Kacheln mit den Daten ab (nur Änderungen werden neu gebaut)"""
+        shortcuts = self.category_data.get("shortcuts", [])
         columns = self.settings.get("columns", 4)
         free_mode = self.settings.get("free_placement", False)
-        tile_size = 116 # Approximate size (100 width + padding)
         
         updated = False
         
+        # Ab einer bestimmten Größe nur noch sichtbare Zeilen rendern
+        virtual_threshold = max(1, self.settings.get("virtual_grid_threshold", 300))
         if free_mode:
-            self.grid_frame.configure(height=2000, width=2000)
+            mode = "free"
+        elif len(shortcuts) >= virtual_threshold:
+            mode = "virtual"
         else:
-            self.grid_frame.configure(height=0, width=0) # Auto height
-
-        for i, shortcut in enumerate(shortcuts):
-            # Versuchen Icon zu laden wenn gefehlt
-            if shortcut.get("type") == "file" and not shortcut.get("image_path"):
-                try:
-                    icon_path = get_file_icon_path(shortcut["path"], str(ICONS_DIR))
-                    if icon_path:
-                        shortcut["image_path"] = icon_path
-                        updated = True
-                except Exception:
-                    pass
+            mode = "grid"
+        
+        if mode != self._mode:
+            self._switch_mode(mode)
 
-            tile = ShortcutTile(
-                self.grid_frame,
-                shortcut,
-                on_delete=self._delete_shortcut,
-                on_edit=self._edit_shortcut,
-                width=100,
-                height=100
-            )
-            
-            if free_mode:
-                # Default Position berechnen falls nicht vorhanden
-                if "x" not in shortcut or "y" not in shortcut:
-                    row = i // columns
-                    col = i % columns
-                    shortcut["x"] = col * tile_size + 10
-                    shortcut["y"] = row * tile_size + 10
-                    updated = True
-                
-                tile.place(x=shortcut["x"], y=shortcut["y"])
-                
-                # Drag Bindings (nur im Free Mode)
-                # Apply to tile and all children to ensure consistent drag behavior
-                # and to "override" or intercept the default click behavior
-                
-                start_cmd = lambda e, s=shortcut, t=tile: self._start_drag(e, s, t)
-                
-                targets = [tile, tile.icon_label, tile.name_label, tile.type_label]
-                for target in targets:
-                    if target:
-                        target.bind("<Button-1>", start_cmd)
-                        target.bind("<B1-Motion>", self._drag)
-                        target.bind("<ButtonRelease-1>", self._end_drag)
+        if mode == "virtual":
+            # Icons lädt _on_visible_range nur für die sichtbaren Zeilen
+            self.virtual_grid.set_items(shortcuts, columns)
+            return
 
-                # Warnung: tile.bind override könnte Kontextmenü (Rechtsklick) beeinträchtigen
-                # ShortcutTile macht self.bind("<Button-3>", ...)
-                # Grid/Place beeinflusst das nicht. Wir binden nur Left Click neu.
+        if free_mode:
+            # Kacheln als Items auf einem Canvas statt als Widgets
+            updated = self._place_free(shortcuts, columns)
+            self.board.set_scale(self._get_widget_scaling())
+            self.board.set_items(shortcuts)
+        else:
+            new_state = {}
+            for i, shortcut in enumerate(shortcuts):
+                key = id(shortcut)
+                signature = tile_signature(shortcut)
+                tile, old_signature, position = self._tile_state.pop(key, (None, None, None))
                 
-            else:
-                row = i // columns
-                col = i % columns
-                tile.grid(row=row, column=col, padx=8, pady=8, sticky="nsew")
+                if tile is not None and old_signature != signature:
+                    # Inhalt geändert (z.B. nach Bearbeiten) -> nur diese Kachel neu bauen
+                    tile.destroy()
+                    tile = None
+                    
+                if tile is None:
+                    tile = self._new_tile(self.grid_frame, shortcut)
+                    position = None
                 
-            self.tiles.append(tile)
+                new_position = (i // columns, i % columns)
+                if position != new_position:
+                    tile.grid(row=new_position[0], column=new_position[1], padx=8, pady=8, sticky="nsew")
+                        
+                new_state[key] = (tile, signature, new_position)
+            
+            # Kacheln, deren Shortcut gelöscht wurde
+            for tile, _, _ in self._tile_state.values():
+                tile.destroy()
+            self._tile_state = new_state
+            self.tiles = [tile for tile, _, _ in new_state.values()]
             
         if updated:
             self.save_callback()
         
+        # Fehlende Icons im Hintergrund laden, Kacheln zeigen bis dahin das Emoji
+        self._request_icons(shortcuts)
+        
         # Leere Nachricht wenn keine Verknüpfungen
-        if not shortcuts:
-            empty_label = ctk.CTkLabel(
-                self.grid_frame,
+        if shortcuts:
+            if self._empty_label is not None:
+                self._empty_label.destroy()
+                self._empty_label = None
+        elif self._empty_label is None:
+            self._empty_label = ctk.CTkLabel(
+                self.board if free_mode else self.grid_frame,
                 text="Klicke auf '+ Hinzufügen' oder '📂 Dateien'\num Verknüpfungen hinzuzufügen",
                 font=("Segoe UI", 14),
                 text_color="#666666"
             )
             if free_mode:
-                empty_label.place(x=50, y=50)
+                self._empty_label.place(x=50, y=50)
             else:
-                empty_label.grid(row=0, column=0, columnspan=4, pady=50)
-    
-    def _start_drag(self, event, shortcut, tile):
-        self.drag_data["item"] = tile
-        self.drag_data["shortcut"] = shortcut
-        self.drag_data["start_x"] = event.x_root
-        self.drag_data["start_y"] = event.y_root
-        # Store initial widget position to calculate offset in _drag
-        self.drag_data["widget_start_x"] = tile.winfo_x()
-        self.drag_data["widget_start_y"] = tile.winfo_y()
-        self.drag_data["did_move"] = False
-        tile.lift() # Nach oben holen
+                self._empty_label.grid(row=0, column=0, columnspan=4, pady=50)
 
-    def _drag(self, event):
-        tile = self.drag_data.get("item")
-        if tile:
-            # Delta berechnen (Screen based to avoid jumping if mouse moves fast)
-            dx = event.x_root - self.drag_data["start_x"]
-            dy = event.y_root - self.drag_data["start_y"]
-            
-            # Check threshold for "Click vs Drag"
-            if not self.drag_data["did_move"]:
-                if abs(dx) > 3 or abs(dy) > 3:
-                     self.drag_data["did_move"] = True
+    def _place_free(self, shortcuts, columns):
+        """
+        Gibt Shortcuts ohne Position den nächsten freien Platz zu ihrer
+        Rasterposition. Gibt True zurück, wenn Positionen vergeben wurden.
+        """
+        # Belegung aller platzierten Kacheln für freie Plätze
+        engine = self.drag_engine
+        engine.index.clear()
+        for shortcut in shortcuts:
+            if "x" in shortcut and "y" in shortcut:
+                engine.place(id(shortcut), shortcut["x"], shortcut["y"])
+        
+        updated = False
+        for i, shortcut in enumerate(shortcuts):
+            if "x" not in shortcut or "y" not in shortcut:
+                row = i // columns
+                col = i % columns
+                x, y = engine.free_slot(col * FREE_SLOT + FREE_ORIGIN, row * FREE_SLOT + FREE_ORIGIN)
+                shortcut["x"] = x
+                shortcut["y"] = y
+                engine.place(id(shortcut), x, y)
+                updated = True
+        return updated
+
+    def _on_visible_range(self, start, end):
+        self._request_icons(self.virtual_grid.items[start:end])
 
-            if self.drag_data["did_move"]:
-                new_x = self.drag_data["widget_start_x"] + dx
-                new_y = self.drag_data["widget_start_y"] + dy
+    def _request_icons(self, shortcuts):
+        waiting = {}
+        refresh = set()  # id() der Shortcuts mit veraltetem extrahiertem Icon
+        resolved = []
+        for shortcut in shortcuts:
+            image_path = shortcut.get("image_path")
+            if image_path:
+                resolved.append(image_path)
+            if shortcut.get("type") != "file" or not shortcut.get("path"):
+                continue
+            if not image_path:
+                waiting.setdefault(shortcut["path"], []).append(shortcut)
+            elif (image_path not in _refreshed_icons and is_extracted(image_path)
+                    and health_scanner.status(shortcut) == STALE):
+                # Ziel wurde geändert -> Icon einmal neu extrahieren (neuer Dateiname)
+                _refreshed_icons.add(image_path)
+                refresh.add(id(shortcut))
+                waiting.setdefault(shortcut["path"], []).append(shortcut)
+        # Vorhandene Icons bekommen ihre vorskalierten Größen im Hintergrund
+        if resolved:
+            icon_resolver.ensure_variants(resolved)
+        if not waiting:
+            return
+        
+        changed = []
+        
+        def on_icon(path, icon_path):
+            for shortcut in waiting[path]:
+                image_path = shortcut.get("image_path")
+                if not image_path or (id(shortcut) in refresh and image_path != icon_path):
+                    shortcut["image_path"] = icon_path
+                    changed.append(shortcut)
+                    self._refresh_tile(shortcut)
+                    
+        def on_complete():
+            # Einmal speichern pro Batch statt pro Icon
+            if changed:
+                self.save_callback()
                 
-                # Begrenzungen (optional)
-                new_x = max(0, new_x)
-                new_y = max(0, new_y)
+        icon_resolver.resolve_batch(waiting, ICONS_DIR, on_icon, on_complete)
+
+    def _refresh_tile(self, shortcut):
+        """Aktualisiert die Kachel eines einzelnen Shortcuts (z.B. nachgeladenes Icon)"""
+        if not self.winfo_exists():
+            return
+        if self._mode == "free":
+            self.board.refresh(shortcut)
+            return
+        key = id(shortcut)
+        entry = self._tile_state.get(key)
+        if entry is not None:
+            tile, _, position = entry
+            tile.set_shortcut(shortcut)
+            self._tile_state[key] = (tile, tile_signature(shortcut), position)
+            self.tiles = [t for t, _, _ in self._tile_state.values()]
+        elif self._mode == "virtual":
+            self.virtual_grid.refresh(shortcut)
+
+    def _switch_mode(self, mode):
+        """Wechselt zwischen Raster, freier Platzierung und virtuellem Raster"""
+        # Geometrie-Manager und Bindings unterscheiden sich je Modus,
+        # daher einmalig alles verwerfen
+        self._clear_tiles()
+        
+        if mode == "virtual":
+            self.scroll_frame.pack_forget()
+            if self.virtual_grid is None:
+                self.virtual_grid = VirtualTileGrid(
+                    self, self._new_tile, on_range_changed=self._on_visible_range
+                )
+            self.virtual_grid.pack(fill="both", expand=True, padx=10, pady=10)
+        else:
+            if self.virtual_grid is not None:
+                self.virtual_grid.clear()
+                self.virtual_grid.pack_forget()
+            if not self.scroll_frame.winfo_manager():
+                self.scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
+            if mode == "free":
+                self.grid_frame.pack_forget()
+                if self.board is None:
+                    self.board = CanvasBoard(
+                        self.scroll_frame,
+                        on_delete=self._delete_shortcut,
+                        on_edit=self._edit_shortcut,
+                        on_drag_start=self._start_drag,
+                        on_drag=self._drag,
+                        on_drag_end=self._end_drag,
+                        scale=self._get_widget_scaling(),
+                        # Hintergrund des scrollbaren Bereichs (fg_color "transparent")
+                        bg=tk.Frame.cget(self.scroll_frame, "bg")
+                    )
+                self.board.pack(anchor="nw")
+            else:
+                if self.board is not None:
+                    self.board.pack_forget()
+                if not self.grid_frame.winfo_manager():
+                    self.grid_frame.pack(fill="both", expand=True)
                 
-                tile.place(x=new_x, y=new_y)
+        self._mode = mode
+
+    def _new_tile(self, parent, shortcut):
+        if self._tile_style == "light":
+            # Reine Tk-Widgets, deutlich schneller aufgebaut als CTk-Widgets
+            return LightTile(
+                parent,
+                shortcut,
+                on_delete=self._delete_shortcut,
+                on_edit=self._edit_shortcut,
+                scale=self._get_widget_scaling()
+            )
+        return ShortcutTile(
+            parent,
+            shortcut,
+            on_delete=self._delete_shortcut,
+            on_edit=self._edit_shortcut,
+            width=100,
+            height=100
+        )
+
+    def _clear_tiles(self):
+        """Entfernt alle Kacheln (z.B. bei Wechsel des Platzierungsmodus)"""
+        for tile, _, _ in self._tile_state.values():
+            tile.destroy()
+        self._tile_state.clear()
+        self.tiles.clear()
+        if self.board is not None:
+            self.board.clear()
+        if self._empty_label is not None:
+            self._empty_label.destroy()
+            self._empty_label = None
+    
+    def _start_drag(self, event, shortcut):
+        # Mausbewegung kommt in Bildschirmpixeln, Positionen sind unskaliert
+        self.drag_engine.scale = self.board.scale
+        self.drag_engine.start(shortcut, id(shortcut), event, (shortcut.get("x", 0), shortcut.get("y", 0)))
+        self.board.lift_tile(shortcut) # Nach oben holen
+
+    def _drag(self, event):
+        self.drag_engine.motion(event)
 
     def _end_drag(self, event):
-        tile = self.drag_data.get("item")
-        shortcut = self.drag_data.get("shortcut")
-        
-        if tile and shortcut:
-            if self.drag_data.get("did_move", False):
-                # Es war ein Drag -> Speichern
-                shortcut["x"] = tile.winfo_x()
-                shortcut["y"] = tile.winfo_y()
-                self.save_callback()
-            # Wenn nicht bewegt (Klick), passiert nichts hier.
-            # Der Launch wird jetzt durch Double-Click im ShortcutTile behandelt.
-            
-        self.drag_data["item"] = None
+        # Ohne Bewegung war es ein Klick; gestartet wird per Doppelklick
+        self.drag_engine.end(event)
+
+    def _on_drag_move(self, shortcut, x, y):
+        self.board.move_tile(shortcut, x, y)
+
+    def _on_drag_drop(self, shortcut, x, y):
+        shortcut["x"] = x
+        shortcut["y"] = y
+        self.board.move_tile(shortcut, x, y)
+        self.save_callback()
     
     def add_shortcut_from_path(self, file_path):
         """Fügt eine Verknüpfung basierend auf einem Dateipfad hinzu"""
-        path = Path(file_path)
-        name = path.stem if path.is_file() else path.name
-        
-        # Icon basierend auf Dateityp
-        suffix = path.suffix.lower()
-        if suffix in ['.exe', '.msi']:
-            icon = "⚙️"
-        elif suffix in ['.lnk']:
-            icon = "🔗"
-        elif path.is_dir():
-            icon = "📁"
-        elif suffix in ['.txt', '.doc', '.docx', '.pdf']:
-            icon = "📄"
-        elif suffix in ['.jpg', '.png', '.gif', '.bmp', '.jpeg']:
-            icon = "🖼️"
-        elif suffix in ['.mp3', '.wav', '.flac', '.ogg']:
-            icon = "🎵"
-        elif suffix in ['.mp4', '.avi', '.mkv', '.mov']:
-            icon = "🎬"
-        elif suffix in ['.zip', '.rar', '.7z']:
-            icon = "📦"
-        elif suffix in ['.py', '.js', '.html', '.css', '.json', '.xml', '.yaml', '.yml']:
-            icon = "💻"
-        else:
-            icon = "📄"
-        
-        # Extract Image Icon
-        image_path = None
-        try:
-            image_path = get_file_icon_path(str(path), str(ICONS_DIR))
-        except Exception:
-            pass
-
-        shortcut = {
-            "name": name,
-            "path": str(path),
-            "type": "file",
-            "icon": icon,
-            "image_path": image_path
-        }
-        
+        shortcut = _shortcut_from_path(file_path)
         self.category_data["shortcuts"].append(shortcut)
+        search_index.add(shortcut, self.category_data)
         self.save_callback()
         self._render_tiles()
     
+    def import_paths(self, paths):
+        """
+        Importiert viele Pfade auf einmal: in Zeitscheiben, mit Fortschritt und
+        Abbrechen, einmal speichern und einmal rendern am Ende. Icons lädt das
+        anschließende Rendern parallel im Hintergrund.
+        """
+        paths = list(dict.fromkeys(str(p) for p in paths))
+        if not paths:
+            return
+        if isinstance(self._import, _ImportBatch):
+            # Läuft schon ein Import -> hinten anhängen
+            self._import.paths.extend(paths)
+            return
+        if self._import is not None:
+            # Ordner-Import läuft noch -> danach übernehmen
+            self.after(200, lambda: self.import_paths(paths))
+            return
+        self._import = _ImportBatch(paths)
+        self._import_step()
+    
+    def _import_step(self):
+        if not self.winfo_exists():
+            return
+        batch = self._import
+        shortcuts = self.category_data["shortcuts"]
+        deadline = time.perf_counter() + IMPORT_STEP_BUDGET
+        
+        while batch.pos < len(batch.paths) and not batch.cancelled:
+            shortcut = _shortcut_from_path(batch.paths[batch.pos])
+            batch.pos += 1
+            shortcuts.append(shortcut)
+            search_index.add(shortcut, self.category_data)
+            batch.added += 1
+            if time.perf_counter() > deadline:
+                break
+        
+        if batch.pos < len(batch.paths) and not batch.cancelled:
+            self._show_import_progress(batch.pos, len(batch.paths))
+            self.after(1, self._import_step)
+            return
+        self._finish_import()
+    
+    def import_folder(self, folder, include=("*",), exclude=(), max_depth=None):
+        """
+        Durchsucht folder im Hintergrund (os.scandir, lazy) und übernimmt die
+        Treffer stückweise, während weiter gesucht wird. Gibt False zurück,
+        wenn bereits ein Import läuft.
+        """
+        if self._import is not None:
+            return False
+        self._import = _FolderImport(scan_folder(folder, include, exclude, max_depth))
+        self._show_import_progress(0, None, "Durchsuche Ordner…")
+        self._request_folder_chunk()
+        return True
+    
+    def _request_folder_chunk(self):
+        batch = self._import
+        dispatcher.submit(
+            batch.executor, next_chunk, batch.paths,
+            on_done=lambda result, error: self._on_folder_chunk(batch, result, error)
+        )
+    
+    def _on_folder_chunk(self, batch, result, error):
+        if batch is not self._import or not self.winfo_exists():
+            batch.close()
+            return
+        if error is not None:
+            print(f"Folder import failed: {error}")
+            self._finish_import()
+            return
+        if batch.cancelled:
+            self._finish_import()
+            return
+        
+        chunk, exhausted = result
+        shortcuts = self.category_data["shortcuts"]
+        for path in chunk:
+            # scandir hat schon zwischen Datei und Ordner unterschieden
+            shortcut = _shortcut_from_path(path, is_dir=False)
+            shortcuts.append(shortcut)
+            search_index.add(shortcut, self.category_data)
+        batch.added += len(chunk)
+        
+        if exhausted:
+            self._finish_import()
+            return
+        
+        self._show_import_progress(batch.added, None)
+        now = time.perf_counter()
+        if now - batch.rendered_at > FOLDER_RENDER_INTERVAL:
+            batch.rendered_at = now
+            self._render_tiles()
+        self._request_folder_chunk()
+    
+    def _finish_import(self):
+        batch = self._import
+        self._import = None
+        batch.close()
+        if self._import_progress is not None:
+            self._import_progress.destroy()
+            self._import_progress = None
+        if batch.added:
+            self.save_callback()
+            self._render_tiles()
+    
+    def _show_import_progress(self, done, total, text=None):
+        if self._import_progress is None:
+            self._import_progress = ImportProgress(self, on_cancel=self.cancel_import)
+            self._import_progress.place(relx=0.5, rely=1.0, y=-12, anchor="s")
+        self._import_progress.update_progress(done, total, text)
+    
+    def cancel_import(self):
+        """Bricht den laufenden Import ab; bereits übernommene Einträge bleiben"""
+        if self._import is not None:
+            self._import.cancelled = True
+    
     def add_url(self, name, url, icon="🌐"):
         """Fügt eine URL-Verknüpfung hinzu"""
         shortcut = {
@@ -263,6 +562,7 @@ class CategoryTab(ctk.CTkFrame):
             "icon": icon
         }
         self.category_data["shortcuts"].append(shortcut)
+        search_index.add(shortcut, self.category_data)
         self.save_callback()
         self._render_tiles()
     
@@ -272,13 +572,17 @@ class CategoryTab(ctk.CTkFrame):
             # TkinterDnD liefert Pfade als String, getrennt durch Leerzeichen.
             # Pfade mit Leerzeichen sind in {} eingeschlossen.
             files = self.tk.splitlist(event.data)
-            for file_path in files:
-                self.add_shortcut_from_path(file_path)
+            self.import_paths(files)
     
     def _delete_shortcut(self, shortcut_data):
         self.category_data["shortcuts"].remove(shortcut_data)
+        search_index.remove(shortcut_data)
         self.save_callback()
         self._render_tiles()
     
     def _edit_shortcut(self, shortcut_data):
-        EditDialog(self, shortcut_data, self.save_callback, self._render_tiles)
+        EditDialog(self, shortcut_data, self.save_callback, lambda: self._on_shortcut_edited(shortcut_data))
+
+    def _on_shortcut_edited(self, shortcut_data):
+        search_index.update(shortcut_data)
+        self._render_tiles()
@@ -1,14 +1,79 @@
 import customtkinter as ctk
 import tkinter as tk
-from tkinter import messagebox
-import webbrowser
-import sys
-import os
-import subprocess
 
-from PIL import Image
+from utils.health import health_scanner, MISSING, STALE
+from utils.icon_variants import ICON_SIZE
+from utils.image_cache import image_cache
+from utils.launcher import launcher
 from utils.theme_manager import ThemeManager
 
+TILE_SIZE = 100
+# Mittelpunkte der Elemente in der Kachel (unskaliert), für Kacheln ohne CTk-Layout
+ICON_CENTER_Y = 35
+NAME_CENTER_Y = 74
+TYPE_CENTER = (90, 10)
+
+def tile_signature(shortcut):
+    """Alle Felder, die das Aussehen einer Kachel bestimmen"""
+    return (
+        shortcut.get("name"),
+        shortcut.get("icon"),
+        shortcut.get("type"),
+        shortcut.get("image_path"),
+        health_scanner.status(shortcut),
+    )
+
+def display_name(shortcut):
+    name = shortcut.get("name", "Unbenannt")
+    if len(name) > 12:
+        name = name[:10] + "..."
+    return name
+
+def type_icon(shortcut, status=None):
+    """Typ-Indikator oben rechts; fehlende Ziele und veraltete Icons überdecken ihn"""
+    if status is not None:
+        return "⚠️" if status == MISSING else "🕓"
+    return "🌐" if shortcut.get("type") == "url" else "📂"
+
+def name_color(status):
+    return "#ff7777" if status == MISSING else "#cccccc"
+
+def tile_image(shortcut, scale=1.0):
+    """CTkImage für das Icon eines Shortcuts (prozessweiter Cache), oder None"""
+    image_path = shortcut.get("image_path")
+    if not image_path:
+        return None
+    # Ist der Pfad schon gescannt, spart die bekannte mtime den stat-Aufruf
+    stat = health_scanner.stat(image_path)
+    if stat is not None and not stat[0]:
+        return None
+    return image_cache.get(image_path, ICON_SIZE, mtime=stat[1] if stat else None, scale=scale)
+
+def show_context_menu(widget, shortcut, event, on_edit, on_delete):
+    """Kontextmenü einer Kachel (Bearbeiten, Löschen, Pfad kopieren)"""
+    menu = tk.Menu(widget, tearoff=0, bg="#2b2b2b", fg="white",
+                   activebackground="#0078d4", activeforeground="white")
+    menu.add_command(label="✏️ Bearbeiten", command=lambda: on_edit(shortcut))
+    menu.add_command(label="🗑️ Löschen", command=lambda: on_delete(shortcut))
+    menu.add_separator()
+    menu.add_command(label="📋 Pfad kopieren", command=lambda: copy_path(widget, shortcut))
+    menu.tk_popup(event.x_root, event.y_root)
+
+def copy_path(widget, shortcut):
+    try:
+        import pyperclip
+        pyperclip.copy(shortcut.get("path", ""))
+    except ImportError:
+        # Fallback if pyperclip is not installed
+        widget.clipboard_clear()
+        widget.clipboard_append(shortcut.get("path", ""))
+        widget.update() # Required to process clipboard event
+    except Exception:
+         # Generic fallback
+        widget.clipboard_clear()
+        widget.clipboard_append(shortcut.get("path", ""))
+        widget.update()
+
 class ShortcutTile(ctk.CTkFrame):
     """Einzelne Kachel für eine Verknüpfung"""
     
@@ -34,45 +99,13 @@ class ShortcutTile(ctk.CTkFrame):
         
         # Icon
         self.icon_label = None
-        image_path = shortcut_data.get("image_path")
-        
-        if image_path and os.path.exists(image_path):
-            try:
-                pil_img = Image.open(image_path)
-                # Resize with high quality filter to prevent pixelation
-                # We resize to a bit larger than target to keep detail, or exact target with Lanczos
-                pil_img = pil_img.resize((64, 64), Image.Resampling.LANCZOS)
-                
-                # Skalierung für HighDPI handled by CTkImage, passing PIL image
-                ctk_img = ctk.CTkImage(light_image=pil_img, dark_image=pil_img, size=(40, 40))
-                self.icon_label = ctk.CTkLabel(
-                    self,
-                    text="",
-                    image=ctk_img
-                )
-            except Exception as e:
-                print(f"Error loading image: {e}")
-                
-        if not self.icon_label:
-            icon_text = shortcut_data.get("icon", "📁")
-            self.icon_label = ctk.CTkLabel(
-                self,
-                text=icon_text,
-                font=("Segoe UI Emoji", 32),
-                text_color="#ffffff"
-            )
-
-        self.icon_label.pack(pady=(15, 5))
-        self.icon_label.bind("<Double-Button-1>", self.launch)
-        self.icon_label.bind("<Button-3>", self._show_context_menu)
+        self._icon_image_path = None
+        self._create_icon_label()
         
         # Name
-        name = shortcut_data.get("name", "Unbenannt")
-        if len(name) > 12:
-            name = name[:10] + "..."
         self.name_label = ctk.CTkLabel(
             self,
-            text=name,
+            text=self._display_name(),
             font=("Segoe UI", 11),
             text_color="#cccccc"
         )
@@ -81,14 +114,72 @@ class ShortcutTile(ctk.CTkFrame):
         self.name_label.bind("<Button-3>", self._show_context_menu)
         
         # Typ-Indikator
-        type_icon = "🌐" if shortcut_data.get("type") == "url" else "📂"
         self.type_label = ctk.CTkLabel(
             self,
-            text=type_icon,
+            text=self._type_icon(),
             font=("Segoe UI Emoji", 10),
             text_color="#666666"
         )
         self.type_label.place(relx=0.9, rely=0.1, anchor="center")
+        self._apply_health()
+    
+    def set_shortcut(self, shortcut_data):
+        """Zeigt einen anderen Shortcut an (Wiederverwendung aus einem Tile-Pool)"""
+        self.shortcut_data = shortcut_data
+        image_path = shortcut_data.get("image_path")
+        if image_path or self._icon_image_path:
+            if image_path != self._icon_image_path:
+                self.icon_label.destroy()
+                self._create_icon_label(before=self.name_label)
+        else:
+            self.icon_label.configure(text=shortcut_data.get("icon", "📁"))
+        self.name_label.configure(text=self._display_name())
+        self.type_label.configure(text=self._type_icon())
+        self._apply_health()
+    
+    def _apply_health(self):
+        """Markiert fehlende Ziele und veraltete Icons (Ergebnis des Health-Scanners)"""
+        status = health_scanner.status(self.shortcut_data)
+        self.name_label.configure(text_color=name_color(status))
+        if status is not None:
+            self.type_label.configure(text=type_icon(self.shortcut_data, status))
+    
+    def _create_icon_label(self, before=None):
+        self.icon_label = None
+        self._icon_image_path = None
+        image_path = self.shortcut_data.get("image_path")
+        
+        # Dekodierte Bilder kommen aus dem prozessweiten Cache
+        ctk_img = tile_image(self.shortcut_data, scale=self._get_widget_scaling())
+        if ctk_img is not None:
+            self.icon_label = ctk.CTkLabel(
+                self,
+                text="",
+                image=ctk_img
+            )
+            self._icon_image_path = image_path
+                
+        if not self.icon_label:
+            icon_text = self.shortcut_data.get("icon", "📁")
+            self.icon_label = ctk.CTkLabel(
+                self,
+                text=icon_text,
+                font=("Segoe UI Emoji", 32),
+                text_color="#ffffff"
+            )
+
+        if before is not None:
+            self.icon_label.pack(pady=(15, 5), before=before)
+        else:
+            self.icon_label.pack(pady=(15, 5))
+        self.icon_label.bind("<Double-Button-1>", self.launch)
+        self.icon_label.bind("<Button-3>", self._show_context_menu)
+    
+    def _display_name(self):
+        return display_name(self.shortcut_data)
+    
+    def _type_icon(self):
+        return type_icon(self.shortcut_data)
     
     def _on_enter(self, event):
         theme_border = ThemeManager.get_color("border")
@@ -98,43 +189,11 @@ class ShortcutTile(ctk.CTkFrame):
         self.configure(fg_color="#2b2b2b", border_color="#3d3d3d")
     
     def launch(self, event=None):
-        """Startet die Verknüpfung"""
-        path = self.shortcut_data.get("path", "")
-        shortcut_type = self.shortcut_data.get("type", "file")
-        
-        try:
-            if shortcut_type == "url":
-                webbrowser.open(path)
-            else:
-                if sys.platform == "win32":
-                    os.startfile(path)
-                elif sys.platform == "darwin":
-                    subprocess.Popen(["open", path])
-                else:
-                    subprocess.Popen(["xdg-open", path])
-        except Exception as e:
-            messagebox.showerror("Fehler", f"Konnte nicht öffnen:\n{e}")
+        """Startet die Verknüpfung (im Hintergrund, Fehler landen in der Statusleiste)"""
+        launcher.launch(self.shortcut_data)
     
     def _show_context_menu(self, event):
-        menu = tk.Menu(self, tearoff=0, bg="#2b2b2b", fg="white",
-                       activebackground="#0078d4", activeforeground="white")
-        menu.add_command(label="✏️ Bearbeiten", command=lambda: self.on_edit(self.shortcut_data))
-        menu.add_command(label="🗑️ Löschen", command=lambda: self.on_delete(self.shortcut_data))
-        menu.add_separator()
-        menu.add_command(label="📋 Pfad kopieren", command=self._copy_path)
-        menu.tk_popup(event.x_root, event.y_root)
+        show_context_menu(self, self.shortcut_data, event, self.on_edit, self.on_delete)
     
     def _copy_path(self):
-        try:
-            import pyperclip
-            pyperclip.copy(self.shortcut_data.get("path", ""))
-        except ImportError:
-            # Fallback if pyperclip is not installed
-            self.clipboard_clear()
-            self.clipboard_append(self.shortcut_data.get("path", ""))
-            self.update() # Required to process clipboard event
-        except Exception:
-             # Generic fallback
-            self.clipboard_clear()
-            self.clipboard_append(self.shortcut_data.get("path", ""))
-            self.update()
+        copy_path(self, self.shortcut_data)
@@ -1,11 +1,19 @@
 import customtkinter as ctk
 import sys
 import time
+from collections import deque
 from datetime import datetime
 import tkinter as tk
-from utils.system_utils import get_system_stats
+from utils.system_utils import stats_sampler
 from utils.theme_manager import ThemeManager
 
+# Aktualisierungsintervalle der Topbar in Sekunden. Alle teilen 60, so fallen
+# die Aufwachzeitpunkte immer auch auf den Minutenwechsel der Uhr.
+STATUS_INTERVAL_ACTIVE = 1
+STATUS_INTERVAL_SLOW = 10      # Leerlauf oder Akkubetrieb
+STATUS_INTERVAL_MINIMAL = 60   # Leerlauf und Akkubetrieb: nur noch die Uhr
+IDLE_AFTER_S = 60
+
 class Topbar(ctk.CTkToplevel):
     def __init__(self, app_controller):
         super().__init__()
@@ -23,6 +31,17 @@ class Topbar(ctk.CTkToplevel):
         
         self.title("QuickLaunch Bar")
         
+        # Zuletzt angezeigte Werte je Label, damit nur Änderungen konfiguriert werden
+        self._shown = {}
+        
+        # Adaptiver Timer: pausiert solange die Topbar versteckt ist
+        self._status_job = None
+        self._status_interval = STATUS_INTERVAL_ACTIVE
+        self._status_started = False
+        self._last_input = time.monotonic()
+        self._wakeups = deque()  # Zeitpunkte der letzten Minute
+        self.wakeup_count = 0
+        
         # Dimensions (Increased height for better spacing)
         self.width = 350
         self.height = 55
@@ -46,7 +65,11 @@ class Topbar(ctk.CTkToplevel):
         
         self._create_widgets()
         self._setup_context_menu()
-        self._update_status()
+        
+        # Eingaben in irgendeinem Fenster der App beenden den Leerlauf
+        self.bind_all("<Motion>", self._on_user_input, add="+")
+        self.bind_all("<KeyPress>", self._on_user_input, add="+")
+        # _update_status startet die App nach dem ersten Zeichnen (psutil-Import)
         
     def _create_widgets(self):
         theme_border = ThemeManager.get_color("border")
@@ -201,6 +224,15 @@ class Topbar(ctk.CTkToplevel):
         self.geometry(f"+{x}+{y}")
 
     def _update_status(self):
+        self._status_job = None
+        self._status_started = True
+        
+        now_mono = time.monotonic()
+        self.wakeup_count += 1
+        self._wakeups.append(now_mono)
+        while self._wakeups and now_mono - self._wakeups[0] > 60:
+            self._wakeups.popleft()
+        
         # Update Clock
         now = datetime.now()
         time_str = now.strftime("%H:%M") # Shorter format without date for space
@@ -209,27 +241,76 @@ class Topbar(ctk.CTkToplevel):
         # Let's stick to short time + date in tool tip? No tooltips yet.
         # Let's try full string.
         time_str = now.strftime("%H:%M  |  %d.%m.%Y")
-        self.time_label.configure(text=time_str)
-        
-        # Update Stats
-        cpu, ram = get_system_stats()
-        self.cpu_label.configure(text=f"CPU {int(cpu)}%")
-        self.ram_label.configure(text=f"RAM {int(ram)}%")
+        self._set_label(self.time_label, text=time_str)
         
+        # Update Stats (vom Sampler-Thread, kein psutil im Tk-Thread)
+        cpu, ram = stats_sampler.snapshot
         theme_accent = ThemeManager.get_color("accent_text")
         
         # Color warning
-        if cpu > 80:
-             self.cpu_label.configure(text_color="#ff5555")
-        else:
-             self.cpu_label.configure(text_color=theme_accent)
-             
-        if ram > 80:
-             self.ram_label.configure(text_color="#ff5555")
+        self._set_label(
+            self.cpu_label,
+            text=f"CPU {int(cpu)}%",
+            text_color="#ff5555" if cpu > 80 else theme_accent
+        )
+        self._set_label(
+            self.ram_label,
+            text=f"RAM {int(ram)}%",
+            text_color="#ff5555" if ram > 80 else theme_accent
+        )
+
+        self._schedule_status()
+
+    def _schedule_status(self):
+        """Plant den nächsten Tick, ausgerichtet auf ein Vielfaches des Intervalls"""
+        idle = time.monotonic() - self._last_input > IDLE_AFTER_S
+        if idle and stats_sampler.on_battery:
+            interval = STATUS_INTERVAL_MINIMAL
+        elif idle or stats_sampler.on_battery:
+            interval = STATUS_INTERVAL_SLOW
         else:
-             self.ram_label.configure(text_color=theme_accent)
+            interval = STATUS_INTERVAL_ACTIVE
+        self._status_interval = interval
+        stats_sampler.interval = interval
+        
+        delay = interval - (time.time() % interval)
+        self._status_job = self.after(max(1, int(delay * 1000) + 5), self._update_status)
+
+    def _cancel_status(self):
+        if self._status_job is not None:
+            self.after_cancel(self._status_job)
+            self._status_job = None
+
+    def _on_user_input(self, event=None):
+        self._last_input = time.monotonic()
+        if self._status_interval != STATUS_INTERVAL_ACTIVE and self._status_job is not None:
+            # Aus dem Leerlauf zurück -> sofort wieder im Sekundentakt
+            self._cancel_status()
+            self._update_status()
+
+    def withdraw(self):
+        super().withdraw()
+        # Versteckt: kein Timer, kein Sampling
+        if getattr(self, "_status_started", False):
+            self._cancel_status()
+            stats_sampler.stop()
+
+    def deiconify(self):
+        super().deiconify()
+        if getattr(self, "_status_started", False) and self._status_job is None:
+            stats_sampler.start()
+            self._update_status()
+
+    def wakeups_per_minute(self) -> int:
+        """Anzahl der Timer-Ticks in den letzten 60 Sekunden"""
+        now = time.monotonic()
+        return sum(1 for t in self._wakeups if now - t <= 60)
 
-        self.after(1000, self._update_status)
+    def _set_label(self, label, **values):
+        """Konfiguriert das Label nur, wenn sich der angezeigte Wert geändert hat"""
+        if self._shown.get(label) != values:
+            self._shown[label] = values
+            label.configure(**values)
         
     def _toggle_quicklaunch(self, event=None):
         is_visible = self.app_controller.toggle_quicklaunch_window()
@@ -0,0 +1,160 @@
+import customtkinter as ctk
+import sys
+
+
+class VirtualTileGrid(ctk.CTkFrame):
+    """Raster für sehr große Kategorien: Kacheln nur für sichtbare Zeilen, aus einem Pool recycelt"""
+
+    CELL_SIZE = 116  # 100 Kachel + 2x8 Padding
+    PADDING = 8
+    OVERSCAN_ROWS = 2
+    SCROLL_STEP = 40
+
+    def __init__(self, master, tile_factory, on_range_changed=None, **kwargs):
+        super().__init__(master, **kwargs)
+        # tile_factory(parent, shortcut) -> neue Kachel mit set_shortcut()
+        self.tile_factory = tile_factory
+        # on_range_changed(start, end): sichtbarer Bereich in self.items inkl. Overscan
+        self.on_range_changed = on_range_changed
+        self._range = None
+        self.items = []
+        self.columns = 4
+        self._offset = 0
+        self._visible = {}  # Index in self.items -> Kachel
+        self._pool = []
+        self._update_pending = False
+
+        self.configure(fg_color="transparent")
+
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+
+        self.scrollbar = ctk.CTkScrollbar(
+            self,
+            command=self._on_scrollbar,
+            button_color="#3d3d3d",
+            button_hover_color="#4d4d4d"
+        )
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.viewport.bind("<Configure>", lambda e: self._schedule_update())
+
+        # Mausrad global abfangen (wie CTkScrollableFrame), da die Events an
+        # der Kachel unter dem Cursor ankommen und nicht am Viewport
+        if sys.platform.startswith("linux"):
+            self.bind_all("<Button-4>", self._on_mousewheel, add="+")
+            self.bind_all("<Button-5>", self._on_mousewheel, add="+")
+        else:
+            self.bind_all("<MouseWheel>", self._on_mousewheel, add="+")
+
+    def set_items(self, items, columns):
+        """Setzt die anzuzeigenden Shortcuts; sichtbare Kacheln werden neu befüllt"""
+        self.items = items
+        self.columns = max(1, columns)
+        self._range = None # neue Items -> Bereich in jedem Fall neu melden
+        # Alle sichtbaren Kacheln zurück in den Pool, _update bindet sie neu
+        for tile in self._visible.values():
+            tile.place_forget()
+            self._pool.append(tile)
+        self._visible.clear()
+        self._update_window()
+
+    def refresh(self, shortcut):
+        """Befüllt die Kachel eines Shortcuts neu, falls sie gerade sichtbar ist"""
+        for tile in self._visible.values():
+            if tile.shortcut_data is shortcut:
+                tile.set_shortcut(shortcut)
+                break
+
+    def clear(self):
+        self.items = []
+        self._range = None
+        for tile in list(self._visible.values()) + self._pool:
+            tile.destroy()
+        self._visible.clear()
+        self._pool.clear()
+
+    def _total_height(self):
+        rows = -(-len(self.items) // self.columns)
+        return rows * self.CELL_SIZE + self.PADDING
+
+    def _viewport_height(self):
+        # winfo_height liefert physische Pixel, Offset und Zellen sind unskaliert
+        return round(self.viewport.winfo_height() / self._get_widget_scaling())
+
+    def _on_scrollbar(self, action, value, unit=None):
+        height = max(1, self._viewport_height())
+        if action == "moveto":
+            self._offset = int(float(value) * self._total_height())
+        elif unit == "pages":
+            self._offset += int(value) * height
+        else:
+            self._offset += int(value) * self.SCROLL_STEP
+        self._schedule_update()
+
+    def _on_mousewheel(self, event):
+        widget = str(event.widget)
+        viewport = str(self.viewport)
+        if widget != viewport and not widget.startswith(viewport + "."):
+            return
+        if not self.winfo_ismapped():
+            return
+
+        if sys.platform.startswith("win"):
+            steps = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        elif sys.platform == "darwin":
+            steps = -event.delta
+        else:
+            steps = -1 if event.num == 4 else 1
+        self._offset += steps * self.SCROLL_STEP
+        self._schedule_update()
+
+    def _schedule_update(self):
+        # Mehrere Scroll-Events pro Frame zu einem Update zusammenfassen
+        if not self._update_pending:
+            self._update_pending = True
+            self.after_idle(self._update_window)
+
+    def _update_window(self):
+        self._update_pending = False
+        height = self._viewport_height()
+        total = self._total_height()
+        self._offset = max(0, min(self._offset, total - height))
+
+        first_row = max(0, self._offset // self.CELL_SIZE - self.OVERSCAN_ROWS)
+        last_row = (self._offset + height) // self.CELL_SIZE + self.OVERSCAN_ROWS
+        start = first_row * self.columns
+        end = min(len(self.items), (last_row + 1) * self.columns)
+
+        # Kacheln außerhalb des Fensters recyceln
+        for index in [i for i in self._visible if i < start or i >= end]:
+            tile = self._visible.pop(index)
+            tile.place_forget()
+            self._pool.append(tile)
+
+        for index in range(start, end):
+            shortcut = self.items[index]
+            tile = self._visible.get(index)
+            if tile is None:
+                if self._pool:
+                    tile = self._pool.pop()
+                    tile.set_shortcut(shortcut)
+                else:
+                    tile = self.tile_factory(self.viewport, shortcut)
+                self._visible[index] = tile
+
+            row, col = divmod(index, self.columns)
+            tile.place(
+                x=col * self.CELL_SIZE + self.PADDING,
+                y=row * self.CELL_SIZE + self.PADDING - self._offset
+            )
+
+        if (start, end) != self._range:
+            self._range = (start, end)
+            if self.on_range_changed is not None:
+                self.on_range_changed(start, end)
+
+        if total > 0:
+            self.scrollbar.set(self._offset / total, min(1.0, (self._offset + height) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import os
+import sqlite3
+
+
+class JsonStore:
+    """Whole config as a single JSON file; rewritten atomically, only when it changed"""
+
+    def __init__(self, path):
+        self.path = path
+        self._digest = None
+
+    def load(self):
+        """Returns the stored data or None if the file is missing or broken."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                text = f.read()
+            data = json.loads(text)
+        except (OSError, ValueError):
+            return None
+        self._digest = hashlib.sha1(text.encode("utf-8")).digest()
+        return data
+
+    def save(self, data):
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+        digest = hashlib.sha1(text.encode("utf-8")).digest()
+        if digest == self._digest:
+            return
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._digest = digest
+
+
+class _Row:
+    __slots__ = ("obj", "rowid", "parent", "position", "fingerprint")
+
+    def __init__(self, obj, rowid, parent, position, fingerprint):
+        self.obj = obj  # Referenz hält id(obj) eindeutig
+        self.rowid = rowid
+        self.parent = parent
+        self.position = position
+        self.fingerprint = fingerprint
+
+
+class SqliteStore:
+    """
+    Config in SQLite, one row per shortcut.
+    save() diffs the in-memory dicts against what was last written (tracked
+    by object identity) and only touches rows that were added, changed,
+    moved or removed, all in one transaction.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS categories (
+            id INTEGER PRIMARY KEY,
+            position INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS shortcuts (
+            id INTEGER PRIMARY KEY,
+            category_id INTEGER NOT NULL REFERENCES categories(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            path TEXT NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_shortcuts_category ON shortcuts(category_id, position);
+        CREATE INDEX IF NOT EXISTS idx_shortcuts_name ON shortcuts(name COLLATE NOCASE);
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # Gespeichert wird vom Writer-Thread, geladen vom Mainthread - nie gleichzeitig
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(self.SCHEMA)
+        self._settings = None
+        self._categories = {}  # id(category) -> _Row
+        self._shortcuts = {}   # id(shortcut) -> _Row
+
+    def load(self):
+        conn = self._conn
+        settings = {key: json.loads(value) for key, value in conn.execute("SELECT key, value FROM settings")}
+
+        categories = []
+        by_rowid = {}
+        self._categories = {}
+        for rowid, position, data in conn.execute("SELECT id, position, data FROM categories ORDER BY position"):
+            category = json.loads(data)
+            category["shortcuts"] = []
+            categories.append(category)
+            by_rowid[rowid] = category
+            self._categories[id(category)] = _Row(category, rowid, None, position, self._category_fingerprint(category))
+
+        self._shortcuts = {}
+        for rowid, category_id, position, data in conn.execute(
+                "SELECT id, category_id, position, data FROM shortcuts ORDER BY category_id, position"):
+            category = by_rowid.get(category_id)
+            if category is None:
+                continue
+            shortcut = json.loads(data)
+            category["shortcuts"].append(shortcut)
+            self._shortcuts[id(shortcut)] = _Row(shortcut, rowid, category_id, position, tuple(shortcut.items()))
+
+        self._settings = json.dumps(settings, sort_keys=True, ensure_ascii=False)
+        return {"categories": categories, "settings": settings}
+
+    def save(self, data):
+        """
+        Writes only what changed since the last load/save. May raise
+        RuntimeError if data is mutated concurrently; nothing is committed then.
+        """
+        settings = data.get("settings", {})
+        settings_fp = json.dumps(settings, sort_keys=True, ensure_ascii=False)
+        new_categories = {}
+        new_shortcuts = {}
+
+        with self._conn as conn:
+            if settings_fp != self._settings:
+                conn.execute("DELETE FROM settings")
+                conn.executemany(
+                    "INSERT INTO settings (key, value) VALUES (?, ?)",
+                    [(key, json.dumps(value, ensure_ascii=False)) for key, value in settings.items()]
+                )
+
+            for position, category in enumerate(list(data.get("categories", []))):
+                fingerprint = self._category_fingerprint(category)
+                row = self._categories.get(id(category))
+                if row is None or row.obj is not category:
+                    cursor = conn.execute(
+                        "INSERT INTO categories (position, name, data) VALUES (?, ?, ?)",
+                        (position, category.get("name", ""), self._category_json(category))
+                    )
+                    row = _Row(category, cursor.lastrowid, None, position, fingerprint)
+                elif row.position != position or row.fingerprint != fingerprint:
+                    conn.execute(
+                        "UPDATE categories SET position = ?, name = ?, data = ? WHERE id = ?",
+                        (position, category.get("name", ""), self._category_json(category), row.rowid)
+                    )
+                    row = _Row(category, row.rowid, None, position, fingerprint)
+                new_categories[id(category)] = row
+                self._diff_shortcuts(conn, row.rowid, category.get("shortcuts", []), new_shortcuts)
+
+            removed = [row.rowid for key, row in self._shortcuts.items() if key not in new_shortcuts]
+            conn.executemany("DELETE FROM shortcuts WHERE id = ?", [(rowid,) for rowid in removed])
+            removed = [row.rowid for key, row in self._categories.items() if key not in new_categories]
+            conn.executemany("DELETE FROM categories WHERE id = ?", [(rowid,) for rowid in removed])
+
+        # Erst nach erfolgreichem Commit übernehmen
+        self._settings = settings_fp
+        self._categories = new_categories
+        self._shortcuts = new_shortcuts
+
+    def _diff_shortcuts(self, conn, category_id, shortcuts, new_shortcuts):
+        for position, shortcut in enumerate(list(shortcuts)):
+            fingerprint = tuple(shortcut.items())
+            row = self._shortcuts.get(id(shortcut))
+            if row is None or row.obj is not shortcut:
+                cursor = conn.execute(
+                    "INSERT INTO shortcuts (category_id, position, name, path, data) VALUES (?, ?, ?, ?, ?)",
+                    (category_id, position, *self._shortcut_columns(shortcut))
+                )
+                row = _Row(shortcut, cursor.lastrowid, category_id, position, fingerprint)
+            elif row.fingerprint != fingerprint:
+                conn.execute(
+                    "UPDATE shortcuts SET category_id = ?, position = ?, name = ?, path = ?, data = ? WHERE id = ?",
+                    (category_id, position, *self._shortcut_columns(shortcut), row.rowid)
+                )
+                row = _Row(shortcut, row.rowid, category_id, position, fingerprint)
+            elif row.parent != category_id or row.position != position:
+                conn.execute(
+                    "UPDATE shortcuts SET category_id = ?, position = ? WHERE id = ?",
+                    (category_id, position, row.rowid)
+                )
+                row = _Row(shortcut, row.rowid, category_id, position, fingerprint)
+            new_shortcuts[id(shortcut)] = row
+
+    @staticmethod
+    def _shortcut_columns(shortcut):
+        return (
+            shortcut.get("name", ""),
+            shortcut.get("path", ""),
+            json.dumps(shortcut, ensure_ascii=False),
+        )
+
+    @staticmethod
+    def _category_fingerprint(category):
+        return tuple((key, value) for key, value in category.items() if key != "shortcuts")
+
+    @classmethod
+    def _category_json(cls, category):
+        return json.dumps(dict(cls._category_fingerprint(category)), ensure_ascii=False)
+
+    def import_data(self, data):
+        """Replaces the database content with data (used by the migration)."""
+        with self._conn as conn:
+            conn.execute("DELETE FROM shortcuts")
+            conn.execute("DELETE FROM categories")
+            conn.execute("DELETE FROM settings")
+        self._settings = None
+        self._categories = {}
+        self._shortcuts = {}
+        self.save(data)
+
+    def close(self):
+        self._conn.close()
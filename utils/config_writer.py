@@ -0,0 +1,75 @@
+import sqlite3
+import threading
+import time
+
+import config
+
+
+class ConfigWriter:
+    """
+    Saves the configuration off the UI thread.
+    request() only marks the config dirty; changes arriving within the
+    coalescing window end up in a single write through config.save_config,
+    which skips unchanged content. Other stores can pass their own save
+    function.
+    """
+
+    def __init__(self, save=None, delay=0.5, retries=5, name="config-writer"):
+        self.save = save or config.save_config
+        self.name = name
+        self.delay = delay
+        self.retries = retries
+        self._lock = threading.Lock()        # schützt _data/_dirty
+        self._write_lock = threading.Lock()  # immer nur ein Schreibvorgang
+        self._wake = threading.Event()
+        self._data = None
+        self._dirty = False
+        self._thread = None
+
+    def request(self, data):
+        """Marks data as dirty; it is written after the coalescing window."""
+        with self._lock:
+            self._data = data
+            self._dirty = True
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    def flush(self):
+        """Writes pending changes immediately, e.g. before quitting."""
+        self._write_pending()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            # Weitere Änderungen im Zeitfenster mitnehmen
+            time.sleep(self.delay)
+            self._wake.clear()
+            self._write_pending()
+
+    def _write_pending(self):
+        with self._write_lock:
+            with self._lock:
+                data, dirty = self._data, self._dirty
+                self._dirty = False
+            if not dirty:
+                return
+
+            # Der Mainthread kann die Daten währenddessen verändern -> erneut versuchen
+            for _ in range(self.retries):
+                try:
+                    self.save(data)
+                    return
+                except RuntimeError:
+                    continue
+                except (OSError, sqlite3.Error) as e:
+                    print(f"Saving config failed: {e}")
+                    return
+            print("Saving config failed: data kept changing during serialization")
+            # Wird beim nächsten request() erneut versucht
+            with self._lock:
+                self._dirty = True
+
+
+config_writer = ConfigWriter()
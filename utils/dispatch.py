@@ -0,0 +1,63 @@
+import queue
+
+
+class MainThreadDispatcher:
+    """
+    Marshals results of background work back onto the Tk main loop.
+    Worker threads never touch Tk; they only enqueue finished futures, which
+    are drained by an `after` poll that runs only while work is outstanding.
+    """
+
+    def __init__(self, poll_ms=25):
+        self.poll_ms = poll_ms
+        self._queue = queue.SimpleQueue()
+        self._root = None
+        self._pending = 0  # nur im Mainthread verändert
+        self._poll_id = None
+
+    def attach(self, root):
+        """Binds the dispatcher to the Tk root whose main loop runs the callbacks."""
+        self._root = root
+        if self._pending:
+            self._schedule_poll()
+
+    def submit(self, executor, func, *args, on_done=None):
+        """
+        Runs func(*args) on executor. on_done(result, error) is called on the
+        Tk main thread once it finished. Must be called from the main thread.
+        """
+        self._pending += 1
+        future = executor.submit(func, *args)
+        future.add_done_callback(lambda f: self._queue.put((f, on_done)))
+        self._schedule_poll()
+        return future
+
+    def _schedule_poll(self):
+        if self._root is not None and self._poll_id is None:
+            self._poll_id = self._root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        self._poll_id = None
+        while True:
+            try:
+                future, on_done = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            self._pending -= 1
+            if future.cancelled():
+                continue
+            error = future.exception()
+            result = future.result() if error is None else None
+
+            if on_done is not None:
+                try:
+                    on_done(result, error)
+                except Exception as e:
+                    print(f"Dispatcher callback failed: {e}")
+
+        if self._pending > 0:
+            self._schedule_poll()
+
+
+dispatcher = MainThreadDispatcher()
@@ -0,0 +1,69 @@
+import os
+import time
+from fnmatch import fnmatchcase
+
+DEFAULT_EXCLUDE = (".git", "node_modules", "__pycache__")
+
+
+def _compile(patterns):
+    return tuple(p.strip().lower() for p in patterns if p and p.strip())
+
+
+def _matches(name, patterns):
+    name = name.lower()
+    return any(fnmatchcase(name, pattern) for pattern in patterns)
+
+
+def scan_folder(root, include=("*",), exclude=DEFAULT_EXCLUDE, max_depth=None):
+    """
+    Lazily walks root with os.scandir and yields the paths of matching files.
+    include/exclude are glob patterns on the entry name (case-insensitive);
+    excluded directories are not descended into. max_depth=0 only looks at
+    root itself, None means unlimited. Unreadable directories are skipped, so
+    are symlinks to directories (neither followed nor yielded, no cycles);
+    symlinks to files are yielded like files.
+    """
+    include = _compile(include) or ("*",)
+    exclude = _compile(exclude)
+
+    # Tiefensuche mit eigenem Stack: keine Rekursionsgrenze, Reihenfolge wie im Dateisystem
+    stack = [(root, 0)]
+    while stack:
+        directory, depth = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs = []
+                for entry in entries:
+                    name = entry.name
+                    if exclude and _matches(name, exclude):
+                        continue
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        # Verlinkte Ordner weder betreten noch als Datei importieren
+                        if not is_dir and entry.is_symlink() and entry.is_dir():
+                            continue
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if max_depth is None or depth < max_depth:
+                            subdirs.append(entry.path)
+                    elif _matches(name, include):
+                        yield entry.path
+        except OSError:
+            continue
+        # Umgekehrt auf den Stack, damit Unterordner in Verzeichnisreihenfolge drankommen
+        stack.extend((path, depth + 1) for path in reversed(subdirs))
+
+
+def next_chunk(paths, size=500, budget=0.05):
+    """
+    Pulls up to size paths from the iterator, or as many as fit into budget
+    seconds. Returns (chunk, exhausted). Meant to run on a worker thread.
+    """
+    chunk = []
+    deadline = time.perf_counter() + budget
+    for path in paths:
+        chunk.append(path)
+        if len(chunk) >= size or time.perf_counter() > deadline:
+            return chunk, False
+    return chunk, True
@@ -0,0 +1,116 @@
+import json
+import math
+import os
+import time
+
+from config import CONFIG_FILE
+from utils.config_writer import ConfigWriter
+
+FRECENCY_FILE = CONFIG_FILE.with_name("frecency.json")
+
+# Nach dieser Zeit zählt ein Start nur noch halb so viel
+HALF_LIFE_S = 14 * 24 * 3600
+MAX_ENTRIES = 500
+# Einfluss auf das Suchranking: höchstens so viele Punkte wie ein Wortanfang-Bonus
+SEARCH_WEIGHT = 10
+SEARCH_BOOST_MAX = 40
+
+
+class FrecencyStore:
+    """
+    Launch history as exponentially decayed scores, keyed by shortcut path.
+    Each entry is [score, updated, count, last_launch]; a launch decays the
+    stored score to now and adds 1, so updates are O(1) and the file stays
+    bounded. Saved to its own file through a coalescing background writer,
+    never through config.json.
+    """
+
+    def __init__(self, path=FRECENCY_FILE):
+        self.path = path
+        self._entries = None  # path -> [score, updated, count, last_launch]
+        self._writer = ConfigWriter(save=self._write, name="frecency-writer")
+
+    def _ensure_loaded(self):
+        if self._entries is not None:
+            return self._entries
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._entries = {key: list(value) for key, value in json.load(f).items()}
+        except (OSError, ValueError, AttributeError):
+            self._entries = {}
+        self._prune()
+        return self._entries
+
+    def record(self, path):
+        """Counts a launch of path."""
+        entries = self._ensure_loaded()
+        now = time.time()
+        entry = entries.get(path)
+        if entry is None:
+            entries[path] = [1.0, now, 1, now]
+        else:
+            entry[0] = self._decayed(entry, now) + 1.0
+            entry[1] = now
+            entry[2] += 1
+            entry[3] = now
+        if len(entries) > MAX_ENTRIES * 2:
+            self._prune()
+        self._writer.request(self._entries)
+
+    def score(self, path, now=None):
+        entry = self._ensure_loaded().get(path)
+        if entry is None:
+            return 0.0
+        return self._decayed(entry, now or time.time())
+
+    def launched_paths(self):
+        """Set-like view of all paths with a launch history (those get a search boost)."""
+        return self._ensure_loaded().keys()
+
+    def search_boost(self, path):
+        """Bonus points for search ranking (0 for never launched shortcuts)."""
+        entry = self._ensure_loaded().get(path)
+        if entry is None:
+            return 0
+        return min(SEARCH_BOOST_MAX, SEARCH_WEIGHT * math.log2(1.0 + self._decayed(entry, time.time())))
+
+    def most_used(self, categories, limit=60):
+        """Returns the (shortcut, category) pairs with the highest score, best first."""
+        entries = self._ensure_loaded()
+        if not entries:
+            return []
+        now = time.time()
+        ranked = []
+        for category in categories:
+            for shortcut in category.get("shortcuts", []):
+                entry = entries.get(shortcut.get("path"))
+                if entry is not None:
+                    ranked.append((self._decayed(entry, now), entry[3], shortcut, category))
+        ranked.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        return [(shortcut, category) for _, _, shortcut, category in ranked[:limit]]
+
+    def flush(self):
+        self._writer.flush()
+
+    @staticmethod
+    def _decayed(entry, now):
+        return entry[0] * 0.5 ** (max(0.0, now - entry[1]) / HALF_LIFE_S)
+
+    def _prune(self):
+        entries = self._entries
+        if len(entries) <= MAX_ENTRIES:
+            return
+        now = time.time()
+        keep = sorted(entries, key=lambda key: self._decayed(entries[key], now), reverse=True)[:MAX_ENTRIES]
+        self._entries = {key: entries[key] for key in keep}
+
+    def _write(self, entries):
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+frecency = FrecencyStore()
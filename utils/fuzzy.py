@@ -0,0 +1,129 @@
+"""
+Fuzzy matching for the search bar.
+Scores subsequence matches ("vsc" -> "Visual Studio Code") with bonuses for
+word-boundary and consecutive hits; exact substrings always rank highest.
+"""
+
+import re
+from bisect import bisect_left
+
+SUBSTRING_BONUS = 100
+PREFIX_BONUS = 30
+BOUNDARY_BONUS = 10
+CONSECUTIVE_BONUS = 8
+MAX_GAP_PENALTY = 5
+TYPO_PENALTY = 25
+
+
+def word_boundaries(text: str) -> tuple:
+    """Sorted positions where a word starts (after separators, camelCase humps, digit runs)."""
+    lowered = text.lower()
+    # Bei Unicode-Sonderfällen ändert lower() die Länge -> dann nur Trennzeichen auswerten
+    use_case = len(lowered) == len(text)
+    source = text if use_case else lowered
+    bounds = []
+    prev = ""
+    for i, ch in enumerate(source):
+        if not ch.isalnum():
+            prev = ch
+            continue
+        if (i == 0 or not prev.isalnum()
+                or (use_case and prev.islower() and ch.isupper())
+                or (prev.isdigit() != ch.isdigit())):
+            bounds.append(i)
+        prev = ch
+    return tuple(bounds)
+
+
+def subsequence_matcher(query: str):
+    """
+    Compiled test whether query is a subsequence of a text: "abc" becomes
+    a[^b]*b[^c]*c, which needs no backtracking. Much cheaper than fuzzy_score
+    for the many candidates that do not match.
+    """
+    parts = [re.escape(query[0])]
+    for ch in query[1:]:
+        parts.append(f"[^{re.escape(ch)}]*{re.escape(ch)}")
+    return re.compile("".join(parts)).search
+
+
+def fuzzy_score(query: str, text: str, bounds: tuple):
+    """
+    Scores lowercase query against lowercase text. Returns None if query is
+    not a subsequence of text, otherwise a score (higher is better).
+    """
+    pos = text.find(query)
+    if pos >= 0:
+        score = SUBSTRING_BONUS + len(query) * CONSECUTIVE_BONUS
+        if pos == 0:
+            score += PREFIX_BONUS
+        elif _is_boundary(bounds, pos):
+            score += BOUNDARY_BONUS
+        return score - len(text) // 16
+
+    score = 0
+    start = 0
+    prev = -2
+    for qc in query:
+        idx = text.find(qc, start)
+        if idx < 0:
+            return None
+        if idx != prev + 1 and not _is_boundary(bounds, idx):
+            # Einen späteren Wortanfang mit diesem Zeichen bevorzugen
+            b = bisect_left(bounds, idx)
+            while b < len(bounds):
+                if text[bounds[b]] == qc:
+                    idx = bounds[b]
+                    break
+                b += 1
+
+        if idx == prev + 1:
+            score += CONSECUTIVE_BONUS
+        elif prev >= 0:
+            score -= min(idx - prev - 1, MAX_GAP_PENALTY)
+        if _is_boundary(bounds, idx):
+            score += BOUNDARY_BONUS
+        score += 1
+        prev = idx
+        start = idx + 1
+
+    return score - len(text) // 16
+
+
+def fuzzy_score_typo(query: str, text: str, bounds: tuple):
+    """Like fuzzy_score, but tolerates one extra or mistyped character in query."""
+    best = None
+    for i in _deletable(query, text):
+        score = fuzzy_score(query[:i] + query[i + 1:], text, bounds)
+        if score is not None and (best is None or score > best):
+            best = score
+    return None if best is None else best - TYPO_PENALTY
+
+
+def _deletable(query: str, text: str):
+    """
+    Positions i for which query without query[i] is a subsequence of text,
+    from one greedy pass in each direction (instead of a match per position).
+    """
+    n = len(query)
+    # head[i]: Ende des frühesten Treffers von query[:i], tail[j]: Anfang des spätesten von query[j:]
+    head = [0] * (n + 1)
+    for i, qc in enumerate(query):
+        idx = text.find(qc, head[i])
+        if idx < 0:
+            head[i + 1:] = [None] * (n - i)
+            break
+        head[i + 1] = idx + 1
+    tail = [len(text)] * (n + 1)
+    for j in range(n - 1, -1, -1):
+        idx = text.rfind(query[j], 0, tail[j + 1])
+        if idx < 0:
+            tail[:j + 1] = [None] * (j + 1)
+            break
+        tail[j] = idx
+    return [i for i in range(n) if head[i] is not None and tail[i + 1] is not None and head[i] <= tail[i + 1]]
+
+
+def _is_boundary(bounds, idx):
+    b = bisect_left(bounds, idx)
+    return b < len(bounds) and bounds[b] == idx
@@ -0,0 +1,175 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from config import ICONS_DIR
+from utils.dispatch import dispatcher
+
+# Verzeichnisse pro Hintergrund-Job; danach kommt der Mainloop wieder dran
+BATCH_DIRS = 256
+# Jeder n-te Scan stattet alle Pfade neu: Änderungen an einer Datei selbst
+# (z.B. Update eines Programms an Ort und Stelle) ändern die mtime ihres
+# Verzeichnisses nicht
+FULL_SCAN_EVERY = 6
+
+MISSING = "missing"  # Ziel existiert nicht mehr
+STALE = "stale"      # Icon fehlt oder ist älter als das Ziel
+
+_ICONS_DIR = os.path.normcase(str(ICONS_DIR))
+
+
+def is_extracted(image_path):
+    """True for icons QuickLaunch extracted into ICONS_DIR (not user-chosen images)."""
+    return os.path.normcase(os.path.dirname(image_path)) == _ICONS_DIR
+
+
+def _scan_batch(groups):
+    """
+    Runs on the worker thread. groups: [(directory, paths, known_dir_mtime, force)].
+    Returns ({directory: mtime_ns or None}, {path: (exists, mtime_ns)}).
+    """
+    dir_mtimes = {}
+    stats = {}
+    for directory, paths, known_mtime, force in groups:
+        try:
+            dir_mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        dir_mtimes[directory] = dir_mtime
+        if not force and dir_mtime is not None and dir_mtime == known_mtime:
+            # Nichts hinzugefügt, gelöscht oder umbenannt -> alte Ergebnisse gelten weiter
+            continue
+        for path in paths:
+            try:
+                stats[path] = (True, os.stat(path).st_mtime_ns)
+            except OSError:
+                stats[path] = (False, None)
+    return dir_mtimes, stats
+
+
+class HealthScanner:
+    """
+    Checks file shortcuts (target and icon image) in the background.
+    Stat results are cached per path; a re-scan only stats the entries whose
+    parent directory mtime changed, and every FULL_SCAN_EVERY-th scan stats
+    everything, so in-place edits of a target or icon (which leave the
+    directory mtime alone) show up after at most that many scans. Tiles read
+    the cached status, so nothing on the render path touches the file system.
+    """
+
+    def __init__(self):
+        self._stats = {}       # path -> (exists, mtime_ns)
+        self._dir_mtimes = {}  # directory -> mtime_ns beim letzten Scan
+        self._executor = None
+        self._scanning = False
+        self.scans = 0
+        self.stat_calls = 0
+
+    def stat(self, path):
+        """Cached (exists, mtime_ns) of path, or None if it was not scanned yet."""
+        return self._stats.get(path)
+
+    def status(self, shortcut):
+        """MISSING, STALE or None (ok or not scanned yet)."""
+        if shortcut.get("type") != "file":
+            return None
+        target = self._stats.get(shortcut.get("path"))
+        if target is None:
+            return None
+        if not target[0]:
+            return MISSING
+        image_path = shortcut.get("image_path")
+        if image_path:
+            image = self._stats.get(image_path)
+            if image is not None:
+                if not image[0]:
+                    return STALE
+                # Nur extrahierte Icons veralten, selbst gewählte Bilder nicht
+                if is_extracted(image_path) and (target[1] or 0) > (image[1] or 0):
+                    return STALE
+        return None
+
+    def scan(self, categories, on_changed=None, on_complete=None, full=None):
+        """
+        Re-checks all file shortcuts in categories. on_changed(paths) is called
+        on the main thread for every batch that changed a status, on_complete()
+        once at the end, also if the scan failed. full forces a stat of every
+        path; by default every FULL_SCAN_EVERY-th scan is a full one.
+        Ignored while a scan is still running.
+        """
+        if self._scanning:
+            return
+        self._scanning = True
+        self.scans += 1
+        if full is None:
+            full = self.scans % FULL_SCAN_EVERY == 0
+
+        by_dir = {}
+        referenced = set()
+        for category in categories:
+            for shortcut in category.get("shortcuts", []):
+                if shortcut.get("type") != "file":
+                    continue
+                for path in (shortcut.get("path"), shortcut.get("image_path")):
+                    if path and path not in referenced:
+                        referenced.add(path)
+                        by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+        # Nicht mehr verwendete Pfade vergessen
+        for path in [p for p in self._stats if p not in referenced]:
+            del self._stats[path]
+        for directory in [d for d in self._dir_mtimes if d not in by_dir]:
+            del self._dir_mtimes[directory]
+
+        groups = [
+            (directory, paths, self._dir_mtimes.get(directory), full or any(p not in self._stats for p in paths))
+            for directory, paths in by_dir.items()
+        ]
+        self._run_batch(groups, 0, on_changed, on_complete)
+
+    def _run_batch(self, groups, start, on_changed, on_complete):
+        if start >= len(groups):
+            self._scanning = False
+            if on_complete:
+                on_complete()
+            return
+        batch = groups[start:start + BATCH_DIRS]
+        dispatcher.submit(
+            self._get_executor(), _scan_batch, batch,
+            on_done=lambda result, error: self._on_batch(result, error, groups, start + BATCH_DIRS, on_changed, on_complete)
+        )
+
+    def _on_batch(self, result, error, groups, next_start, on_changed, on_complete):
+        if error is not None:
+            print(f"Health scan failed: {error}")
+            # Trotzdem abschließen, sonst plant niemand den nächsten Scan ein
+            self._scanning = False
+            if on_complete:
+                on_complete()
+            return
+
+        dir_mtimes, stats = result
+        self._dir_mtimes.update(dir_mtimes)
+        self.stat_calls += len(dir_mtimes) + len(stats)
+
+        changed = set()
+        for path, stat in stats.items():
+            if self._stats.get(path) != stat:
+                self._stats[path] = stat
+                changed.add(path)
+        if changed and on_changed:
+            on_changed(changed)
+
+        self._run_batch(groups, next_start, on_changed, on_complete)
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="health")
+        return self._executor
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+health_scanner = HealthScanner()
@@ -0,0 +1,231 @@
+import json
+import mmap
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config import ICONS_DIR
+from utils.dispatch import dispatcher
+from utils.icon_variants import variant_sizes
+
+ATLAS_FILE = ICONS_DIR / "atlas.bin"
+# Pixelgrößen je Icon, dieselben wie die vorskalierten Varianten: passt eine
+# zur Anzeige, muss nicht mehr skaliert werden
+ATLAS_SIZES = variant_sizes()
+
+# Kopf: Magic, Version, Anzahl, Offset und Länge des Index
+_HEADER = struct.Struct("<8sIIQQ")
+_MAGIC = b"QLATLAS\0"
+_VERSION = 2
+
+
+def _decode(path, sizes):
+    from PIL import Image
+
+    with Image.open(path) as src:
+        src.load()
+        src = src.convert("RGBA")
+        return b"".join(src.resize((px, px), Image.Resampling.LANCZOS).tobytes() for px in sizes)
+
+
+def build_atlas(target, entries, sizes=ATLAS_SIZES):
+    """
+    Decodes every (path, mtime_ns) in entries to square RGBA bitmaps of each
+    pixel size in sizes and writes them as fixed-size records to target,
+    followed by a JSON index {"sizes": [...], "icons": {path: [slot, mtime_ns]}}.
+    Unreadable images are skipped. Returns the number of stored icons.
+    """
+    record_bytes = sum(px * px * 4 for px in sizes)
+    icons = {}
+    with open(target, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        for path, mtime in entries:
+            if path in icons:
+                continue
+            try:
+                pixels = _decode(path, sizes)
+            except Exception as e:
+                print(f"Icon atlas: skipping {path}: {e}")
+                continue
+            if len(pixels) != record_bytes:
+                continue
+            f.write(pixels)
+            icons[path] = [len(icons), mtime]
+        index_offset = _HEADER.size + len(icons) * record_bytes
+        index = {"sizes": list(sizes), "icons": icons}
+        index_data = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        f.write(index_data)
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(icons), index_offset, len(index_data)))
+    return len(icons)
+
+
+def _prepare(target, paths, known, sizes):
+    """Runs on the worker thread: rebuilds into target + ".tmp" unless known is already current."""
+    current = {}
+    for path in paths:
+        try:
+            current[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+    if current == known:
+        return None
+    tmp_path = f"{target}.tmp"
+    build_atlas(tmp_path, current.items(), sizes)
+    return tmp_path
+
+
+class IconAtlas:
+    """
+    Packed store of pre-decoded icons: one file of fixed-size records (one
+    RGBA slot per pixel size in sizes) plus an offset index, read through
+    mmap. A tile image comes from a slice of the mapping instead of an
+    open/read/PNG-decode per file, already at the displayed pixel size.
+    The file is rebuilt in the background (sync_async) when referenced images
+    were added or changed, and swapped in on the main thread.
+    """
+
+    def __init__(self, path=ATLAS_FILE, sizes=ATLAS_SIZES):
+        self.path = path
+        self.sizes = tuple(sizes)
+        # Pixelgröße -> Offset des Slots innerhalb eines Eintrags
+        self._offsets = {}
+        offset = 0
+        for px in self.sizes:
+            self._offsets[px] = offset
+            offset += px * px * 4
+        self._record_bytes = offset
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+        self._file = None
+        self._map = None
+        self._index = {}  # path -> [slot, mtime_ns]
+        self._lock = threading.Lock()
+        self._executor = None
+        self._syncing = False
+
+    def open(self) -> bool:
+        """Maps the atlas file. Returns False if it is missing or invalid."""
+        with self._lock:
+            self._close_locked()
+            try:
+                f = open(self.path, "rb")
+            except OSError:
+                return False
+            mapped = None
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                magic, version, count, index_offset, index_length = _HEADER.unpack_from(mapped, 0)
+                if magic != _MAGIC or version != _VERSION or index_offset + index_length > len(mapped):
+                    raise ValueError("unknown atlas format")
+                index = json.loads(mapped[index_offset:index_offset + index_length].decode("utf-8"))
+                if tuple(index.get("sizes", ())) != self.sizes:
+                    raise ValueError("atlas built for other icon sizes")
+                index = index["icons"]
+            except (OSError, ValueError, struct.error) as e:
+                print(f"Icon atlas ignored: {e}")
+                # Auch die Abbildung schließen, sonst bleibt die Datei gesperrt (Windows)
+                if mapped is not None:
+                    mapped.close()
+                f.close()
+                return False
+            self._file, self._map, self._index = f, mapped, index
+            return True
+
+    def close(self):
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._index = {}
+
+    def __len__(self):
+        return len(self._index)
+
+    def mtime_of(self, path):
+        """mtime_ns the stored icon was decoded from, or None if path is not in the atlas."""
+        entry = self._index.get(path)
+        return entry[1] if entry is not None else None
+
+    def slot_size(self, px):
+        """Stored pixel size used for a px display: px itself, else the next larger (or the largest)."""
+        if px in self._offsets:
+            return px
+        larger = [size for size in self.sizes if size >= px]
+        return min(larger) if larger else max(self.sizes)
+
+    def image(self, path, mtime=None, px=None):
+        """
+        PIL image for path from the atlas at slot_size(px) pixels (the largest
+        stored size if px is None), or None if missing or stored for another mtime.
+        """
+        from PIL import Image
+
+        px = self.slot_size(px) if px is not None else max(self.sizes)
+        with self._lock:
+            entry = self._index.get(path)
+            if entry is None or self._map is None or (mtime is not None and entry[1] != mtime):
+                self.misses += 1
+                return None
+            offset = _HEADER.size + entry[0] * self._record_bytes + self._offsets[px]
+            # Kopie des Slots, damit kein Bild die Abbildung offen hält
+            pixels = self._map[offset:offset + px * px * 4]
+            self.hits += 1
+        return Image.frombuffer("RGBA", (px, px), pixels, "raw", "RGBA", 0, 1)
+
+    def sync_async(self, categories, on_done=None):
+        """
+        Rebuilds the atlas in the background if the images referenced in
+        categories differ from its contents. on_done(changed) runs on the main
+        thread. Ignored while a rebuild is still running.
+        """
+        if self._syncing:
+            return
+        self._syncing = True
+        paths = list(dict.fromkeys(
+            shortcut["image_path"]
+            for category in categories
+            for shortcut in category.get("shortcuts", [])
+            if shortcut.get("image_path")
+        ))
+        known = {path: entry[1] for path, entry in self._index.items()}
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="icon-atlas")
+        dispatcher.submit(
+            self._executor, _prepare, str(self.path), paths, known, self.sizes,
+            on_done=lambda tmp_path, error: self._on_prepared(tmp_path, error, on_done)
+        )
+
+    def _on_prepared(self, tmp_path, error, on_done):
+        self._syncing = False
+        if error is not None:
+            print(f"Icon atlas rebuild failed: {error}")
+            return
+        if tmp_path is not None:
+            # Windows kann eine gemappte Datei nicht ersetzen -> erst schließen
+            self.close()
+            try:
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"Icon atlas could not be replaced: {e}")
+            self.open()
+            self.builds += 1
+        if on_done:
+            on_done(tmp_path is not None)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self.close()
+
+
+icon_atlas = IconAtlas()
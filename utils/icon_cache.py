@@ -0,0 +1,220 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import ICONS_DIR
+from utils.config_writer import ConfigWriter
+from utils.dispatch import dispatcher
+from utils.icon_variants import variant_base
+
+MANIFEST_FILE = ICONS_DIR / "manifest.json"
+MANIFEST_VERSION = 1
+
+# Frisch extrahierte Icons sind evtl. noch keinem Shortcut zugewiesen
+GC_GRACE_S = 10 * 60
+
+_SEPARATORS = re.compile(r"[\\/]")
+
+
+def _file_name(path):
+    # Bildpfade aus config.json können von Windows stammen -> beide Trenner
+    return _SEPARATORS.split(path)[-1]
+
+
+def _base_name(name):
+    """Cache file a variant belongs to: "abc@2.png" -> "abc.png"."""
+    stem, ext = os.path.splitext(name)
+    return stem.split("@", 1)[0] + ext
+
+
+class IconCacheStats:
+    __slots__ = ("files", "bytes", "entries", "removed", "freed", "collected_at")
+
+    def __init__(self):
+        self.files = 0
+        self.bytes = 0
+        self.entries = 0
+        self.removed = 0       # beim letzten Aufräumen gelöscht
+        self.freed = 0         # dabei freigegebene Bytes
+        self.collected_at = None
+
+
+class IconCache:
+    """
+    Manifest of the icons extracted into ICONS_DIR.
+    Each source path maps to its cache file plus the size and mtime of the
+    source at extraction time; a cache file is only served while both still
+    match, a changed binary gets a new file name. collect() deletes PNGs that
+    no shortcut references (variants like "name@2.png" live and die with their
+    base file). The manifest is saved through a coalescing background writer.
+    """
+
+    def __init__(self, cache_dir=ICONS_DIR, manifest_file=MANIFEST_FILE):
+        self.cache_dir = str(cache_dir)
+        self.manifest_file = manifest_file
+        self.stats = IconCacheStats()
+        self._entries = None  # source path -> [file name, size, mtime_ns]
+        self._lock = threading.Lock()
+        self._writer = ConfigWriter(save=self._write, name="icon-manifest-writer")
+        self._executor = None
+        self._collecting = False
+        self._waiters = []  # on_done-Callbacks des laufenden Durchlaufs
+
+    def _ensure_loaded(self):
+        # Aufrufer hält self._lock
+        if self._entries is None:
+            try:
+                with open(self.manifest_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                entries = data["entries"] if data.get("version") == MANIFEST_VERSION else {}
+                self._entries = {path: list(entry) for path, entry in entries.items()}
+            except (OSError, ValueError, KeyError, AttributeError, TypeError):
+                self._entries = {}
+        return self._entries
+
+    @staticmethod
+    def file_name_for(source, size, mtime_ns):
+        """Cache file name for one version of source."""
+        key = f"{source}\0{size}\0{mtime_ns}".encode("utf-8")
+        return f"{hashlib.md5(key).hexdigest()}.png"
+
+    def lookup(self, source, st):
+        """Path of the cached icon for source (st: its os.stat result), or None if missing or outdated."""
+        with self._lock:
+            entry = self._ensure_loaded().get(source)
+        if entry is None or entry[1] != st.st_size or entry[2] != st.st_mtime_ns:
+            return None
+        cache_path = os.path.join(self.cache_dir, entry[0])
+        return cache_path if os.path.exists(cache_path) else None
+
+    def record(self, source, st, file_name):
+        """Registers a freshly extracted icon for source."""
+        with self._lock:
+            entries = self._ensure_loaded()
+            entries[source] = [file_name, st.st_size, st.st_mtime_ns]
+            self.stats.entries = len(entries)
+        self._writer.request(entries)
+
+    def collect(self, referenced, now=None):
+        """
+        Deletes cache PNGs that none of the referenced image paths point to
+        and forgets manifest entries whose file is gone. Blocking file I/O:
+        run it on a worker thread. Returns the updated IconCacheStats.
+        """
+        now = time.time() if now is None else now
+        keep = {_file_name(path) for path in referenced if path}
+        # Varianten fremder Bilder heißen nach dem Hash ihres Pfads
+        keep.update(variant_base(path) for path in referenced if path)
+        files = bytes_total = removed = freed = 0
+        present = set()
+        try:
+            scan = os.scandir(self.cache_dir)
+        except OSError:
+            scan = None
+        if scan is not None:
+            with scan:
+                for entry in scan:
+                    if not entry.name.lower().endswith(".png") or not entry.is_file():
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    if (entry.name not in keep and _base_name(entry.name) not in keep
+                            and now - st.st_mtime > GC_GRACE_S):
+                        try:
+                            os.remove(entry.path)
+                        except OSError:
+                            pass
+                        else:
+                            removed += 1
+                            freed += st.st_size
+                            continue
+                    present.add(entry.name)
+                    files += 1
+                    bytes_total += st.st_size
+
+        with self._lock:
+            entries = self._ensure_loaded()
+            stale = [source for source, entry in entries.items() if entry[0] not in present]
+            for source in stale:
+                del entries[source]
+            stats = self.stats
+            stats.files, stats.bytes, stats.entries = files, bytes_total, len(entries)
+            stats.removed, stats.freed, stats.collected_at = removed, freed, now
+        if stale:
+            self._writer.request(entries)
+        return stats
+
+    def collect_async(self, categories, on_done=None):
+        """
+        Runs collect() for the images referenced in categories on a worker
+        thread; on_done(stats) is called on the main thread. While a pass is
+        still running, on_done just waits for that one.
+        """
+        if on_done:
+            self._waiters.append(on_done)
+        if self._collecting:
+            return
+        self._collecting = True
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="icon-gc")
+        dispatcher.submit(
+            self._executor, self.collect, referenced_images(categories),
+            on_done=self._on_collected
+        )
+
+    def _on_collected(self, stats, error):
+        self._collecting = False
+        waiters, self._waiters = self._waiters, []
+        if error is not None:
+            print(f"Icon cache cleanup failed: {error}")
+            return
+        for on_done in waiters:
+            on_done(stats)
+
+    def summary(self):
+        """Short German description of the cache for the settings dialog."""
+        stats = self.stats
+        if stats.collected_at is None:
+            return "Noch nicht geprüft"
+        text = f"{stats.files} Icons · {stats.bytes / (1024 * 1024):.1f} MB · {stats.entries} im Manifest"
+        if stats.removed:
+            text += f"\nZuletzt {stats.removed} ungenutzte entfernt ({stats.freed / 1024:.0f} KB)"
+        return text
+
+    def flush(self):
+        self._writer.flush()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _write(self, entries):
+        with self._lock:
+            snapshot = {"version": MANIFEST_VERSION, "entries": dict(entries)}
+        tmp_path = self.manifest_file.with_name(self.manifest_file.name + ".tmp")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_file)
+
+
+def referenced_images(categories):
+    """All image paths the shortcuts in categories point to."""
+    return [
+        shortcut["image_path"]
+        for category in categories
+        for shortcut in category.get("shortcuts", [])
+        if shortcut.get("image_path")
+    ]
+
+
+icon_cache = IconCache()
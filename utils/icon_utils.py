@@ -1,9 +1,7 @@
 import ctypes
 import sys
 from ctypes import wintypes
-from PIL import Image
 import os
-import hashlib
 from pathlib import Path
 
 # Only define Windows structs if on Windows
@@ -118,6 +116,14 @@ def get_file_icon_path(file_path: str, cache_dir: str) -> str:
     # Import here to avoid circular dependency if possible, or assume it's available
     from utils.system_utils import resolve_lnk_path
     
+    # Eigenes Icon der Verknüpfung (IconLocation), falls es ein Bild ist
+    if path.suffix.lower() == '.lnk':
+        from utils.lnk_parser import read_lnk
+        link = read_lnk(str(path))
+        if link and link.icon_location and Path(link.icon_location).suffix.lower() in ['.png', '.ico']:
+            if os.path.exists(link.icon_location):
+                return link.icon_location
+    
     # Try to resolve LNK to get original file for better icon
     resolved_path = resolve_lnk_path(str(path))
     if resolved_path != str(path):
@@ -128,15 +134,24 @@ def get_file_icon_path(file_path: str, cache_dir: str) -> str:
     if path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.ico']:
         return str(path)
 
-    # Generate hash for cache filename
-    file_hash = hashlib.md5(str(path).encode('utf-8')).hexdigest()
-    cache_path = Path(cache_dir) / f"{file_hash}.png"
-    
-    if cache_path.exists():
-        return str(cache_path)
-        
     if sys.platform != "win32":
+        if sys.platform == "darwin":
+            return None
+        # Linux/BSD: Icon aus .desktop-Datei bzw. Icon-Theme, ohne Extraktion
+        from utils.xdg_icons import icon_for_file
+        return icon_for_file(str(path))
+
+    # Cache-Eintrag gilt nur, solange Größe und mtime des Ziels gleich sind
+    from utils.icon_cache import icon_cache
+    try:
+        st = os.stat(path)
+    except OSError:
         return None
+    cached = icon_cache.lookup(str(path), st)
+    if cached:
+        return cached
+    file_name = icon_cache.file_name_for(str(path), st.st_size, st.st_mtime_ns)
+    cache_path = Path(cache_dir) / file_name
         
     try:
         # Get HICON
@@ -197,6 +212,7 @@ def get_file_icon_path(file_path: str, cache_dir: str) -> str:
         
         # Creating PIL Image
         # BGRA to RGBA
+        from PIL import Image
         image = Image.frombuffer("RGBA", (w, h), buffer, "raw", "BGRA", 0, 1)
         
         # Clean up
@@ -209,10 +225,10 @@ def get_file_icon_path(file_path: str, cache_dir: str) -> str:
         if icon_info.hbmMask: gdi32.DeleteObject(icon_info.hbmMask)
         
         # Save
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir)
+        os.makedirs(cache_dir, exist_ok=True)
             
         image.save(cache_path)
+        icon_cache.record(str(path), st, file_name)
         return str(cache_path)
         
     except Exception as e:
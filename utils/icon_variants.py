@@ -0,0 +1,72 @@
+import hashlib
+import os
+
+from config import ICONS_DIR
+
+# Anzeigegröße der Kachel-Icons (unskaliert), gilt für Kacheln und Varianten
+ICON_SIZE = (40, 40)
+VARIANT_SCALES = (1, 2)
+
+
+def variant_sizes() -> tuple:
+    """Pixel sizes pre-rendered per icon: ICON_SIZE at every entry of VARIANT_SCALES."""
+    return tuple(ICON_SIZE[0] * scale for scale in VARIANT_SCALES)
+
+
+def variant_base(image_path) -> str:
+    """
+    File name in ICONS_DIR the variants of image_path are derived from:
+    extracted icons keep their own name, other images get a hash of their path.
+    """
+    if os.path.normcase(os.path.dirname(image_path)) == os.path.normcase(str(ICONS_DIR)):
+        return os.path.basename(image_path)
+    return hashlib.md5(image_path.encode("utf-8")).hexdigest() + ".png"
+
+
+def variant_path(image_path, px) -> str:
+    """Path of the px x px variant of image_path ("name@40.png")."""
+    stem = os.path.splitext(variant_base(image_path))[0]
+    return os.path.join(str(ICONS_DIR), f"{stem}@{px}.png")
+
+
+def find_variant(image_path, px, source_mtime=None):
+    """
+    Path of an up-to-date px variant of image_path, or None. A variant older
+    than its source (source_mtime in ns) counts as missing.
+    """
+    candidate = variant_path(image_path, px)
+    try:
+        mtime = os.stat(candidate).st_mtime_ns
+    except OSError:
+        return None
+    if source_mtime is not None and mtime < source_mtime:
+        return None
+    return candidate
+
+
+def make_variants(image_path, sizes):
+    """
+    Decodes image_path once and writes every missing or outdated size as a
+    ready-scaled PNG. Blocking: runs on a worker thread. Returns the number
+    of variants written.
+    """
+    from PIL import Image
+
+    try:
+        source_mtime = os.stat(image_path).st_mtime_ns
+    except OSError:
+        return 0
+    missing = [px for px in sizes if find_variant(image_path, px, source_mtime) is None]
+    if not missing:
+        return 0
+
+    os.makedirs(str(ICONS_DIR), exist_ok=True)
+    with Image.open(image_path) as src:
+        src.load()
+        src = src.convert("RGBA")
+        for px in missing:
+            target = variant_path(image_path, px)
+            tmp_path = target + ".tmp"
+            src.resize((px, px), Image.Resampling.LANCZOS).save(tmp_path, format="PNG")
+            os.replace(tmp_path, target)
+    return len(missing)
@@ -0,0 +1,131 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.dispatch import dispatcher
+from utils.icon_utils import get_file_icon_path
+from utils.icon_variants import make_variants, variant_sizes
+
+
+def _init_worker():
+    # SHGetFileInfo needs COM initialized in the calling thread
+    if sys.platform == "win32":
+        import ctypes
+        ctypes.windll.ole32.CoInitialize(None)
+
+
+def _resolve(path, cache_dir, sizes):
+    """Runs on the worker: finds the icon and pre-renders its display sizes."""
+    icon_path = get_file_icon_path(path, cache_dir)
+    if icon_path and sizes:
+        try:
+            make_variants(icon_path, sizes)
+        except Exception as e:
+            # Ohne Varianten skaliert die Kachel selbst
+            print(f"Icon variants failed: {e}")
+    return icon_path
+
+
+def _make_variants(image_path, sizes):
+    try:
+        return make_variants(image_path, sizes)
+    except Exception as e:
+        print(f"Icon variants failed: {e}")
+        return 0
+
+
+class _Batch:
+    __slots__ = ("remaining", "on_icon", "on_complete")
+
+    def __init__(self, remaining, on_icon, on_complete):
+        self.remaining = remaining
+        self.on_icon = on_icon
+        self.on_complete = on_complete
+
+
+class IconResolver:
+    """
+    Resolves file icons on a bounded worker pool.
+    Tiles paint with their emoji first; results are delivered on the Tk main
+    loop through the dispatcher, one completion callback per batch.
+    """
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self._executor = None
+        self._inflight = {}  # path -> [_Batch, ...]
+        self._unresolvable = set()  # Pfade ohne Icon, nicht erneut versuchen
+        self.variant_sizes = variant_sizes()  # vorskalierte Größen
+        self._variants_requested = set()
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="icon",
+                initializer=_init_worker
+            )
+        return self._executor
+
+    def resolve_batch(self, paths, cache_dir, on_icon, on_complete=None):
+        """
+        Resolves icons for paths in the background. on_icon(path, icon_path) is
+        called for every path that yields an icon, on_complete() once after the
+        whole batch; both run on the Tk main thread.
+        """
+        paths = [p for p in dict.fromkeys(paths) if p not in self._unresolvable]
+        if not paths:
+            if on_complete:
+                on_complete()
+            return
+
+        batch = _Batch(len(paths), on_icon, on_complete)
+        for path in paths:
+            waiters = self._inflight.get(path)
+            if waiters is not None:
+                # Wird bereits aufgelöst -> nur auf das Ergebnis warten
+                waiters.append(batch)
+                continue
+            self._inflight[path] = [batch]
+            dispatcher.submit(
+                self._get_executor(), _resolve, path, str(cache_dir), self.variant_sizes,
+                on_done=lambda result, error, p=path: self._on_done(p, result, error)
+            )
+
+    def _on_done(self, path, icon_path, error):
+        if error is not None:
+            print(f"Icon extraction failed: {error}")
+        if not icon_path:
+            self._unresolvable.add(path)
+        else:
+            # Varianten hat der Worker schon erzeugt
+            self._variants_requested.add(icon_path)
+
+        for batch in self._inflight.pop(path, []):
+            if icon_path:
+                try:
+                    batch.on_icon(path, icon_path)
+                except Exception as e:
+                    print(f"Applying icon failed: {e}")
+            batch.remaining -= 1
+            if batch.remaining == 0 and batch.on_complete:
+                batch.on_complete()
+
+    def ensure_variants(self, image_paths):
+        """
+        Pre-renders the display sizes of already resolved icons in the
+        background, once per path and session.
+        """
+        sizes = self.variant_sizes
+        for image_path in dict.fromkeys(image_paths):
+            if image_path in self._variants_requested:
+                continue
+            self._variants_requested.add(image_path)
+            dispatcher.submit(self._get_executor(), _make_variants, image_path, sizes)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+icon_resolver = IconResolver()
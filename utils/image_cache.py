@@ -0,0 +1,123 @@
+import os
+import threading
+from collections import OrderedDict
+
+from utils.icon_variants import find_variant
+
+# Ohne vorskalierte Variante werden Icons einmal in dieser Auflösung dekodiert
+# und dann von CTkImage auf die Anzeigegröße (inkl. DPI-Skalierung) gebracht
+DECODE_SIZE = (64, 64)
+
+
+class ImageCache:
+    """
+    Process-wide LRU cache of decoded, resized icon images.
+    Keyed by (path, mtime, target size, scaling) so edited files are picked up
+    again. The icon atlas (if enabled) is read first, then a pre-scaled
+    variant; both hold the displayed pixel size, so CTkImage does not have to
+    resample.
+    """
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (CTkImage, nbytes)
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self.atlas = None  # optionaler IconAtlas mit vordekodierten Icons
+
+    def get(self, path, size, mtime=None, scale=1.0):
+        """
+        Returns a CTkImage for path at the given display size, or None if unreadable.
+        scale is the widget scaling the image will be shown at.
+        Callers that already know the file's mtime_ns can pass it to skip the stat;
+        icons in the atlas need no stat either.
+        """
+        if mtime is None and self.atlas is not None:
+            mtime = self.atlas.mtime_of(path)
+        if mtime is None:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except (OSError, TypeError, ValueError):
+                return None
+
+        key = (path, mtime, tuple(size), scale)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        try:
+            image, nbytes = self._load(path, size, mtime, scale)
+        except Exception as e:
+            print(f"Error loading image: {e}")
+            return None
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (image, nbytes)
+                self._current_bytes += nbytes
+                self._evict()
+        return image
+
+    def _load(self, path, size, mtime=None, scale=1.0):
+        import customtkinter as ctk
+        from PIL import Image
+
+        pil_img = None
+        px = round(size[0] * scale)
+        if self.atlas is not None:
+            # Vordekodiert in Anzeigegröße -> weder Dateizugriff noch Resampling
+            pil_img = self.atlas.image(path, mtime, px)
+        if pil_img is None:
+            variant = find_variant(path, px, mtime)
+            if variant is not None:
+                # Hat schon die Pixelgröße der Anzeige -> kein Resampling
+                with Image.open(variant) as src:
+                    src.load()
+                    pil_img = src.copy()
+        if pil_img is None:
+            with Image.open(path) as src:
+                src.load()
+                # Resize with high quality filter to prevent pixelation
+                pil_img = src.resize(DECODE_SIZE, Image.Resampling.LANCZOS)
+
+        # Skalierung für HighDPI handled by CTkImage, passing PIL image
+        image = ctk.CTkImage(light_image=pil_img, dark_image=pil_img, size=tuple(size))
+        nbytes = pil_img.width * pil_img.height * len(pil_img.getbands())
+        return image, nbytes
+
+    def _evict(self):
+        while self._current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._current_bytes -= nbytes
+            self.evictions += 1
+
+    def set_budget(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+image_cache = ImageCache()
@@ -0,0 +1,198 @@
+import os
+import subprocess
+import sys
+import time
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.dispatch import dispatcher
+from utils.frecency import frecency
+from utils.xdg_icons import exec_args, parse_desktop_file
+
+
+class LaunchStats:
+    __slots__ = ("count", "last_ms", "total_ms")
+
+    def __init__(self):
+        self.count = 0
+        self.last_ms = 0.0
+        self.total_ms = 0.0
+
+    @property
+    def avg_ms(self):
+        return self.total_ms / self.count if self.count else 0.0
+
+
+class _Child:
+    __slots__ = ("process", "name", "started", "report_exit")
+
+    def __init__(self, process, name, started, report_exit=True):
+        self.process = process
+        self.name = name
+        self.started = started
+        # Nur beim Öffner-Helfer heißt ein Exitcode != 0 "konnte nicht öffnen"
+        self.report_exit = report_exit
+
+
+def _spawn(path, shortcut_type):
+    """
+    Runs on a worker thread. Returns (Popen or None, report_exit, time of
+    spawn); report_exit is False for programs started directly.
+    """
+    process, report_exit = _open(path, shortcut_type)
+    return process, report_exit, time.perf_counter()
+
+
+def _open(path, shortcut_type):
+    if shortcut_type == "url":
+        if not webbrowser.open(path):
+            raise OSError("Kein Browser gefunden")
+        return None, False
+    if sys.platform == "win32":
+        os.startfile(path)
+        return None, False
+
+    if path.lower().endswith(".desktop") and sys.platform != "darwin":
+        process = _open_desktop_entry(path)
+        if process is not False:
+            return process, False
+
+    opener = "open" if sys.platform == "darwin" else "xdg-open"
+    return subprocess.Popen(
+        [opener, path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    ), True
+
+
+def _open_desktop_entry(path):
+    """
+    Starts the Exec= line of a .desktop file directly (xdg-open would only
+    open the file in an editor). Returns False if the entry has nothing to run,
+    otherwise the started program's Popen (None for Link entries). Its later
+    exit code says nothing about whether the launch worked.
+    """
+    entry = parse_desktop_file(path)
+    if entry is None:
+        return False
+    if entry["type"] == "Link" and entry["url"]:
+        if not webbrowser.open(entry["url"]):
+            raise OSError("Kein Browser gefunden")
+        return None
+    args = exec_args(entry["exec"])
+    if not args:
+        return False
+    if entry["terminal"]:
+        args = ["x-terminal-emulator", "-e"] + args
+    # Popen meldet fehlende oder nicht ausführbare Programme selbst als OSError
+    return subprocess.Popen(
+        args,
+        cwd=entry["path"] or None,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+class Launcher:
+    """
+    Starts shortcuts off the UI thread.
+    Started processes are kept in a PID table and reaped from the Tk main
+    loop (non-blocking poll) while any are alive. For the short-lived opener
+    helpers (xdg-open/open) a non-zero exit code means the file could not be
+    opened; programs started directly from a .desktop Exec= line are only
+    reaped, at a slower interval. Click-to-spawn latency is kept per shortcut
+    path; failures go to on_error(message) on the main thread instead of a
+    modal dialog.
+    """
+
+    REAP_INTERVAL_MS = 1000
+    # Direkt gestartete Programme laufen lange, seltener nachsehen
+    PROGRAM_REAP_INTERVAL_MS = 10 * 1000
+
+    def __init__(self, max_workers=2):
+        self.max_workers = max_workers
+        self.on_error = None
+        self.stats = {}     # path -> LaunchStats
+        self.children = {}  # pid -> _Child
+        self._executor = None
+        self._root = None
+        self._reap_job = None
+
+    def attach(self, root):
+        self._root = root
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="launch")
+        return self._executor
+
+    def launch(self, shortcut):
+        """Starts the shortcut in the background. Must be called from the main thread."""
+        clicked = time.perf_counter()
+        path = shortcut.get("path", "")
+        dispatcher.submit(
+            self._get_executor(), _spawn, path, shortcut.get("type", "file"),
+            on_done=lambda result, error: self._on_spawned(shortcut, clicked, result, error)
+        )
+
+    def _on_spawned(self, shortcut, clicked, result, error):
+        if error is not None:
+            self._report(f"Konnte „{shortcut.get('name', '')}“ nicht öffnen: {error}")
+            return
+        process, report_exit, spawned = result
+
+        stats = self.stats.get(shortcut.get("path", ""))
+        if stats is None:
+            stats = self.stats[shortcut.get("path", "")] = LaunchStats()
+        # Klick bis Spawn, gemessen im Worker (ohne den Rückweg zum Mainloop)
+        elapsed_ms = (spawned - clicked) * 1000
+        stats.count += 1
+        stats.last_ms = elapsed_ms
+        stats.total_ms += elapsed_ms
+        frecency.record(shortcut.get("path", ""))
+
+        if process is not None:
+            self.children[process.pid] = _Child(process, shortcut.get("name", ""), time.time(), report_exit)
+            if report_exit and self._reap_job is not None:
+                # Laufender Timer ist evtl. der langsame -> für den Helfer neu planen
+                self._root.after_cancel(self._reap_job)
+                self._reap_job = None
+            self._schedule_reap()
+
+    def _schedule_reap(self):
+        if self._root is not None and self._reap_job is None and self.children:
+            helpers = any(child.report_exit for child in self.children.values())
+            interval = self.REAP_INTERVAL_MS if helpers else self.PROGRAM_REAP_INTERVAL_MS
+            self._reap_job = self._root.after(interval, self._reap)
+
+    def _reap(self):
+        self._reap_job = None
+        for pid, child in list(self.children.items()):
+            returncode = child.process.poll()  # waitpid(WNOHANG), blockiert nicht
+            if returncode is None:
+                continue
+            del self.children[pid]
+            if returncode != 0 and child.report_exit:
+                self._report(f"Konnte „{child.name}“ nicht öffnen (Exitcode {returncode})")
+        self._schedule_reap()
+
+    def _report(self, message):
+        if self.on_error is not None:
+            self.on_error(message)
+        else:
+            print(message)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._root is not None and self._reap_job is not None:
+            self._root.after_cancel(self._reap_job)
+            self._reap_job = None
+
+
+launcher = Launcher()
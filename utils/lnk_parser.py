@@ -0,0 +1,273 @@
+"""
+Pure-Python reader for Windows Shell Link (.lnk) files, following the
+MS-SHLLINK binary format. Extracts target path, arguments, working directory
+and icon location in-process, so resolving a shortcut costs a file read
+instead of a PowerShell start. Works on any platform.
+"""
+
+import ntpath
+import os
+import struct
+import threading
+
+_HEADER = struct.Struct("<I16sIIQQQIiIHH8s")
+_HEADER_SIZE = 0x4C
+_LINK_CLSID = bytes.fromhex("0114020000000000c000000000000046")
+
+# LinkFlags
+HAS_LINK_TARGET_ID_LIST = 0x00000001
+HAS_LINK_INFO = 0x00000002
+HAS_NAME = 0x00000004
+HAS_RELATIVE_PATH = 0x00000008
+HAS_WORKING_DIR = 0x00000010
+HAS_ARGUMENTS = 0x00000020
+HAS_ICON_LOCATION = 0x00000040
+IS_UNICODE = 0x00000080
+FORCE_NO_LINK_INFO = 0x00000100
+
+# LinkInfoFlags
+_VOLUME_ID_AND_LOCAL_BASE_PATH = 0x1
+_COMMON_NETWORK_RELATIVE_LINK = 0x2
+
+# ExtraData-Signaturen
+_ENVIRONMENT_BLOCK = 0xA0000001
+_ICON_ENVIRONMENT_BLOCK = 0xA0000007
+
+# Offset des langen Namens im 0xBEEF0004-Block je Version
+_LONG_NAME_OFFSETS = {3: 0x14, 4: 0x14, 5: 0x14, 6: 0x14, 7: 0x26, 8: 0x2A, 9: 0x2E}
+
+_ANSI = "mbcs" if os.name == "nt" else "cp1252"
+
+
+class LnkError(ValueError):
+    """The file is not a readable shell link."""
+
+
+class ShellLink:
+    __slots__ = ("target", "arguments", "working_dir", "icon_location", "icon_index",
+                 "relative_path", "name", "flags")
+
+    def __init__(self):
+        self.target = None
+        self.arguments = ""
+        self.working_dir = ""
+        self.icon_location = ""
+        self.icon_index = 0
+        self.relative_path = ""
+        self.name = ""
+        self.flags = 0
+
+    def __repr__(self):
+        return f"ShellLink(target={self.target!r}, arguments={self.arguments!r}, icon_location={self.icon_location!r})"
+
+
+def _c_string(data, offset, unicode=False):
+    if offset <= 0 or offset >= len(data):
+        return ""
+    if unicode:
+        end = offset
+        while end + 1 < len(data) and data[end:end + 2] != b"\0\0":
+            end += 2
+        return data[offset:end].decode("utf-16-le", errors="replace")
+    end = data.find(b"\0", offset)
+    if end < 0:
+        end = len(data)
+    return data[offset:end].decode(_ANSI, errors="replace")
+
+
+def _parse_link_info(data):
+    """Target path from a LinkInfo structure (local path or UNC share plus suffix)."""
+    if len(data) < 0x1C:
+        raise LnkError("LinkInfo too short")
+    (header_size, flags, volume_offset, base_offset,
+     network_offset, suffix_offset) = struct.unpack_from("<6I", data, 4)
+    base_unicode = suffix_unicode = 0
+    if header_size >= 0x24 and len(data) >= 0x24:
+        base_unicode, suffix_unicode = struct.unpack_from("<2I", data, 0x1C)
+
+    if suffix_unicode:
+        suffix = _c_string(data, suffix_unicode, unicode=True)
+    else:
+        suffix = _c_string(data, suffix_offset)
+
+    if flags & _VOLUME_ID_AND_LOCAL_BASE_PATH:
+        if base_unicode:
+            base = _c_string(data, base_unicode, unicode=True)
+        else:
+            base = _c_string(data, base_offset)
+        if base:
+            return base + suffix
+
+    if flags & _COMMON_NETWORK_RELATIVE_LINK and network_offset + 0x14 <= len(data):
+        net = data[network_offset:]
+        net_name_offset, device_offset = struct.unpack_from("<2I", net, 8)
+        if net_name_offset > 0x14 and len(net) >= 0x1C:
+            net_name = _c_string(net, struct.unpack_from("<I", net, 0x14)[0], unicode=True)
+        else:
+            net_name = _c_string(net, net_name_offset)
+        if net_name:
+            return ntpath.join(net_name, suffix) if suffix else net_name
+    return None
+
+
+def _parse_id_list(data):
+    """
+    Best-effort path from a LinkTargetIDList: drive item followed by file
+    system items (long names from the 0xBEEF0004 extension block).
+    Returns None for virtual folders (Control Panel, shell: locations, ...).
+    """
+    parts = []
+    pos = 0
+    while pos + 2 <= len(data):
+        size = struct.unpack_from("<H", data, pos)[0]
+        if size == 0:
+            break
+        item = data[pos:pos + size]
+        pos += size
+        if len(item) < 3:
+            continue
+        kind = item[2]
+        if kind == 0x1F:
+            # Stammordner (Arbeitsplatz) - trägt selbst keinen Pfadteil
+            continue
+        if kind & 0x70 == 0x20:
+            drive = item[3:].split(b"\0", 1)[0].decode("ascii", errors="replace")
+            if drive:
+                parts = [drive]
+            continue
+        if kind & 0x70 == 0x30 and len(item) > 14:
+            unicode = bool(kind & 0x04)
+            name = _c_string(item, 14, unicode=unicode)
+            # Langer Name steht im Erweiterungsblock am Ende des Eintrags
+            ext = item.rfind(b"\x04\x00\xef\xbe")
+            if ext >= 4:
+                ext_start = ext - 4
+                ext_size, version = struct.unpack_from("<HH", item, ext_start)
+                name_offset = ext_start + _LONG_NAME_OFFSETS.get(min(version, 9), 0x14)
+                if version >= 3 and name_offset < ext_start + ext_size:
+                    long_name = _c_string(item, name_offset, unicode=True)
+                    if long_name:
+                        name = long_name
+            if not parts or not name:
+                return None
+            parts.append(name)
+            continue
+        return None
+    if not parts:
+        return None
+    return ntpath.join(*parts)
+
+
+def _read_string(data, pos, unicode):
+    if pos + 2 > len(data):
+        raise LnkError("truncated StringData")
+    count = struct.unpack_from("<H", data, pos)[0]
+    pos += 2
+    if unicode:
+        end = pos + count * 2
+        value = data[pos:end].decode("utf-16-le", errors="replace")
+    else:
+        end = pos + count
+        value = data[pos:end].decode(_ANSI, errors="replace")
+    if end > len(data):
+        raise LnkError("truncated StringData")
+    return value, end
+
+
+def _expand(value):
+    # %ProgramFiles% usw. nur unter Windows sinnvoll aufzulösen
+    return os.path.expandvars(value) if os.name == "nt" else value
+
+
+def parse_lnk(data: bytes) -> ShellLink:
+    """Parses the bytes of a .lnk file. Raises LnkError if they are not a shell link."""
+    if len(data) < _HEADER_SIZE:
+        raise LnkError("file too short")
+    (header_size, clsid, flags, _attributes, _created, _accessed, _written,
+     _file_size, icon_index, _show, _hotkey, _r1, _r2) = _HEADER.unpack_from(data, 0)
+    if header_size != _HEADER_SIZE or clsid != _LINK_CLSID:
+        raise LnkError("not a shell link")
+
+    link = ShellLink()
+    link.flags = flags
+    link.icon_index = icon_index
+    pos = _HEADER_SIZE
+
+    id_list_target = None
+    if flags & HAS_LINK_TARGET_ID_LIST:
+        if pos + 2 > len(data):
+            raise LnkError("truncated IDList")
+        id_list_size = struct.unpack_from("<H", data, pos)[0]
+        if pos + 2 + id_list_size > len(data):
+            raise LnkError("truncated IDList")
+        id_list_target = _parse_id_list(data[pos + 2:pos + 2 + id_list_size])
+        pos += 2 + id_list_size
+
+    if flags & HAS_LINK_INFO:
+        if pos + 4 > len(data):
+            raise LnkError("truncated LinkInfo")
+        link_info_size = struct.unpack_from("<I", data, pos)[0]
+        if pos + link_info_size > len(data):
+            raise LnkError("truncated LinkInfo")
+        if not flags & FORCE_NO_LINK_INFO:
+            link.target = _parse_link_info(data[pos:pos + link_info_size])
+        pos += link_info_size
+
+    unicode = bool(flags & IS_UNICODE)
+    for flag, attr in ((HAS_NAME, "name"), (HAS_RELATIVE_PATH, "relative_path"),
+                       (HAS_WORKING_DIR, "working_dir"), (HAS_ARGUMENTS, "arguments"),
+                       (HAS_ICON_LOCATION, "icon_location")):
+        if flags & flag:
+            value, pos = _read_string(data, pos, unicode)
+            setattr(link, attr, value)
+
+    # ExtraData: Pfade mit Umgebungsvariablen (z.B. %ProgramFiles%)
+    env_target = env_icon = None
+    while pos + 8 <= len(data):
+        block_size, signature = struct.unpack_from("<II", data, pos)
+        if block_size < 8:
+            break
+        if signature in (_ENVIRONMENT_BLOCK, _ICON_ENVIRONMENT_BLOCK) and block_size >= 0x314:
+            # TargetUnicode (520 Bytes) bevorzugen, sonst TargetAnsi (260 Bytes)
+            block = data[pos:pos + block_size]
+            value = _c_string(block[:788], 268, unicode=True) or _c_string(block[:268], 8)
+            if signature == _ENVIRONMENT_BLOCK:
+                env_target = value
+            else:
+                env_icon = value
+        pos += block_size
+
+    if not link.target:
+        link.target = _expand(env_target) if env_target else id_list_target
+    if env_icon:
+        link.icon_location = env_icon
+    link.icon_location = _expand(link.icon_location)
+    return link
+
+
+_cache = {}  # path -> (mtime_ns, size, ShellLink or None)
+_cache_lock = threading.Lock()
+
+
+def read_lnk(path):
+    """
+    Parsed ShellLink for the .lnk file at path, or None if it is unreadable.
+    Results are cached per path until the file's mtime or size changes.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    with _cache_lock:
+        cached = _cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    try:
+        with open(path, "rb") as f:
+            link = parse_lnk(f.read())
+    except (OSError, LnkError, struct.error) as e:
+        print(f"Could not parse {path}: {e}")
+        link = None
+    with _cache_lock:
+        _cache[path] = (st.st_mtime_ns, st.st_size, link)
+    return link
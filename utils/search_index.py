@@ -0,0 +1,427 @@
+import heapq
+import re
+import time
+from bisect import bisect_left, insort
+from collections import defaultdict
+from itertools import chain, islice
+from operator import itemgetter
+
+from utils.frecency import frecency
+from utils.fuzzy import fuzzy_score, fuzzy_score_typo, subsequence_matcher, word_boundaries
+
+_WORD_SPLIT = re.compile(r"[^\w]+")
+
+# Treffer nur im Pfad (nicht im Namen) landen hinter allen Namenstreffern
+PATH_ONLY_SCORE = -1000
+# Obergrenze bewerteter Kandidaten je Stufe, damit sehr kurze Anfragen bei
+# großen Katalogen nicht jeden Eintrag bewerten müssen. Gestartete Verknüpfungen
+# und Wortanfang-Treffer werden vorgezogen, der Rest danach
+MAX_SCORED = 400
+MAX_FUZZY_CHECKED = 2000
+MAX_TYPO_SCORED = 100
+# Obergrenze besuchter Einträge beim Durchlaufen sortierter Postings, damit
+# die Arbeit pro Tastendruck nicht mit dem Katalog wächst
+MAX_WALKED = 2000
+# Tippfehler-Suche nur, wenn die Anfrage sonst kaum etwas findet
+TYPO_TRIGGER = 10
+
+
+def _normalize(shortcut) -> str:
+    return f"{shortcut.get('name', '')}\n{shortcut.get('path', '')}".lower()
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _word_prefixes(text):
+    prefixes = set()
+    for word in _WORD_SPLIT.split(text):
+        if word:
+            prefixes.add(word[:1])
+            prefixes.add(word[:2])
+    return prefixes
+
+
+def _name_chars(name):
+    return {ch for ch in name if ch.isalnum()}
+
+
+def _char_mask(text):
+    """Bit set of the alphanumeric characters in text (64 buckets), a cheap pre-filter."""
+    mask = 0
+    for ch in set(text):
+        if ch.isalnum():
+            mask |= 1 << (ord(ch) & 63)
+    return mask
+
+
+def _prefix_key(entry, prefix, sid):
+    # Sortierung der Präfix-Postings: Name beginnt mit dem Präfix, kürzere
+    # Namen (wie bei fuzzy_score), dann Indexreihenfolge
+    return (0 if entry.name.startswith(prefix) else 1, len(entry.name) // 16, entry.seq, sid)
+
+
+def _starts_word(entry, query):
+    """True if a word of the entry's name starts with query."""
+    name = entry.name
+    return any(name.startswith(query, pos) for pos in entry.bounds)
+
+
+class _Entry:
+    """Index entry with the normalized keys cached, so queries never re-lowercase names"""
+
+    __slots__ = ("shortcut", "category", "key", "name", "path", "bounds", "seq", "mask")
+
+    def __init__(self, shortcut, category, seq):
+        self.shortcut = shortcut
+        self.category = category
+        self.seq = seq
+        self.key = _normalize(shortcut)
+        self.name, _, self.path = self.key.partition("\n")
+        self.bounds = word_boundaries(shortcut.get("name", ""))
+        self.mask = _char_mask(self.name)
+
+
+class SearchIndex:
+    """
+    In-memory index over the names and paths of all shortcuts in all categories.
+    Substring hits come from trigram indexes over names and paths (a word-prefix
+    index for queries shorter than 3 characters), fuzzy hits from per-character
+    postings; name hits are ranked with utils.fuzzy plus a frecency boost,
+    path-only hits last.
+    Kept up to date incrementally on add/edit/delete. The word-prefix postings
+    are kept sorted in candidate order, so capped tiers take the best
+    candidates from the front instead of ranking every hit per keystroke.
+
+    The initial build runs in small slices (build_step) so it can be spread
+    over idle time; until it is complete, search falls back to a linear scan.
+    """
+
+    def __init__(self):
+        self.active = False  # Änderungen werden mitgeführt
+        self.ready = False   # alle Einträge indiziert
+        self._categories = []
+        self._entries = {}  # id(shortcut) -> _Entry
+        self._name_grams = defaultdict(set)
+        self._path_grams = defaultdict(set)
+        self._prefixes = defaultdict(list)  # Präfix -> sortierte _prefix_key-Tupel
+        self._chars = defaultdict(set)
+        self._paths = defaultdict(set)  # Pfad -> ids, für gestartete Verknüpfungen
+        self._seq = 0
+        self._pending = []
+        self._pending_pos = 0
+        self._skip = set()
+
+    def start_build(self, categories):
+        """Starts an incremental build; call build_step() until it returns True."""
+        self._categories = categories
+        self._entries.clear()
+        for postings in (self._name_grams, self._path_grams, self._prefixes, self._chars, self._paths):
+            postings.clear()
+        self._skip.clear()
+        self._pending = [(s, c) for c in categories for s in c.get("shortcuts", [])]
+        self._pending_pos = 0
+        self.active = True
+        self.ready = not self._pending
+
+    def build_step(self, budget=0.008) -> bool:
+        """Indexes pending shortcuts for up to budget seconds. Returns True when done."""
+        deadline = time.perf_counter() + budget
+        pending = self._pending
+        while self._pending_pos < len(pending):
+            shortcut, category = pending[self._pending_pos]
+            self._pending_pos += 1
+            sid = id(shortcut)
+            if sid not in self._entries and sid not in self._skip:
+                self._add_entry(shortcut, category)
+            if self._pending_pos % 64 == 0 and time.perf_counter() > deadline:
+                return False
+        self._pending = []
+        self._skip.clear()
+        # Während des Aufbaus wurde nur angehängt, einmal sortieren statt einzeln einfügen
+        for keys in self._prefixes.values():
+            keys.sort()
+        self.ready = True
+        return True
+
+    def rebuild(self, categories):
+        """Builds the whole index synchronously."""
+        self.start_build(categories)
+        while not self.build_step(budget=3600):
+            pass
+
+    def add(self, shortcut, category):
+        if self.active:
+            self._add_entry(shortcut, category)
+
+    def remove(self, shortcut):
+        if not self.active:
+            return
+        if not self.ready:
+            # Noch nicht verarbeiteter Eintrag darf später nicht mehr auftauchen
+            self._skip.add(id(shortcut))
+        entry = self._entries.pop(id(shortcut), None)
+        if entry is not None:
+            self._unindex(id(shortcut), entry)
+
+    def update(self, shortcut):
+        """Re-indexes a shortcut after its name or path changed."""
+        old = self._entries.get(id(shortcut))
+        if old is None:
+            return
+        if _normalize(shortcut) == old.key:
+            return
+        self._unindex(id(shortcut), old)
+        # Ursprüngliche Reihenfolge beibehalten
+        entry = _Entry(shortcut, old.category, old.seq)
+        self._entries[id(shortcut)] = entry
+        self._index(id(shortcut), entry)
+
+    def remove_category(self, category):
+        for shortcut in category.get("shortcuts", []):
+            self.remove(shortcut)
+
+    def category_of(self, shortcut):
+        entry = self._entries.get(id(shortcut))
+        if entry is not None:
+            return entry.category
+        for category in self._categories:
+            if any(s is shortcut for s in category.get("shortcuts", [])):
+                return category
+        return None
+
+    def search(self, query, limit=200):
+        """Returns up to limit (shortcut, category) pairs matching query, best match first."""
+        query = " ".join(query.lower().split())
+        if not query:
+            return []
+
+        if not self.ready:
+            entries = (_Entry(s, c, 0) for c in self._categories for s in c.get("shortcuts", []))
+            scored = self._score_all(query, entries)
+        else:
+            scored = self._score_indexed(query, limit)
+
+        # Häufig und kürzlich gestartete Verknüpfungen rutschen nach oben
+        boost = frecency.search_boost
+        launched = frecency.launched_paths()
+
+        def rank(item):
+            path = item[1].shortcut.get("path")
+            return (item[0] + boost(path) if path in launched else item[0], -item[1].seq)
+
+        best = heapq.nlargest(limit, scored, key=rank)
+        return [(entry.shortcut, entry.category) for _, entry in best]
+
+    def _launched(self):
+        """Entries of launched shortcuts (they get the frecency boost)."""
+        entries = self._entries
+        for path in frecency.launched_paths():
+            for sid in self._paths.get(path, ()):
+                yield sid, entries[sid]
+
+    def _substring_candidates(self, query, cap):
+        """
+        Candidates for queries of 3+ characters in scoring order: launched
+        shortcuts containing query (on top of cap), names with a word starting
+        with query from the front of the sorted prefix postings, and only if
+        those don't fill cap within 2 * cap steps, the rest from the trigram
+        index.
+        """
+        entries = self._entries
+        grams = _trigrams(query)
+        selected = dict.fromkeys(sid for sid, entry in self._launched() if query in entry.name)
+        wanted = len(selected) + cap
+        hits = None
+        if min(len(self._name_grams.get(gram, ())) for gram in grams) <= MAX_WALKED:
+            # Seltenes Trigramm: die Schnittmenge ist billig und oft schon klein genug
+            hits = self._intersect(self._name_grams, grams)
+            if len(hits) <= cap:
+                selected.update(dict.fromkeys(hits))
+                return [entries[sid] for sid in selected]
+        # Wortanfänge kommen aus dem Präfix-Index (erste 1-2 Zeichen eines Worts)
+        for key in self._prefixes.get(query[:2], ())[:2 * cap]:
+            sid = key[3]
+            entry = entries[sid]
+            if (hits is None or sid in hits) and query in entry.name and _starts_word(entry, query):
+                selected.setdefault(sid)
+                if len(selected) >= wanted:
+                    return [entries[sid] for sid in selected]
+        if hits is None:
+            hits = self._intersect(self._name_grams, grams)
+        for sid in hits:
+            if sid not in selected:
+                selected[sid] = None
+                if len(selected) >= wanted:
+                    break
+        return [entries[sid] for sid in selected]
+
+    def _prefix_candidates(self, prefix, cap):
+        """
+        Candidates for queries shorter than a trigram: launched shortcuts
+        containing prefix, then the first cap entries of its sorted postings.
+        """
+        selected = dict.fromkeys(sid for sid, entry in self._launched() if prefix in entry.name)
+        for key in self._prefixes.get(prefix, ())[:cap]:
+            selected.setdefault(key[3])
+        return [self._entries[sid] for sid in selected]
+
+    def _walk(self, query, chars, matched, accept):
+        """
+        Unmatched entries for the fuzzy tiers whose character mask passes
+        accept, best candidates first: launched shortcuts, names with a word
+        starting like query, then the postings of the rarest query characters
+        (every candidate contains at least one of them). Visits at most
+        MAX_WALKED entries.
+        """
+        entries = self._entries
+        seen = set(matched)
+        rare = sorted(chars, key=lambda ch: len(self._chars.get(ch, ())))[:2]
+        sids = chain(
+            (sid for sid, _ in self._launched()),
+            map(itemgetter(3), self._prefixes.get(query[:1], ())),
+            *(self._chars.get(ch, ()) for ch in rare)
+        )
+        for sid in islice(sids, MAX_WALKED):
+            if sid not in seen:
+                seen.add(sid)
+                entry = entries[sid]
+                if accept(entry.mask):
+                    yield sid, entry
+
+    def _score_indexed(self, query, limit):
+        scored = []
+
+        # 1. Teilstring im Namen; Wortanfänge vor Treffern mitten im Wort
+        if len(query) >= 3:
+            candidates = self._substring_candidates(query, MAX_SCORED)
+        else:
+            candidates = self._prefix_candidates(query, MAX_SCORED)
+        matched = set()
+        for entry in candidates:
+            if query in entry.name:
+                scored.append((fuzzy_score(query, entry.name, entry.bounds), entry))
+                matched.add(id(entry.shortcut))
+
+        if len(scored) >= limit:
+            return scored
+
+        # 2. Unscharfe Treffer: alle Zeichen der Anfrage kommen im Namen vor
+        chars = {ch for ch in query if ch.isalnum()}
+        qmask = _char_mask(query)
+        if len(query) >= 2 and chars:
+            # Erst die billige Teilfolgen-Prüfung, bewertet werden nur Treffer
+            is_subsequence = subsequence_matcher(query)
+            budget = MAX_FUZZY_CHECKED
+            found = 0
+            for sid, entry in self._walk(query, chars, matched, lambda mask: mask & qmask == qmask):
+                score = fuzzy_score(query, entry.name, entry.bounds) if is_subsequence(entry.name) else None
+                if score is not None:
+                    scored.append((score, entry))
+                    matched.add(sid)
+                    found += 1
+                budget -= 1
+                if budget <= 0 or found >= MAX_SCORED:
+                    break
+
+        # 3. Tippfehler: ein Zeichen der Anfrage darf fehlen oder falsch sein
+        if len(query) >= 4 and len(scored) < TYPO_TRIGGER and chars:
+            def one_missing(mask):
+                missing = qmask & ~mask
+                return missing & (missing - 1) == 0
+
+            budget = MAX_TYPO_SCORED
+            for sid, entry in self._walk(query, chars, matched, one_missing):
+                score = fuzzy_score_typo(query, entry.name, entry.bounds)
+                matched.add(sid)
+                if score is not None:
+                    scored.append((score, entry))
+                budget -= 1
+                if budget <= 0:
+                    break
+
+        # 4. Nur im Pfad enthalten - gleichwertig, daher reicht das Auffüllen
+        if len(query) >= 3 and len(scored) < limit:
+            for sid in self._intersect(self._path_grams, _trigrams(query)) - matched:
+                entry = self._entries[sid]
+                if query in entry.path:
+                    scored.append((PATH_ONLY_SCORE, entry))
+                    if len(scored) >= limit:
+                        break
+
+        return scored
+
+    def _score_all(self, query, entries):
+        scored = []
+        for entry in entries:
+            score = fuzzy_score(query, entry.name, entry.bounds)
+            if score is None and query in entry.key:
+                score = PATH_ONLY_SCORE
+            if score is not None:
+                scored.append((score, entry))
+        return scored
+
+    @staticmethod
+    def _intersect(postings, keys):
+        sets = []
+        for key in keys:
+            ids = postings.get(key)
+            if not ids:
+                return set()
+            sets.append(ids)
+        if not sets:
+            return set()
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def _add_entry(self, shortcut, category):
+        self._seq += 1
+        entry = _Entry(shortcut, category, self._seq)
+        self._entries[id(shortcut)] = entry
+        self._index(id(shortcut), entry)
+
+    def _index(self, sid, entry):
+        for postings, grams in self._postings_for(entry):
+            for gram in grams:
+                postings[gram].add(sid)
+        for prefix in _word_prefixes(entry.name):
+            if self.ready:
+                insort(self._prefixes[prefix], _prefix_key(entry, prefix, sid))
+            else:
+                self._prefixes[prefix].append(_prefix_key(entry, prefix, sid))
+
+    def _unindex(self, sid, entry):
+        for postings, grams in self._postings_for(entry):
+            for gram in grams:
+                ids = postings.get(gram)
+                if ids is not None:
+                    ids.discard(sid)
+                    if not ids:
+                        del postings[gram]
+        for prefix in _word_prefixes(entry.name):
+            keys = self._prefixes.get(prefix)
+            if keys is None:
+                continue
+            key = _prefix_key(entry, prefix, sid)
+            if not self.ready:
+                # Noch unsortiert (Aufbau läuft)
+                if key in keys:
+                    keys.remove(key)
+            else:
+                pos = bisect_left(keys, key)
+                if pos < len(keys) and keys[pos] == key:
+                    del keys[pos]
+            if not keys:
+                del self._prefixes[prefix]
+
+    def _postings_for(self, entry):
+        return (
+            (self._name_grams, _trigrams(entry.name)),
+            (self._path_grams, _trigrams(entry.path)),
+            (self._chars, _name_chars(entry.name)),
+            (self._paths, (entry.shortcut.get("path") or "",)),
+        )
+
+
+search_index = SearchIndex()
@@ -0,0 +1,126 @@
+def _ring(r):
+    """Lattice offsets at Chebyshev distance r, walking only the ring's border."""
+    if r == 0:
+        return [(0, 0)]
+    border = [(d, -r) for d in range(-r, r + 1)] + [(d, r) for d in range(-r, r + 1)]
+    border += [(-r, d) for d in range(-r + 1, r)] + [(r, d) for d in range(-r + 1, r)]
+    return border
+
+
+def _outside(gx, gy, r, max_gx, max_gy):
+    if gx + r < 0 or gy + r < 0:
+        return True
+    if max_gx is None:
+        return False
+    # Ring umschließt die ganze Fläche
+    return gx - r < 0 and gy - r < 0 and gx + r > max_gx and gy + r > max_gy
+
+
+class SpatialHash:
+    """
+    Uniform grid over axis-aligned rectangles (x, y, w, h), keyed by any
+    hashable. With cell_size at least the usual rectangle size every rectangle
+    touches at most four cells, so insert, move, remove and collision checks
+    are O(1) regardless of how many rectangles there are.
+    """
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self._rects = {}  # key -> (x, y, w, h)
+        self._cells = {}  # (cx, cy) -> set(keys)
+
+    def __len__(self):
+        return len(self._rects)
+
+    def __contains__(self, key):
+        return key in self._rects
+
+    def clear(self):
+        self._rects.clear()
+        self._cells.clear()
+
+    def rect(self, key):
+        return self._rects.get(key)
+
+    def _cells_for(self, x, y, w, h):
+        size = self.cell_size
+        x0, y0 = int(x // size), int(y // size)
+        # Rechte/untere Kante gehört nicht mehr zum Rechteck
+        x1, y1 = int((x + w - 1) // size), int((y + h - 1) // size)
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def insert(self, key, x, y, w, h):
+        """Adds or moves the rectangle for key."""
+        if key in self._rects:
+            self.remove(key)
+        self._rects[key] = (x, y, w, h)
+        for cell in self._cells_for(x, y, w, h):
+            self._cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key):
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return
+        for cell in self._cells_for(*rect):
+            keys = self._cells.get(cell)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._cells[cell]
+
+    def query(self, x, y, w, h, exclude=None):
+        """Keys whose rectangles overlap (x, y, w, h)."""
+        hits = set()
+        for cell in self._cells_for(x, y, w, h):
+            for key in self._cells.get(cell, ()):
+                if key == exclude or key in hits:
+                    continue
+                ox, oy, ow, oh = self._rects[key]
+                if x < ox + ow and ox < x + w and y < oy + oh and oy < y + h:
+                    hits.add(key)
+        return hits
+
+    def collides(self, x, y, w, h, exclude=None) -> bool:
+        for cell in self._cells_for(x, y, w, h):
+            for key in self._cells.get(cell, ()):
+                if key == exclude:
+                    continue
+                ox, oy, ow, oh = self._rects[key]
+                if x < ox + ow and ox < x + w and y < oy + oh and oy < y + h:
+                    return True
+        return False
+
+    def nearest_free(self, x, y, w, h, step, bounds=None, origin=(0, 0), exclude=None, max_rings=64):
+        """
+        Free position for a w x h rectangle closest to (x, y), searched ring by
+        ring on a lattice of step pixels anchored at origin. bounds is
+        (width, height) of the area the rectangle has to stay in. Returns
+        (x, y), or None if nothing is free within max_rings.
+        """
+        ox, oy = origin
+        # Nächster Gitterpunkt als Mitte der Suche
+        gx = round((x - ox) / step)
+        gy = round((y - oy) / step)
+        max_gx = max_gy = None
+        if bounds is not None:
+            max_gx = int((bounds[0] - w - ox) // step)
+            max_gy = int((bounds[1] - h - oy) // step)
+
+        for ring in range(max_rings + 1):
+            candidates = []
+            for dx, dy in _ring(ring):
+                cx, cy = gx + dx, gy + dy
+                if cx < 0 or cy < 0:
+                    continue
+                if max_gx is not None and (cx > max_gx or cy > max_gy):
+                    continue
+                px, py = ox + cx * step, oy + cy * step
+                candidates.append(((px - x) ** 2 + (py - y) ** 2, py, px))
+            if not candidates and ring > 0 and _outside(gx, gy, ring, max_gx, max_gy):
+                # Ring liegt komplett außerhalb der Fläche -> alle weiteren auch
+                break
+            # Innerhalb eines Rings den wirklich nächsten Platz zuerst
+            for _, py, px in sorted(candidates):
+                if not self.collides(px, py, w, h, exclude=exclude):
+                    return px, py
+        return None
@@ -0,0 +1,41 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupTrace:
+    """
+    Records wall time per startup phase (imports, tkdnd, config, tabs, ...).
+    Dumped automatically after first paint when QUICKLAUNCH_TRACE is set,
+    otherwise on demand (Ctrl+Shift+T in the main window).
+    """
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.phases = []  # (Name, Start, Dauer) in Sekunden relativ zu t0
+        self.enabled = bool(os.environ.get("QUICKLAUNCH_TRACE"))
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start - self.t0, time.perf_counter() - start))
+
+    def mark(self, name):
+        """Records a point in time (e.g. first paint) as a phase of length 0."""
+        self.phases.append((name, time.perf_counter() - self.t0, 0.0))
+
+    def format(self) -> str:
+        lines = [f"{'Phase':<24} {'Start (ms)':>10} {'Dauer (ms)':>10}"]
+        for name, start, duration in self.phases:
+            lines.append(f"{name:<24} {start * 1000:>10.1f} {duration * 1000:>10.1f}")
+        return "\n".join(lines)
+
+    def dump(self, file=None):
+        print(self.format(), file=file or sys.stderr)
+
+
+startup_trace = StartupTrace()
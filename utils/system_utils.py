@@ -1,8 +1,12 @@
-import psutil
 import sys
 import os
+import subprocess
+import threading
+import time
 from pathlib import Path
 
+from utils.lnk_parser import read_lnk
+
 # Conditional import for winreg
 if sys.platform == 'win32':
     import winreg
@@ -10,12 +14,68 @@ if sys.platform == 'win32':
 def get_system_stats():
     """Returns a tuple (cpu_percent, ram_percent)"""
     try:
+        # Erst beim ersten Aufruf laden, hält den Programmstart schlank
+        import psutil
         cpu = psutil.cpu_percent(interval=None)
         ram = psutil.virtual_memory().percent
         return cpu, ram
     except Exception:
         return 0, 0
 
+def is_on_battery() -> bool:
+    """True if the machine reports running on battery power"""
+    try:
+        import psutil
+        battery = psutil.sensors_battery()
+    except Exception:
+        return False
+    return battery is not None and not battery.power_plugged
+
+class SystemStatsSampler:
+    """
+    Samples CPU/RAM on a background thread and publishes the latest snapshot.
+    Readers on the Tk thread only read an attribute, they never call psutil.
+    """
+
+    BATTERY_CHECK_INTERVAL = 30.0
+
+    def __init__(self, interval=1.0):
+        self.interval = interval  # darf jederzeit geändert werden
+        self.snapshot = (0, 0)  # (cpu_percent, ram_percent), wird nur ersetzt
+        self.on_battery = False
+        self.samples = 0
+        self._stop = None
+
+    def start(self):
+        if self._stop is not None:
+            return
+        # Eigenes Event je Thread, damit stop()+start() keinen zweiten Thread weiterlaufen lässt
+        self._stop = threading.Event()
+        threading.Thread(target=self._run, args=(self._stop,), name="stats-sampler", daemon=True).start()
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+    @property
+    def running(self) -> bool:
+        return self._stop is not None
+
+    def _run(self, stop):
+        last_battery_check = None
+        while not stop.is_set():
+            self.snapshot = get_system_stats()
+            self.samples += 1
+            
+            now = time.monotonic()
+            if last_battery_check is None or now - last_battery_check >= self.BATTERY_CHECK_INTERVAL:
+                self.on_battery = is_on_battery()
+                last_battery_check = now
+            stop.wait(self.interval)
+
+stats_sampler = SystemStatsSampler()
+
 def set_autostart(enable: bool, app_name="QuickLaunch"):
     """
     Sets or removes the autostart registry key for the current application.
@@ -79,12 +139,20 @@ def check_autostart(app_name="QuickLaunch") -> bool:
 
 def resolve_lnk_path(lnk_path):
     """
-    Resolves the target of a Windows Shortcut (.lnk) file methods.
-    Uses PowerShell to avoid extra dependencies like pywin32.
+    Resolves the target of a Windows Shortcut (.lnk) file.
+    Parses the link in-process (utils.lnk_parser, cached by mtime); only links
+    without a readable target (e.g. advertised MSI shortcuts) fall back to
+    PowerShell on Windows.
     """
     path = Path(lnk_path)
-    if not path.exists() or path.suffix.lower() != '.lnk':
+    if path.suffix.lower() != '.lnk':
+        return str(path)
+    
+    link = read_lnk(str(path))
+    if link is None:
         return str(path)
+    if link.target:
+        return link.target if os.path.exists(link.target) else str(path)
         
     if sys.platform != 'win32':
         return str(path)
@@ -95,8 +163,6 @@ def resolve_lnk_path(lnk_path):
         startupinfo = subprocess.STARTUPINFO()
         startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
         
-        # Use subprocess.check_output
-        import subprocess
         result = subprocess.check_output(cmd, startupinfo=startupinfo, text=True, shell=False)
         target = result.strip()
         
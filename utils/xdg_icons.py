@@ -0,0 +1,365 @@
+"""
+Freedesktop icon support for Linux.
+Parses .desktop files (Name, Exec, Icon) and resolves icon names through the
+XDG icon theme directories. The theme directories are walked once into a
+name -> file index that is cached on disk and re-validated by directory
+mtimes, so a lookup is a dict hit instead of a directory walk.
+"""
+
+import json
+import mimetypes
+import os
+import re
+import shlex
+import threading
+from pathlib import Path
+
+from config import ICONS_DIR
+from utils.image_cache import DECODE_SIZE
+
+INDEX_VERSION = 1
+FALLBACK_THEME = "hicolor"
+
+# PIL kann keine SVGs lesen -> nur Rastergrafiken indizieren
+LOADABLE_SUFFIXES = (".png", ".xpm")
+_SUFFIX_RANK = {".png": 0, ".xpm": 1}
+PREFERRED_SIZE = DECODE_SIZE[0]
+
+_SIZE_DIR = re.compile(r"^(\d+)(?:x\d+)?(?:@(\d+))?$")
+_FIELD_CODE = re.compile(r"%[a-zA-Z]")
+
+
+def _data_dirs():
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    data_dirs = os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share"
+    return [data_home] + [d for d in data_dirs.split(":") if d]
+
+
+def icon_base_dirs(data_dirs=None):
+    """Icon theme base directories in lookup order (spec: ~/.icons, $XDG_DATA_DIRS/icons)."""
+    bases = []
+    if data_dirs is None:
+        bases.append(os.path.expanduser("~/.icons"))
+        data_dirs = _data_dirs()
+    bases += [os.path.join(d, "icons") for d in data_dirs]
+    return list(dict.fromkeys(bases))
+
+
+def pixmap_dirs(data_dirs=None):
+    data_dirs = _data_dirs() if data_dirs is None else data_dirs
+    return list(dict.fromkeys(os.path.join(d, "pixmaps") for d in data_dirs))
+
+
+def current_theme():
+    """Name of the configured GTK icon theme, or None."""
+    theme = os.environ.get("QUICKLAUNCH_ICON_THEME")
+    if theme:
+        return theme
+    for settings in ("~/.config/gtk-4.0/settings.ini", "~/.config/gtk-3.0/settings.ini"):
+        try:
+            with open(os.path.expanduser(settings), encoding="utf-8") as f:
+                for line in f:
+                    key, _, value = line.partition("=")
+                    if key.strip() == "gtk-icon-theme-name" and value.strip():
+                        return value.strip().strip('"')
+        except OSError:
+            continue
+    return None
+
+
+def _read_ini_group(path, group):
+    """Key/value pairs of one [group] of a desktop-entry style file."""
+    values = {}
+    in_group = False
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("["):
+                if in_group:
+                    break
+                in_group = line == f"[{group}]"
+                continue
+            if in_group:
+                key, sep, value = line.partition("=")
+                if sep:
+                    values.setdefault(key.strip(), value.strip())
+    return values
+
+
+def _theme_chain(bases, theme):
+    """The theme followed by everything it inherits from, hicolor last."""
+    chain = []
+    pending = [theme] if theme else []
+    while pending:
+        name = pending.pop(0)
+        if name in chain or name == FALLBACK_THEME:
+            continue
+        chain.append(name)
+        for base in bases:
+            index_file = os.path.join(base, name, "index.theme")
+            try:
+                inherits = _read_ini_group(index_file, "Icon Theme").get("Inherits", "")
+            except OSError:
+                continue
+            pending.extend(t.strip() for t in inherits.split(",") if t.strip())
+            break
+    chain.append(FALLBACK_THEME)
+    return chain
+
+
+def _size_rank(parts):
+    """Sort key for an icon's size directory: closest to PREFERRED_SIZE, upscaling last."""
+    for part in parts:
+        match = _SIZE_DIR.match(part)
+        if match:
+            size = int(match.group(1)) * int(match.group(2) or 1)
+            return (0 if size >= PREFERRED_SIZE else 1, abs(size - PREFERRED_SIZE))
+    # "scalable", "symbolic" oder flache Themes ohne Größenangabe
+    return (2, 0)
+
+
+class IconThemeIndex:
+    """
+    Maps icon names to the best raster file across the configured theme, its
+    Inherits chain, hicolor and the pixmaps directories.
+    The index is built on first use and saved to cache_file together with the
+    mtimes of every directory that was walked; as long as none of them changed,
+    later runs load the file instead of walking the themes again.
+    Thread-safe: lookups come from the icon worker pool.
+    """
+
+    def __init__(self, cache_file, data_dirs=None, theme=None):
+        self.cache_file = Path(cache_file)
+        self.data_dirs = data_dirs
+        self.theme = theme
+        self.builds = 0
+        self.loaded_from_cache = False
+        self._icons = None  # name -> path
+        self._lock = threading.Lock()
+
+    def lookup(self, name):
+        """Path of the icon file for an icon name (or an absolute path), or None."""
+        if not name:
+            return None
+        if os.path.isabs(name):
+            return name if name.lower().endswith(LOADABLE_SUFFIXES) and os.path.isfile(name) else None
+        icons = self._icons
+        if icons is None:
+            icons = self._ensure_loaded()
+        path = icons.get(name)
+        if path is None:
+            # Manche .desktop-Dateien geben "name.png" statt des Icon-Namens an
+            stem, ext = os.path.splitext(name)
+            if ext.lower() in _SUFFIX_RANK or ext.lower() == ".svg":
+                path = icons.get(stem)
+        return path
+
+    def __len__(self):
+        return len(self._ensure_loaded())
+
+    def invalidate(self):
+        with self._lock:
+            self._icons = None
+
+    def _ensure_loaded(self):
+        with self._lock:
+            if self._icons is None:
+                chain = _theme_chain(icon_base_dirs(self.data_dirs), self.theme or current_theme())
+                icons = self._load_cache(chain)
+                self.loaded_from_cache = icons is not None
+                if icons is None:
+                    icons, dir_mtimes = self._build(chain)
+                    self._save_cache(chain, dir_mtimes, icons)
+                self._icons = icons
+            return self._icons
+
+    def _build(self, chain):
+        self.builds += 1
+        best = {}         # name -> (rank, path)
+        dir_mtimes = {}   # jedes besuchte Verzeichnis, für die Cache-Prüfung
+
+        def visit(directory):
+            try:
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+                return os.scandir(directory)
+            except OSError:
+                # Nicht vorhanden: merken, damit ein späteres Anlegen erkannt wird
+                dir_mtimes[directory] = None
+                return None
+
+        def offer(name, rank, path):
+            current = best.get(name)
+            if current is None or rank < current[0]:
+                best[name] = (rank, path)
+
+        bases = icon_base_dirs(self.data_dirs)
+        for base in bases:
+            visit(base)
+        for theme_rank, theme in enumerate(chain):
+            for base in bases:
+                root = os.path.join(base, theme)
+                stack = [(root, ())]
+                while stack:
+                    directory, parts = stack.pop()
+                    entries = visit(directory)
+                    if entries is None:
+                        continue
+                    with entries:
+                        for entry in entries:
+                            if entry.is_dir():
+                                stack.append((entry.path, parts + (entry.name,)))
+                                continue
+                            stem, ext = os.path.splitext(entry.name)
+                            ext = ext.lower()
+                            if ext in _SUFFIX_RANK:
+                                offer(stem, (theme_rank, _size_rank(parts), _SUFFIX_RANK[ext]), entry.path)
+
+        pixmap_rank = len(chain)
+        for directory in pixmap_dirs(self.data_dirs):
+            entries = visit(directory)
+            if entries is None:
+                continue
+            with entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    ext = ext.lower()
+                    if ext in _SUFFIX_RANK and entry.is_file():
+                        offer(stem, (pixmap_rank, (2, 0), _SUFFIX_RANK[ext]), entry.path)
+
+        return {name: path for name, (_, path) in best.items()}, dir_mtimes
+
+    def _load_cache(self, chain):
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION or data.get("themes") != chain:
+            return None
+        for directory, mtime in data.get("dirs", {}).items():
+            try:
+                current = os.stat(directory).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime:
+                return None
+        icons = data.get("icons")
+        return icons if isinstance(icons, dict) else None
+
+    def _save_cache(self, chain, dir_mtimes, icons):
+        data = {"version": INDEX_VERSION, "themes": chain, "dirs": dir_mtimes, "icons": icons}
+        tmp = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, self.cache_file)
+        except OSError as e:
+            print(f"Icon index could not be saved: {e}")
+
+
+_desktop_cache = {}  # path -> (mtime_ns, entry)
+_desktop_lock = threading.Lock()
+
+
+def _locale_keys(key):
+    lang = os.environ.get("LC_ALL") or os.environ.get("LC_MESSAGES") or os.environ.get("LANG") or ""
+    lang = lang.split(".")[0].split("@")[0]
+    keys = []
+    if lang and lang not in ("C", "POSIX"):
+        keys.append(f"{key}[{lang}]")
+        if "_" in lang:
+            keys.append(f"{key}[{lang.split('_')[0]}]")
+    keys.append(key)
+    return keys
+
+
+def parse_desktop_file(path):
+    """
+    Reads the [Desktop Entry] group of a .desktop file.
+    Returns a dict with name, exec, icon, type, url, path and terminal, or None
+    if the file is unreadable. Results are cached per path and mtime.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    with _desktop_lock:
+        cached = _desktop_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        values = _read_ini_group(path, "Desktop Entry")
+    except OSError:
+        return None
+
+    def first(key):
+        for k in _locale_keys(key):
+            if values.get(k):
+                return values[k]
+        return ""
+
+    entry = {
+        "name": first("Name"),
+        "exec": values.get("Exec", ""),
+        "icon": values.get("Icon", ""),
+        "type": values.get("Type", "Application"),
+        "url": values.get("URL", ""),
+        "path": values.get("Path", ""),
+        "terminal": values.get("Terminal", "").lower() == "true",
+    }
+    with _desktop_lock:
+        _desktop_cache[path] = (mtime, entry)
+    return entry
+
+
+def exec_args(exec_line):
+    """Splits an Exec= line into argv with all field codes (%f, %U, ...) removed."""
+    try:
+        args = shlex.split(exec_line)
+    except ValueError:
+        return []
+    result = []
+    for arg in args:
+        if _FIELD_CODE.fullmatch(arg):
+            continue
+        arg = _FIELD_CODE.sub("", arg.replace("%%", "\0")).replace("\0", "%")
+        if arg:
+            result.append(arg)
+    return result
+
+
+def _mime_icon_names(path):
+    if os.path.isdir(path):
+        return ["folder"]
+    names = []
+    mime, _ = mimetypes.guess_type(path)
+    if mime:
+        major = mime.split("/")[0]
+        names.append(mime.replace("/", "-"))
+        names.append(f"{major}-x-generic")
+    if os.access(path, os.X_OK):
+        names.append("application-x-executable")
+    return names
+
+
+def icon_for_file(path):
+    """Theme icon for a file: the Icon= of a .desktop file, else a mimetype icon."""
+    if path.lower().endswith(".desktop"):
+        entry = parse_desktop_file(path)
+        if entry and entry["icon"]:
+            icon = icon_index.lookup(entry["icon"])
+            if icon:
+                return icon
+        return icon_index.lookup("application-x-executable")
+    for name in _mime_icon_names(path):
+        icon = icon_index.lookup(name)
+        if icon:
+            return icon
+    return None
+
+
+icon_index = IconThemeIndex(ICONS_DIR / "xdg_icon_index.json")